@@ -1,14 +1,48 @@
 # flake8: noqa: F401
 
-import matplotlib.patches as patches
+import importlib as _importlib
+import typing as _t
 
-from . import analysis, styles
 from .__config__ import __version__
-from .core import ax, axs, close, figure, figure_class, show, subplot, subplots
+from .core import ax, axs, close, figure, figure_class, open_array, show, subplot, subplots
 from .core.axes_class import AAxes as Axes
 from .core.axes_list import AxesList
 from .core.figure_class import AFigure as Figure
+from .core.figure_pool import FigurePool
+from .core.histogram import Histogram2D
+from .core.profiling import profile
+from .core.render_cache import RenderCache, get_render_cache, set_render_cache
+
+if _t.TYPE_CHECKING:
+    import matplotlib.patches as patches
+
+    from . import analysis, animation, batch, styles, testing
+
+    s = styles
+
+# Modules loaded on first access to keep `import aplot` fast.
+_LAZY_MODULES = {
+    "analysis": ".analysis",
+    "animation": ".animation",
+    "batch": ".batch",
+    "styles": ".styles",
+    "testing": ".testing",
+    "s": ".styles",
+    "patches": "matplotlib.patches",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        path = _LAZY_MODULES[name]
+        module = _importlib.import_module(path, __name__ if path.startswith(".") else None)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_MODULES))
 
-s = styles
 
 # from .plots import *
@@ -1,7 +1,6 @@
 import typing as _t
 
 import numpy as np
-import scipy
 
 ArrayLike = _t.Union[np.ndarray, _t.List]
 
@@ -15,7 +14,7 @@ def argmin2d(
     """Find the indexes of the minimum of the specified 2d array. Ignores np.nan.
 
     Args:
-        d (np.ndarray): Numpy array.
+        d (np.ndarray): Numpy array. It is not modified.
         x_mask (Optional[Union[Tuple[int, int], List]], optional): Limit where to look on x-axis.
             Can be tuple of the (start, end) indexes where to look or array of booleans of x-axis length.
             Defaults to None.
@@ -28,27 +27,89 @@ def argmin2d(
     Returns:
         Tuple[int, int]: index_y, index_x, i.e. the min value is d[index_y, index_x]
     """
+    index_y, index_x = argmin2d_batch(np.asarray(d)[None], x_mask=x_mask, y_mask=y_mask, filter_=filter_)
+    return int(index_y[0]), int(index_x[0])
+
+
+def _mask_to_slice_or_array(mask, length: int) -> _t.Tuple[slice, _t.Optional[np.ndarray]]:
+    """Convert a mask to a slice of the axis and, if it is boolean, to the mask inside the slice."""
+    if mask is None:
+        return slice(0, length), None
+    if isinstance(mask, tuple):
+        return slice(max(mask[0], 0), max(mask[1] + 1, 0)), None
+    mask = np.asarray(mask, dtype=bool)
+    if mask.shape[-1] != length:
+        raise ValueError(f"Mask should have length {length}, got {mask.shape[-1]}")
+    indexes = np.flatnonzero(mask.any(axis=tuple(range(mask.ndim - 1))))
+    if len(indexes) == 0:
+        return slice(0, 0), None
+    window = slice(int(indexes[0]), int(indexes[-1]) + 1)
+    return window, mask[..., window]
+
+
+def argmin2d_batch(
+    d: np.ndarray,
+    x_mask: _t.Optional[_t.Union[_t.Tuple[int, int], ArrayLike]] = None,
+    y_mask: _t.Optional[_t.Union[_t.Tuple[int, int], ArrayLike]] = None,
+    filter_: _t.Optional[int] = None,
+) -> _t.Tuple[np.ndarray, np.ndarray]:
+    """Find the indexes of the minimum of each map of a `(n, ny, nx)` stack. Ignores np.nan.
+
+    The input is neither modified nor copied: tuple masks select a view of the stack and
+    boolean masks are used in a masked reduction. Only the filter creates a new array.
+
+    Args:
+        d (np.ndarray): Stack of maps of shape (n, ny, nx).
+        x_mask (Optional[Union[Tuple[int, int], List]], optional): Limit where to look on x-axis.
+            Can be tuple of the (start, end) indexes where to look, array of booleans
+            of x-axis length or of shape (n, nx) to use a different mask for each map.
+            Defaults to None.
+        y_mask (Optional[Union[Tuple[int, int], List]], optional): Same for y-axis,
+            with shape (ny,) or (n, ny). Defaults to None.
+        filter_ (Optional[int], optional): Size of the window of the uniform_filter that is
+            applied to each map. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: index_y, index_x of shape (n,),
+            i.e. the min value of map i is d[i, index_y[i], index_x[i]]
+
+    Raises:
+        ValueError: If a map has only NaN inside the masks.
+    """
+    d = np.asarray(d)
+    if d.ndim != 3:
+        raise ValueError(f"Data should be a stack of 2d maps (n, ny, nx), got shape {d.shape}")
     if filter_ and filter_ > 1:
-        d = scipy.ndimage.uniform_filter(d, size=3, mode="nearest")
-
-    if x_mask is not None:
-        if isinstance(x_mask, tuple):
-            d[:, 0 : x_mask[0]] = np.nan
-            d[:, x_mask[1] + 1 :] = np.nan
-        else:
-            x_mask = np.array(x_mask)
-            d[:, ~x_mask] = np.nan
-    if y_mask is not None:
-        if isinstance(y_mask, tuple):
-            d[0 : y_mask[0], :] = np.nan
-            d[y_mask[1] + 1 :, :] = np.nan
-        else:
-            y_mask = np.array(y_mask)
-            d[~y_mask, :] = np.nan
-
-    shape = d.shape
-    index: int = np.nanargmin(d)  # type: ignore
-    return index // shape[1], index % shape[1]
+        import scipy.ndimage
+
+        d = scipy.ndimage.uniform_filter(d, size=(1, filter_, filter_), mode="nearest")
+
+    n, ny, nx = d.shape
+    x_window, x_bool = _mask_to_slice_or_array(x_mask, nx)
+    y_window, y_bool = _mask_to_slice_or_array(y_mask, ny)
+    window = d[:, y_window, x_window]
+    if window.size == 0:
+        raise ValueError("Masks select an empty region")
+
+    where = None
+    if x_bool is not None:
+        where = x_bool.reshape(-1, 1, x_bool.shape[-1])
+    if y_bool is not None:
+        y_where = y_bool.reshape(-1, y_bool.shape[-1], 1)
+        where = y_where if where is None else where & y_where
+    if where is not None:
+        where = np.broadcast_to(where, window.shape)
+
+    minimum = np.fmin.reduce(window, axis=(1, 2), where=True if where is None else where, initial=np.inf)
+    hit = window == minimum[:, None, None]
+    if where is not None:
+        hit &= where
+    found = hit.reshape(n, -1).any(axis=1)
+    if not found.all():
+        raise ValueError(f"All-NaN slice inside the masks for maps {np.flatnonzero(~found).tolist()}")
+    index = hit.reshape(n, -1).argmax(axis=1)
+    width = window.shape[2]
+    return index // width + y_window.start, index % width + x_window.start
 
 
 def array_from_bounds(
@@ -3,17 +3,106 @@ import typing as _t
 import numpy as np
 
 
+DELAY_METHODS = ("diff", "fft")
+
+
+def estimate_delay(freqs: np.ndarray, z: np.ndarray, method: str = "diff", oversampling: int = 8) -> np.ndarray:
+    """Estimate the electrical delay of each trace of `z`, i.e. `z ~ exp(2j*pi*delay*freqs)`.
+
+    Args:
+        freqs (np.ndarray): Frequencies of shape (n_freqs,).
+        z (np.ndarray): Traces of shape (..., n_freqs).
+        method (str, optional): "diff" averages the phase difference of adjacent samples
+            (https://github.com/UlysseREGLADE/abcd_rf_fit#3-estimation-of-the-electrical-delay).
+            "fft" finds the peak of the zero-padded FFT along the frequencies, i.e. fits the phase
+            slope on all samples at once, which is robust to noise but requires evenly spaced
+            frequencies. Defaults to "diff".
+        oversampling (int, optional): Zero-padding factor of the "fft" method. Defaults to 8.
+
+    Returns:
+        np.ndarray: Delay of each trace, of shape z.shape[:-1].
+    """
+    freqs, z = np.asarray(freqs), np.asarray(z)
+    if method == "diff":
+        # z[1:] * conj(z[:-1]) has the same angle as z[1:] / z[:-1] without the division.
+        phase_steps = np.angle(z[..., 1:] * np.conj(z[..., :-1]))
+        return np.sum(phase_steps / np.diff(freqs), axis=-1) / z.shape[-1] / 2 / np.pi
+    if method != "fft":
+        raise ValueError(f"Method should be one of {DELAY_METHODS}, got {method}")
+
+    step = (freqs[-1] - freqs[0]) / (len(freqs) - 1)
+    if not np.allclose(np.diff(freqs), step, rtol=1e-3, atol=0):
+        raise ValueError("The fft method requires evenly spaced frequencies")
+    n_fft = oversampling * z.shape[-1]
+    power = np.abs(np.fft.fft(z, n=n_fft, axis=-1)) ** 2
+    peak = np.argmax(power, axis=-1)
+    # Parabolic interpolation of the peak between the bins.
+    left = np.take_along_axis(power, ((peak - 1) % n_fft)[..., None], axis=-1)[..., 0]
+    center = np.take_along_axis(power, peak[..., None], axis=-1)[..., 0]
+    right = np.take_along_axis(power, ((peak + 1) % n_fft)[..., None], axis=-1)[..., 0]
+    denominator = left - 2 * center + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(denominator != 0, 0.5 * (left - right) / denominator, 0)
+    cycles_per_sample = (peak + shift) / n_fft
+    cycles_per_sample = (cycles_per_sample + 0.5) % 1 - 0.5
+    return cycles_per_sample / step
+
+
 def correct_for_delay(
-    freqs: np.ndarray, z: np.ndarray, delay: _t.Optional[float] = None
+    freqs: np.ndarray,
+    z: np.ndarray,
+    delay: _t.Optional[_t.Union[float, np.ndarray]] = None,
+    method: str = "diff",
+    out: _t.Optional[np.ndarray] = None,
 ) -> _t.Tuple[np.ndarray, np.ndarray]:
     """Correct z with given delay.
     Algo: corrected_z = np.exp(-1j*delay*freqs)*z
+
+    Args:
+        freqs (np.ndarray): Frequencies of shape (n_freqs,).
+        z (np.ndarray): One trace of shape (n_freqs,) or many of shape (n_traces, n_freqs).
+        delay (float | np.ndarray, optional): Delay, or one delay per trace.
+            If None, it is estimated for each trace with `estimate_delay`. Defaults to None.
+        method (str, optional): Estimation method, "diff" or "fft". See `estimate_delay`.
+        out (np.ndarray, optional): Complex array where to write the result,
+            can be `z` itself to correct it in place. Defaults to None.
+
     Return: freqs, corrected_z"""
+    freqs = np.asarray(freqs)
+    z = np.asarray(z)
     if delay is None:
-        # https://github.com/UlysseREGLADE/abcd_rf_fit#3-estimation-of-the-electrical-delay
-        delay = np.sum(np.angle(z[1:] / z[:-1]) / np.diff(freqs)) / len(z) / 2 / np.pi
-    corrected = np.exp(-1j * 2 * np.pi * delay * freqs) * z
-    return freqs, corrected * np.exp(-1j * np.mean(np.unwrap(np.angle(corrected), axis=-1)))
+        delay = estimate_delay(freqs, z, method=method)
+    delay = np.asarray(delay)[..., None]
+    if out is None:
+        out = np.empty(np.broadcast_shapes(z.shape, delay.shape[:-1] + freqs.shape), dtype=np.result_type(z, 1j))
+    np.multiply(z, np.exp(-2j * np.pi * delay * freqs), out=out)
+    offset = np.mean(np.unwrap(np.angle(out), axis=-1), axis=-1)
+    out *= np.exp(-1j * offset)[..., None]
+    return freqs, out
+
+
+def two_tone_order(
+    freqs: _t.Union[_t.Tuple[np.ndarray, np.ndarray], np.ndarray],
+) -> _t.Tuple[np.ndarray, np.ndarray]:
+    """Return the sorted frequencies of a two-tone sweep and the permutation that sorts them.
+
+    Args:
+        freqs (Union[Tuple[np.ndarray, np.ndarray], np.ndarray]):
+            Either a tuple containing two arrays of frequencies (LO and IF) or a single array
+            of frequencies.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: sorted frequencies and the permutation,
+            i.e. sorted_freqs = freqs[order].
+    """
+    if isinstance(freqs, tuple):
+        lo_freqs, if_freqs = freqs
+        ifs, los = np.meshgrid(if_freqs, lo_freqs)
+        # los, ifs = np.meshgrid(lo_freqs, if_freqs)
+        freqs = (los + ifs).flatten()
+    freqs = np.asarray(freqs)
+    order = np.argsort(freqs)
+    return freqs[order], order
 
 
 def get_formatted_data_from_two_tone(
@@ -37,13 +126,119 @@ def get_formatted_data_from_two_tone(
             - z (np.ndarray): The data reshaped and sorted according to the frequency values.
 
     """
-    if isinstance(freqs, tuple):
-        lo_freqs, if_freqs = freqs
-        ifs, los = np.meshgrid(if_freqs, lo_freqs)
-        # los, ifs = np.meshgrid(lo_freqs, if_freqs)
-        freqs = (los + ifs).flatten()
+    freqs, order = two_tone_order(freqs)
     z = z.reshape((len(voltages), len(freqs)))
-    sorted_freqs = np.argsort(freqs)
-    freqs = freqs[sorted_freqs]
-    z = z[:, sorted_freqs]
+    z = z[:, order]
     return voltages, freqs, z
+
+
+class TwoToneAssembler:
+    """Assemble a two-tone sweep that arrives in chunks, one or several voltages at a time.
+
+    The sort permutation of the frequencies is computed once. Each chunk is written
+    straight into its sorted place of a preallocated array, a memory-mapped `.npy` file
+    or a user-provided array, so the full data never has to be in memory.
+    The result is the same as `get_formatted_data_from_two_tone`.
+
+    Args:
+        voltages (np.ndarray): Voltages of the sweep, one row of the map per voltage.
+        freqs (Union[Tuple[np.ndarray, np.ndarray], np.ndarray]): LO and IF frequencies
+            or a single array of frequencies, as in `get_formatted_data_from_two_tone`.
+        filename (str, optional): Create the map as a memory-mapped `.npy` file.
+            It can be opened later with `np.load(filename, mmap_mode="r")`.
+        out (np.ndarray, optional): Array of shape (len(voltages), n_freqs) to write into.
+        dtype (optional): Type of the map if it is created. Defaults to complex.
+
+    Example:
+        ```
+            assembler = TwoToneAssembler(voltages, (lo_freqs, if_freqs), filename="two_tone.npy")
+            for chunk in acquisition():
+                assembler.append(chunk)
+            assembler.plot()
+        ```
+    """
+
+    def __init__(
+        self,
+        voltages: np.ndarray,
+        freqs: _t.Union[_t.Tuple[np.ndarray, np.ndarray], np.ndarray],
+        filename: _t.Optional[str] = None,
+        out: _t.Optional[np.ndarray] = None,
+        dtype: _t.Any = complex,
+    ):
+        self.voltages = np.asarray(voltages)
+        self.freqs, self.order = two_tone_order(freqs)
+        shape = (len(self.voltages), len(self.freqs))
+        if out is not None:
+            if out.shape != shape:
+                raise ValueError(f"out should have shape {shape}, got {out.shape}")
+            self.z = out
+        elif filename is not None:
+            self.z = np.lib.format.open_memmap(filename, mode="w+", dtype=dtype, shape=shape)
+        else:
+            self.z = np.empty(shape, dtype=dtype)
+        self.filled = np.zeros(len(self.voltages), dtype=bool)
+        self._next = 0
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.filled.all())
+
+    def add(self, index: int, chunk: np.ndarray) -> "TwoToneAssembler":
+        """Write the rows starting at voltage `index`.
+
+        `chunk` is one row or several rows of unsorted data, i.e. of shape (n_freqs,),
+        (n_rows, n_freqs) or flat with n_rows * n_freqs elements.
+        """
+        chunk = np.asarray(chunk).reshape(-1, len(self.freqs))
+        stop = index + len(chunk)
+        if index < 0 or stop > len(self.voltages):
+            raise IndexError(f"Rows {index}:{stop} are out of the {len(self.voltages)} voltages")
+        rows = self.z[index:stop]
+        if rows.flags.c_contiguous and rows.dtype == chunk.dtype:
+            np.take(chunk, self.order, axis=1, out=rows, mode="clip")
+        else:
+            rows[...] = chunk[:, self.order]
+        self.filled[index:stop] = True
+        self._next = max(self._next, stop)
+        return self
+
+    def append(self, chunk: np.ndarray) -> "TwoToneAssembler":
+        """Write the rows following the last written ones."""
+        return self.add(self._next, chunk)
+
+    def flush(self) -> "TwoToneAssembler":
+        """Write the data of a memory-mapped map to the disk."""
+        if isinstance(self.z, np.memmap):
+            self.z.flush()
+        return self
+
+    def get_data(self) -> _t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return voltages, freqs and z of the rows written so far.
+
+        If the rows were written in order, z is a view of the map, otherwise a copy
+        of the written rows.
+        """
+        if self.filled[: self._next].all():
+            return self.voltages[: self._next], self.freqs, self.z[: self._next]
+        rows = np.flatnonzero(self.filled)
+        return self.voltages[rows], self.freqs, self.z[rows]
+
+    def plot(self, axs=None, **kwargs):
+        """Plot the rows written so far with `AxesList.plot_z_2d`.
+
+        Args:
+            axs (AxesList, optional): Two axes to plot on. Defaults to new ones.
+            kwargs: Passed to `plot_z_2d`.
+
+        Returns:
+            AxesList: The axes.
+        """
+        if axs is None:
+            from ..core.front import axs as new_axs
+
+            axs = new_axs(1, 2)
+        voltages, freqs, z = self.get_data()
+        if len(voltages) == 0:
+            return axs
+        return axs.plot_z_2d(freqs, voltages, z, **kwargs)
@@ -1,7 +1,7 @@
+import functools
 import typing as _t
 
 import numpy as np
-import scipy
 
 
 def find_h_symmetry_axis(data: np.ndarray) -> int:
@@ -13,20 +13,130 @@ def find_h_symmetry_axis(data: np.ndarray) -> int:
     Returns:
         (int): x index of the symmetry axis.
     """
-    data = (data - np.mean(data)) / np.std(data)
-    # corr = scipy.signal.fftconvolve(
-    #     data[:, : len(data[0]) // 2], data[:, ::-1], mode="full"
-    # )
-    corr = scipy.signal.fftconvolve(data, data[::-1], mode="full")
-    return int((np.argmax(corr) % corr.shape[-1]) / 2)
+    peak = _symmetry_correlation_peaks(np.asarray(data)[None])
+    return int(peak[0] / 2)
 
 
-def remove_background(data: np.ndarray, convolve_len: _t.Optional[int] = None):
+def find_h_symmetry_axes(data: np.ndarray, subpixel: bool = True, dtype: _t.Any = np.float32) -> np.ndarray:
+    """Find the horizontal symmetry axis of each map of a stack.
+
+    Same as `find_h_symmetry_axis`, but for a `(n, ny, nx)` stack of maps and
+    with sub-pixel positions. Instead of the full 2d correlation of each map
+    with its mirror image, only the correlation between the same rows is used,
+    which is a sum of 1d real FFT convolutions along x.
+
+    Args:
+        data (np.ndarray): Stack of maps of shape (n, ny, nx) or a single 2d map.
+        subpixel (bool, optional): Refine the position with a parabolic interpolation
+            of the correlation peak. Defaults to True.
+        dtype (optional): Precision of the FFT. Defaults to np.float32.
+
+    Returns:
+        np.ndarray: x position of the symmetry axis of each map, of shape (n,).
+            For a single 2d map, a 0d array.
+    """
+    data = np.asarray(data)
+    if data.ndim not in (2, 3):
+        raise ValueError(f"Data should be a 2d map or a stack of maps (n, ny, nx), got shape {data.shape}")
+    stack = data[None] if data.ndim == 2 else data
+    positions = _symmetry_correlation_peaks(stack, subpixel=subpixel, dtype=dtype) / 2
+    return positions[0] if data.ndim == 2 else positions
+
+
+@functools.lru_cache(maxsize=32)
+def _symmetry_fft_size(nx: int) -> int:
+    import scipy.fft
+
+    return scipy.fft.next_fast_len(2 * nx - 1, real=True)
+
+
+def _symmetry_correlation_peaks(
+    stack: np.ndarray,
+    subpixel: bool = False,
+    dtype: _t.Any = np.float64,
+    block_size: int = 1 << 22,
+) -> np.ndarray:
+    """Return the index of the maximum of the convolution of each map with itself along x.
+
+    The convolution `c[k] = sum_rows sum_m a[m] a[k - m]` of the centered map
+    is maximal at twice the position of the symmetry axis. The division by the std
+    of the map does not move the maximum and is skipped.
+    """
+    import scipy.fft
+
+    n, ny, nx = stack.shape
+    n_fft = _symmetry_fft_size(nx)
+    spectrum = np.zeros((n, n_fft // 2 + 1), dtype=np.complex128)
+    rows_per_block = min(max(block_size // max(nx, 1), 1), ny)
+    block = np.empty((rows_per_block, nx), dtype=dtype)
+    for i in range(n):
+        mean = np.mean(stack[i])
+        for start in range(0, ny, rows_per_block):
+            rows = stack[i, start : start + rows_per_block]
+            centered = block[: len(rows)]
+            np.subtract(rows, mean, out=centered, casting="same_kind")
+            block_spectrum = scipy.fft.rfft(centered, n=n_fft, axis=-1)
+            spectrum[i] += np.einsum("ij,ij->j", block_spectrum, block_spectrum)
+    corr = scipy.fft.irfft(spectrum, n=n_fft, axis=-1)[:, : 2 * nx - 1]
+    peak = np.argmax(corr, axis=-1)
+    if not subpixel:
+        return peak
+    index = np.arange(n)
+    left = corr[index, np.maximum(peak - 1, 0)]
+    center = corr[index, peak]
+    right = corr[index, np.minimum(peak + 1, 2 * nx - 2)]
+    denominator = left - 2 * center + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(denominator < 0, 0.5 * (left - right) / denominator, 0)
+    return peak + shift
+
+
+def remove_background(
+    data: np.ndarray,
+    convolve_len: _t.Optional[int] = None,
+    inplace: bool = False,
+    dtype: _t.Optional[_t.Any] = None,
+    block_size: int = 1 << 20,
+) -> np.ndarray:
+    """Remove the running mean along the first axis, then the mean of each row.
+
+    The running mean is the same as a convolution with `np.ones((convolve_len, 1))` and
+    `boundary="symm"`, but is computed with `uniform_filter1d` in O(N) whatever `convolve_len`.
+    Columns are processed by blocks, so the only temporary is the background of one block.
+
+    Args:
+        data (np.ndarray): 2d array.
+        convolve_len (int, optional): Length of the running mean.
+            Defaults to min(50, len(data) // 15).
+        inplace (bool, optional): Write the result into `data`, which should be a float array.
+            Defaults to False.
+        dtype (optional): Type of the result if not in place, e.g. np.float32.
+            Defaults to float64 or the float type of `data`.
+        block_size (int, optional): Number of elements processed at once.
+
+    Returns:
+        np.ndarray: Data without background.
+    """
+    import scipy.ndimage
+
     if convolve_len is None:
-        convolve_len = min(50, len(data) // 15)
-    data = (
-        data
-        - scipy.signal.convolve2d(data, np.ones((convolve_len, 1)), mode="same", boundary="symm")
-        / convolve_len
-    )
-    return data - data.mean(axis=1)[:, np.newaxis]
+        convolve_len = max(min(50, len(data) // 15), 1)
+    if inplace:
+        if not isinstance(data, np.ndarray) or not np.issubdtype(data.dtype, np.floating):
+            raise ValueError("In place background removal requires a float numpy array")
+        out = data
+    else:
+        data = np.asarray(data)
+        if dtype is None:
+            dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.float64
+        out = np.empty(data.shape, dtype=dtype)
+
+    step = max(block_size // max(len(data), 1), 1)
+    for start in range(0, data.shape[1], step):
+        block = data[:, start : start + step]
+        background = scipy.ndimage.uniform_filter1d(
+            block, convolve_len, axis=0, mode="reflect", output=out.dtype
+        )
+        np.subtract(block, background, out=out[:, start : start + step], casting="same_kind")
+    out -= out.mean(axis=1, keepdims=True)
+    return out
@@ -0,0 +1,3 @@
+# flake8: noqa: F401
+
+from .blit import BlitAnimator
@@ -0,0 +1,133 @@
+import time
+import typing as _t
+
+from ..core.utils import get_figure
+
+if _t.TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+class BlitAnimator:
+    """Redraw only the dynamic artists of a figure using blitting.
+
+    The static part of each axes (frame, ticks, labels, static artists) is rendered
+    once and cached as a background. On each frame the background is restored and only
+    the dynamic artists are drawn on top of it. Backgrounds are cached again after
+    every full draw of the canvas, e.g. after resizing the window.
+
+    Since the axes are not redrawn, the limits and ticks are not updated by frames.
+
+    Args:
+        fig (AFigure | AAxes | AxesList): Figure to animate or any of its axes.
+        artists (Artist): Dynamic artists.
+        fps (float, optional): Maximal frame rate of `run`. None for unlimited.
+            Defaults to 30.
+
+    Example:
+        ```
+            import numpy as np
+            import aplot as ap
+            from aplot.animation import BlitAnimator
+
+            x = np.linspace(0, 10, 1000)
+            axs = ap.axs(2, 2).plot(x, np.sin(x))
+            lines = [ax.get_lines()[0] for ax in axs.flat()]
+            animator = BlitAnimator(axs, *lines)
+
+            def update(i):
+                for line in lines:
+                    line.set_ydata(np.sin(x + i / 10))
+
+            animator.run(update, frames=300)
+        ```
+    """
+
+    def __init__(self, fig, *artists: "Artist", fps: _t.Optional[float] = 30):
+        self.figure = get_figure(fig)
+        self.canvas = self.figure.canvas
+        self.fps = fps
+        self.artists: _t.List["Artist"] = []
+        self._backgrounds: _t.Dict[_t.Any, _t.Any] = {}
+        self._last_frame: _t.Optional[float] = None
+        self._cid = self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.add(*artists)
+
+    def add(self, *artists: "Artist") -> "BlitAnimator":
+        """Mark artists as dynamic. Backgrounds are cached again on the next frame."""
+        for artist in artists:
+            if get_figure(artist) is not self.figure:
+                raise ValueError("Artist should belong to the animated figure")
+            artist.set_animated(True)
+            self.artists.append(artist)
+        self._backgrounds = {}
+        return self
+
+    def _region(self, artist: "Artist") -> _t.Union["Axes", "Figure"]:
+        return artist.axes if artist.axes is not None else self.figure
+
+    def _on_draw(self, event=None):
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self._backgrounds = {
+            region: self.canvas.copy_from_bbox(region.bbox)
+            for region in {self._region(artist): None for artist in self.artists}
+        }
+        self._draw_artists()
+
+    def cache_background(self) -> "BlitAnimator":
+        """Draw the full figure without the dynamic artists and cache the backgrounds."""
+        self.canvas.draw()
+        return self
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            self.figure.draw_artist(artist)
+
+    def frame(self) -> "BlitAnimator":
+        """Draw the dynamic artists over the cached backgrounds."""
+        if not self._backgrounds:
+            self.cache_background()
+        for background in self._backgrounds.values():
+            self.canvas.restore_region(background)
+        self._draw_artists()
+        for region in self._backgrounds:
+            self.canvas.blit(region.bbox)
+        self.canvas.flush_events()
+        return self
+
+    def wait(self):
+        """Sleep until the next frame is allowed by `fps`."""
+        now = time.perf_counter()
+        if self.fps and self._last_frame is not None:
+            delay = self._last_frame + 1 / self.fps - now
+            if delay > 0:
+                time.sleep(delay)
+                now += delay
+        self._last_frame = now
+
+    def run(
+        self,
+        update: _t.Callable[[int], _t.Any],
+        frames: _t.Union[int, _t.Iterable[_t.Any]],
+    ) -> "BlitAnimator":
+        """Call `update(frame)` and draw a frame for each element of `frames`.
+
+        If `frames` is an int, `range(frames)` is used.
+        """
+        if isinstance(frames, int):
+            frames = range(frames)
+        for value in frames:
+            update(value)
+            self.wait()
+            self.frame()
+        return self
+
+    def disconnect(self):
+        """Stop caching backgrounds on draw and mark the artists as static."""
+        self.canvas.mpl_disconnect(self._cid)
+        for artist in self.artists:
+            artist.set_animated(False)
+        self.artists = []
+        self._backgrounds = {}
@@ -0,0 +1,203 @@
+"""Render many figures in parallel across a process pool.
+
+Each render spec is a picklable callable that builds a figure from the given arrays.
+Large arrays are passed to the workers through `multiprocessing.shared_memory`
+instead of being pickled. Workers use a headless backend and close their figures.
+
+Example:
+    ```
+        import numpy as np
+        import aplot as ap
+        from aplot.batch import RenderSpec, render_batch
+
+        def plot_trace(x, y, title=""):
+            return ap.axs().plot(x, y).set(title=title)
+
+        x = np.linspace(0, 1, 1_000_000)
+        specs = [
+            RenderSpec(plot_trace, {"x": x, "y": np.sin(x * i)}, {"title": str(i)}, f"trace_{i}.png")
+            for i in range(100)
+        ]
+        for result in render_batch(specs):
+            if not result.ok:
+                print(result.index, result.error)
+    ```
+"""
+
+import io
+import os
+import sys
+import traceback
+import typing as _t
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .core.utils import get_figure
+
+SHARED_MEMORY_THRESHOLD = 1 << 20
+
+
+class RenderSpec(_t.NamedTuple):
+    """Description of one figure to render.
+
+    Args:
+        func (Callable): Picklable (i.e. module level) function called as
+            `func(**arrays, **kwargs)`. Should return a figure, an axes or an AxesList.
+            If it returns None, the current figure is used.
+        arrays (dict): Numpy arrays passed to `func`. Large arrays go through shared memory.
+        kwargs (dict): Other keyword arguments passed to `func`.
+        path (str, optional): Where to save the figure. If None, PNG bytes are returned.
+        savefig_kwargs (dict): Keyword arguments passed to `savefig`.
+    """
+
+    func: _t.Callable
+    arrays: _t.Dict[str, np.ndarray] = {}
+    kwargs: _t.Dict[str, _t.Any] = {}
+    path: _t.Optional[str] = None
+    savefig_kwargs: _t.Dict[str, _t.Any] = {}
+
+
+class RenderResult(_t.NamedTuple):
+    """Result of one render spec. Either `path`/`data` or `error` is set."""
+
+    index: int
+    path: _t.Optional[str] = None
+    data: _t.Optional[bytes] = None
+    error: _t.Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SharedArray(_t.NamedTuple):
+    """Reference to an array stored in a shared memory block."""
+
+    name: str
+    shape: _t.Tuple[int, ...]
+    dtype: str
+
+
+def _attach(ref: SharedArray) -> _t.Tuple[shared_memory.SharedMemory, np.ndarray]:
+    # The block belongs to the parent process, which unlinks it. Before Python 3.13
+    # the worker registers it again in the resource tracker shared with the parent,
+    # which is harmless since the tracker keeps a set of names.
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=ref.name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=ref.name)
+    array = np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=shm.buf)
+    array.flags.writeable = False
+    return shm, array
+
+
+def _init_worker(backend: str):
+    import matplotlib
+
+    matplotlib.use(backend)
+
+
+def _render_one(index: int, spec: RenderSpec, refs: _t.Dict[str, SharedArray]) -> RenderResult:
+    import matplotlib.pyplot as plt
+
+    blocks = []
+    arrays: _t.Dict[str, np.ndarray] = {}
+    try:
+        arrays.update(spec.arrays)
+        for key, ref in refs.items():
+            shm, arrays[key] = _attach(ref)
+            blocks.append(shm)
+        res = spec.func(**arrays, **spec.kwargs)
+        fig = get_figure(res) if res is not None else plt.gcf()
+        if spec.path is not None:
+            fig.savefig(spec.path, **spec.savefig_kwargs)
+            return RenderResult(index, path=spec.path)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **{"format": "png", **spec.savefig_kwargs})
+        return RenderResult(index, data=buffer.getvalue())
+    except Exception:  # pylint: disable=broad-except
+        return RenderResult(index, error=traceback.format_exc())
+    finally:
+        plt.close("all")
+        arrays.clear()
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:
+                # An artist still references the array, it is released with it.
+                pass
+
+
+def _share_arrays(specs: _t.List[RenderSpec], threshold: int):
+    """Copy large arrays to shared memory once per array object.
+
+    Returns the specs without these arrays, the references to put in their place
+    and the shared memory blocks to release at the end.
+    """
+    blocks: _t.Dict[int, _t.Tuple[shared_memory.SharedMemory, SharedArray]] = {}
+    new_specs, all_refs = [], []
+    for spec in specs:
+        arrays, refs = {}, {}
+        for key, value in spec.arrays.items():
+            array = np.asarray(value)
+            if array.nbytes < threshold or array.dtype.hasobject:
+                arrays[key] = array
+                continue
+            if id(value) not in blocks:
+                shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+                blocks[id(value)] = (shm, SharedArray(shm.name, array.shape, array.dtype.str))
+            refs[key] = blocks[id(value)][1]
+        new_specs.append(spec._replace(arrays=arrays))
+        all_refs.append(refs)
+    return new_specs, all_refs, [shm for shm, _ in blocks.values()]
+
+
+def render_batch(
+    specs: _t.Iterable[RenderSpec],
+    processes: _t.Optional[int] = None,
+    *,
+    backend: str = "Agg",
+    shared_memory_threshold: int = SHARED_MEMORY_THRESHOLD,
+    mp_context=None,
+) -> _t.List[RenderResult]:
+    """Render and save figures across a process pool.
+
+    Args:
+        specs (Iterable[RenderSpec]): Figures to render.
+        processes (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        backend (str, optional): Matplotlib backend of the workers. Defaults to "Agg".
+        shared_memory_threshold (int, optional): Arrays of at least this size in bytes
+            are passed through shared memory. Defaults to 1 MB.
+        mp_context (optional): Multiprocessing context, e.g. `multiprocessing.get_context("spawn")`.
+
+    Returns:
+        List[RenderResult]: One result per spec, in the same order. Failures are reported
+            per item in `RenderResult.error` and do not stop the other renders.
+    """
+    specs = list(specs)
+    specs, refs, blocks = _share_arrays(specs, shared_memory_threshold)
+    results: _t.List[RenderResult] = []
+    try:
+        with ProcessPoolExecutor(
+            max_workers=processes or os.cpu_count(),
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(backend,),
+        ) as executor:
+            futures = [
+                executor.submit(_render_one, i, spec, ref)
+                for i, (spec, ref) in enumerate(zip(specs, refs))
+            ]
+            for i, future in enumerate(futures):
+                try:
+                    results.append(future.result())
+                except Exception:  # pylint: disable=broad-except
+                    results.append(RenderResult(i, error=traceback.format_exc()))
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+    return results
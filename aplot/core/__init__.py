@@ -6,5 +6,10 @@ import matplotlib.pyplot as plt
 from .axes_class import AAxes
 from .axes_list import AxesList
 from .figure_class import AFigure
+from .figure_pool import FigurePool
+from .histogram import Histogram2D
 from .front import ax, axs, close, figure, show, subplot, subplots
+from .arrays import open_array
+from .profiling import profile
+from .render_cache import RenderCache, get_render_cache, set_render_cache
 from .utils import res
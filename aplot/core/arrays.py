@@ -0,0 +1,66 @@
+import typing as _t
+import zipfile
+
+import numpy as np
+
+
+def open_array(
+    path: str,
+    key: _t.Optional[str] = None,
+    mmap_mode: _t.Literal["r", "r+", "c"] = "r",
+) -> np.memmap:
+    """Open an array of a `.npy` or `.npz` file as a memory-mapped array.
+
+    The data is read from the disk only when it is accessed, so the result can be passed
+    straight to `imshow` or `pcolorfast`, which read only the visible window.
+
+    Args:
+        path (str): Path to a `.npy` or `.npz` file.
+        key (str, optional): Name of the array inside a `.npz` file.
+            Can be omitted if the file contains a single array.
+        mmap_mode ("r" | "r+" | "c", optional): Mode of `np.memmap`. Defaults to "r".
+
+    Raises:
+        ValueError: If the array inside a `.npz` file is compressed, since it cannot be mapped.
+
+    Example:
+        ```
+            ap.axs().imshow(ap.open_array("map.npy"))
+        ```
+    """
+    if not zipfile.is_zipfile(path):
+        return np.load(path, mmap_mode=mmap_mode)
+
+    with zipfile.ZipFile(path) as archive:
+        names = [name[: -len(".npy")] for name in archive.namelist() if name.endswith(".npy")]
+        if key is None:
+            if len(names) != 1:
+                raise ValueError(f"The file contains several arrays, choose one with key: {names}")
+            key = names[0]
+        elif key not in names:
+            raise KeyError(f"{key} is not in the file. Available arrays: {names}")
+        info = archive.getinfo(f"{key}.npy")
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise ValueError(
+                f"Array {key} is compressed and cannot be memory-mapped, use np.load to read it."
+            )
+
+    with open(path, "rb") as file:
+        # Local file header: 30 bytes, then the file name and the extra field.
+        file.seek(info.header_offset + 26)
+        name_length, extra_length = np.frombuffer(file.read(4), dtype="<u2")
+        file.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode=mmap_mode,
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
@@ -1,21 +1,42 @@
+import functools
+import inspect
 import typing as _t
 
+import matplotlib as mpl
 import numpy as np
 
 # from ffit import FIT_FUNCTIONS
 # from ffit.fit_results import FitResult
 from matplotlib.axes import Axes as MplAxes
-from matplotlib.collections import QuadMesh
-from matplotlib.image import AxesImage
+from matplotlib.collections import LineCollection, QuadMesh
+from matplotlib.colors import Normalize, to_rgba_array
+from matplotlib.image import AxesImage, NonUniformImage
+from matplotlib.lines import Line2D
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
+from . import profiling, recycle
+from .decimation import DecimatedLine, split_plot_args
+from .density import DensityImage
+from .histogram import Histogram2D
+from .pyramid import (
+    LAZY_PYRAMID_MODE,
+    ImagePyramid,
+    PyramidImage,
+    StridedPyramid,
+    default_extent,
+    is_lazy_array,
+)
+from .stream import LineStream
 from .typing import NoneType, noneType
 from .utils import (
+    RendererChoice,
+    choose_renderer,
     filter_none,
     filter_none_types,
     filter_set_kwargs,
     get_auto_args,
     imshow_kwds,
+    pcolorfast_extent,
 )
 
 _T = _t.TypeVar("_T")
@@ -126,12 +147,60 @@ WRAPPER_METHODS = {
 FILTER_KWARGS = {"hist2d", QuadMesh}
 
 
+def is_chained_method(name: str) -> bool:
+    """Return True if the method `name` should return the axes for chaining."""
+    return name.startswith("set") or name in WRAPPER_METHODS
+
+
+def _chained(func: _t.Callable) -> _t.Callable:
+    """Wrap `func` so that it stores its result in `_last_result` and returns the axes.
+
+    If `func` already returns an axes, the result is returned unchanged.
+    Calls are reported to the active profiler, see `aplot.profile`.
+    """
+    name = f"AAxes.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        profiler = profiling.active_profiler
+        if profiler is None:
+            result = func(self, *args, **kwargs)
+        else:
+            result = profiler.call(name, func, self, *args, **kwargs)
+        if isinstance(result, MplAxes):
+            return result
+        self._last_result = result
+        return self
+
+    wrapper._chained = True  # type: ignore
+    return wrapper
+
+
+def _install_chained_methods(cls: type, own_only: bool = False):
+    """Replace the chained methods of `cls` by precompiled wrappers.
+
+    Wrappers are built once per class instead of on every attribute access.
+    If `own_only` is True, only the methods defined in the class body are wrapped,
+    since the inherited ones were already wrapped in the parent class.
+    """
+    names = vars(cls) if own_only else dir(cls)
+    for name in list(names):
+        if not is_chained_method(name):
+            continue
+        func = inspect.getattr_static(cls, name, None)
+        if not inspect.isfunction(func) or getattr(func, "_chained", False):
+            continue
+        setattr(cls, name, _chained(func))
+
+
 class AAxes(
     MplAxes,
     _t.Generic[_T],
 ):
     name = "AAxis"  # Give a name for the matplotlib registry
     _last_result = None
+    # Artists of the previous page, set on the axes of a `FigurePool`.
+    _recycled: _t.Optional[recycle.RecycledArtists] = None
     # _fit_result: FitResult | None = None
     # __all__ = MplAxes.__all__ + ["fit", "last_result", "fit_result", "res", "set"]
     # __dict__ = MplAxes.__dict__  ("fit", "last_result", "fit_result", "res", "set")
@@ -173,24 +242,9 @@ class AAxes(
     def fig(self):
         return self.figure
 
-    def __getattribute__(self, name: str):
-        # if hasattr(self, name):
-        #     raise AttributeError(f"Attribute {name} not found in {self.name}")
-        # print(name)
-
-        if name.startswith("set") or name in WRAPPER_METHODS:
-            func = super().__getattribute__(name)
-
-            def wrapper(*args, **kwargs):
-                result = func(*args, **kwargs)
-                if isinstance(result, (MplAxes, AAxes)):
-                    return result
-                self._last_result = result
-                return self
-
-            return wrapper
-        # TODO: if plot function kwargs should be filtered
-        return super().__getattribute__(name)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _install_chained_methods(cls, own_only=True)
 
     def set(  # type: ignore
         self,
@@ -217,21 +271,138 @@ class AAxes(
         self,
         x,
         y=None,
-        *args,
+        bins=10,
+        range=None,  # pylint: disable=redefined-builtin
+        density: bool = False,
+        weights=None,
+        cmin=None,
+        cmax=None,
+        *,
+        histogram: _t.Optional[Histogram2D] = None,
         **kwargs,
     ):
-        if y is None:
-            x = np.array(x)
-            x = x[:, 0]
-            y = x[:, 1]
-        return super().hist2d(x, y, *args, **kwargs)
-
-    def z_parametric(self, z, **kwargs):
+        """Plot a 2D histogram, see `matplotlib.axes.Axes.hist2d`.
+
+        Points are binned with `Histogram2D`, which is faster than `np.histogram2d`.
+        If `y` is None, `x` should be an array of shape (N, 2).
+
+        Args:
+            histogram (Histogram2D, optional): Histogram to add the points to. Its bins are used
+                instead of `bins` and `range`. If it was drawn on this axes before, its mesh
+                is updated instead of adding a new one. `x` can be None to only draw it.
+        """
+        if y is None and x is not None:
+            xy = np.asarray(x)
+            x, y = xy[:, 0], xy[:, 1]
+        if histogram is None:
+            histogram = Histogram2D(bins, range)
+        if x is not None:
+            histogram.add(x, y, weights=weights)
+        return histogram.draw(self, density=density, cmin=cmin, cmax=cmax, **kwargs)
+
+    def z_parametric(
+        self,
+        z,
+        *,
+        density: _t.Optional[_t.Union[bool, str]] = None,
+        **kwargs,
+    ):
+        """Plot the imaginary part of `z` versus its real part.
+
+        Args:
+            density (bool | "count" | "mean", optional): Show the number of points per pixel
+                as an image instead of a line, see `scatter`. Defaults to None.
+        """
+        if density:
+            self.scatter(np.real(z), np.imag(z), density=density, **kwargs)
+            return self
         self.plot(np.real(z), np.imag(z), **kwargs)
         return self
 
-    def hist_z(self, z, **kwargs):
-        self.hist2d(np.real(z), np.imag(z), **kwargs)
+    def scatter(  # type: ignore
+        self,
+        x,
+        y,
+        *args,
+        density: _t.Optional[_t.Union[bool, str]] = None,
+        density_norm: _t.Union[str, Normalize] = "eq_hist",
+        pixel_size: float = 1.0,
+        **kwargs,
+    ):
+        """Scatter plot of y versus x, see `matplotlib.axes.Axes.scatter`.
+
+        Args:
+            density (bool | "count" | "mean", optional): Instead of a marker per point,
+                show an image of the number of points in each pixel ("count"), or of the
+                mean of `c` ("mean"). The image is aggregated again on zoom. True selects
+                "mean" if `c` is given and "count" otherwise. `c` should then be numeric
+                values of the same size as x, colors raise a ValueError. More points can be
+                added with `ax.res.add(x, y)`. Marker options are ignored. Defaults to None.
+            density_norm ("eq_hist" | "log" | "linear" | Normalize, optional): Color scale
+                of the density image. Defaults to "eq_hist".
+            pixel_size (float, optional): Size of the density bins in screen pixels. Defaults to 1.
+        """
+        if not density:
+            return super().scatter(x, y, *args, **kwargs)
+        return self._scatter_density(
+            x, y, *args, density=density, density_norm=density_norm, pixel_size=pixel_size, **kwargs
+        )
+
+    def _scatter_density(
+        self,
+        x,
+        y,
+        s=None,
+        c=None,
+        marker=None,
+        cmap=None,
+        norm=None,
+        vmin=None,
+        vmax=None,
+        alpha=None,
+        *,
+        density: _t.Union[bool, str],
+        density_norm: _t.Union[str, Normalize],
+        pixel_size: float,
+        **kwargs,
+    ) -> DensityImage:
+        del s, marker
+        for key in ("linewidths", "edgecolors", "plotnonfinite", "colorizer"):
+            kwargs.pop(key, None)
+        if c is not None:
+            values = np.asarray(c)
+            if values.dtype.kind not in "biuf" or values.size != np.size(x):
+                raise ValueError(
+                    "With density, c should be numeric values of the same size as x, averaged in each pixel. "
+                    "The density image is colored with cmap."
+                )
+        mode = density if isinstance(density, str) else ("mean" if c is not None else "count")
+        im = DensityImage(
+            self,
+            mode=mode,
+            pixel_size=pixel_size,
+            norm=norm if norm is not None else density_norm,
+            vmin=vmin,
+            vmax=vmax,
+            cmap=cmap,
+            alpha=alpha,
+            **kwargs,
+        )
+        im.add(x, y, c)
+        super().add_image(im)
+        return im
+
+    def hist_z(self, z=None, *, histogram: _t.Optional[Histogram2D] = None, **kwargs):
+        """Plot the 2D histogram of complex values, e.g. IQ shots. See `hist2d`.
+
+        To accumulate shots acquired in batches, pass the same `Histogram2D`
+        as `histogram` on each call: the image is updated in place.
+        """
+        if z is None:
+            self.hist2d(None, histogram=histogram, **kwargs)
+        else:
+            z = np.asarray(z)
+            self.hist2d(z.real, z.imag, histogram=histogram, **kwargs)
         return self
 
     def imshow(  # type: ignore
@@ -255,17 +426,30 @@ class AAxes(
         resample=None,
         url=None,
         colorbar: bool = True,
+        pyramid: _t.Optional[_t.Union[bool, str]] = None,
         **kwargs,
     ):
-        if (
-            x is not None
-            and y is not None
-            and (len(data) != len(y) or len(data[0]) != len(x))
-        ):
+        """Display data as an image, with x and y used for the extent.
+
+        The renderer is chosen from the x and y grid (see `choose_renderer`):
+        AxesImage for regular grids, NonUniformImage for monotonic ones (e.g. log scale)
+        and QuadMesh otherwise. The choice and its reason are stored in
+        `renderer_choice` attribute of the result.
+
+        Args:
+            pyramid (bool | "mean" | "max" | "stride", optional): Draw a downsampled level of the data
+                that matches the pixel size of the axes and the visible extent.
+                Levels are built lazily with mean or max pooling. True is the same as "mean".
+                "stride" reads every n-th row and column of the visible window on each draw
+                and is used by default for `np.memmap` and other lazily sliced arrays
+                (see `open_array`) on a regular grid, so they are never loaded entirely.
+                Defaults to None.
+        """
+        shape = np.shape(data)
+        if x is not None and y is not None and (shape[0] != len(y) or shape[1] != len(x)):
             raise ValueError(
-                f"Wrong shapes. {len(data)} != {len(y)} or {len(data[0])} != {len(x)}"
+                f"Wrong shapes. {shape[0]} != {len(y)} or {shape[1]} != {len(x)}"
             )
-
         imshow_kwargs: dict = imshow_kwds(x, y)
         imshow_kwargs.update(
             **filter_none(
@@ -286,15 +470,55 @@ class AAxes(
             )
         )
 
-        im = super().imshow(
-            data,
-            **imshow_kwargs,
-            **filter_set_kwargs(AxesImage, **kwargs),
-        )
+        if extent is not None:
+            choice = RendererChoice("AxesImage", "extent is given")
+        else:
+            choice = choose_renderer(x, y)
+        # Lazy arrays on other grids are drawn as before, by loading them.
+        if pyramid is None and is_lazy_array(data) and choice.renderer == "AxesImage":
+            pyramid = LAZY_PYRAMID_MODE
+
+        recycle_key = recycled = None
+        if self._recycled is not None and not pyramid and choice.renderer == "AxesImage":
+            recycle_key = recycle.image_key(imshow_kwargs, kwargs, colorbar)
+            recycled = self._recycled.take(recycle_key)
+
+        if recycled is not None:
+            im = self._reuse_image(recycled, data, imshow_kwargs)
+        elif pyramid:
+            if choice.renderer != "AxesImage":
+                raise ValueError(f"Pyramid mode requires a regular grid ({choice.reason})")
+            im = self._imshow_pyramid(
+                data,
+                "mean" if pyramid is True else pyramid,
+                **imshow_kwargs,
+                **filter_set_kwargs(AxesImage, **kwargs),
+            )
+        elif choice.renderer == "AxesImage":
+            im = super().imshow(
+                data,
+                **imshow_kwargs,
+                **filter_set_kwargs(AxesImage, **kwargs),
+            )
+        else:
+            if aspect is not None:
+                self.set_aspect(aspect)
+            im = self._show_on_grid(
+                data,
+                x,
+                y,
+                choice.renderer,
+                **filter_none(cmap=cmap, norm=norm, alpha=alpha, vmin=vmin, vmax=vmax),
+                **kwargs,
+            )
+        im.renderer_choice = choice
+        if recycle_key is not None and recycled is None:
+            recycle.register(im, recycle_key)
 
-        if colorbar:
+        if colorbar and recycled is None:
             divider = make_axes_locatable(self)
-            cax = divider.append_axes("right", size="5%", pad=0.05)
+            # Colorbar expects `pcolormesh` of its axes to return the mesh, not the chained axes.
+            cax = divider.append_axes("right", size="5%", pad=0.05, axes_class=MplAxes)
             fig: _t.Optional[AFigure] = self.get_figure()  # type: ignore
             if fig is None:
                 raise ValueError("The figure is None cannot add colorbar")
@@ -304,7 +528,81 @@ class AAxes(
         else:
             cbar = None
 
-        return self
+        return self.update_result(im)
+
+    def _reuse_image(self, im: AxesImage, data, imshow_kwargs: dict) -> AxesImage:
+        """Show `data` with an image of the previous page of a `FigurePool`, and its colorbar."""
+        assert self._recycled is not None
+        self.set_aspect(imshow_kwargs.get("aspect", mpl.rcParams["image.aspect"]))
+        self.add_image(im)
+        im.set_data(data)
+        extent = imshow_kwargs.get("extent")
+        im.set_extent(extent if extent is not None else default_extent(np.shape(data)[:2], im.origin))
+
+        norm = im.norm
+        vmin, vmax = imshow_kwargs.get("vmin"), imshow_kwargs.get("vmax")
+        # The colorbar is updated once at the end, not on each change of the limits.
+        with norm.callbacks.blocked():
+            if "norm" not in imshow_kwargs:
+                norm.vmin = norm.vmax = None
+            if vmin is not None or vmax is not None:
+                im.set_clim(vmin, vmax)
+            im.autoscale_None()
+
+        if im.colorbar is not None:
+            self.set_axes_locator(self._recycled.axes_locator)
+            self.figure.add_axes(im.colorbar.ax)
+        im.changed()
+        return im
+
+    def _show_on_grid(self, data, x, y, renderer: str, vmin=None, vmax=None, **kwargs):
+        """Show data with x and y as centers of the pixels with NonUniformImage or QuadMesh."""
+        x, y, data = np.asarray(x), np.asarray(y), np.asanyarray(data)
+        if renderer == "QuadMesh":
+            return super().pcolormesh(
+                x, y, data, shading="nearest", vmin=vmin, vmax=vmax, **filter_set_kwargs(QuadMesh, **kwargs)
+            )
+        # NonUniformImage requires increasing coordinates.
+        if x[-1] < x[0]:
+            x, data = x[::-1], data[:, ::-1]
+        if y[-1] < y[0]:
+            y, data = y[::-1], data[::-1]
+        im = NonUniformImage(self, interpolation="nearest", **filter_set_kwargs(NonUniformImage, **kwargs))
+        im.set_data(x, y, data)
+        im.set_clim(vmin, vmax)
+        im.autoscale_None()
+        if im.get_clip_path() is None:
+            im.set_clip_path(self.patch)
+        super().add_image(im)
+        im.sticky_edges.x[:] = [x[0], x[-1]]
+        im.sticky_edges.y[:] = [y[0], y[-1]]
+        self.update_datalim([[x[0], y[0]], [x[-1], y[-1]]])
+        self._request_autoscale_view(tight=True)
+        return im
+
+    def _imshow_pyramid(self, data, how: str, **kwargs) -> PyramidImage:
+        if how == LAZY_PYRAMID_MODE:
+            image_pyramid: ImagePyramid = StridedPyramid(data)
+        else:
+            image_pyramid = ImagePyramid(np.asanyarray(data), how=how)
+        if kwargs.get("extent") is None:
+            kwargs["extent"] = default_extent(
+                image_pyramid.shape, kwargs.get("origin") or mpl.rcParams["image.origin"]
+            )
+        vmin, vmax = kwargs.pop("vmin", None), kwargs.pop("vmax", None)
+        norm = kwargs.get("norm")
+        im = super().imshow(np.asarray(image_pyramid.level(image_pyramid.max_level)), **kwargs)
+        im = PyramidImage.from_image(im, image_pyramid)
+        # Scale the norm on the full data, so the colorbar is the same as without pyramid.
+        # Lazy data is not read entirely, the norm is scaled on a strided sample.
+        if not (isinstance(norm, Normalize) and norm.scaled()):
+            if isinstance(image_pyramid, StridedPyramid):
+                full = image_pyramid.sample()
+            else:
+                full = image_pyramid.level(0)
+            im.norm.autoscale(np.ma.masked_invalid(full, copy=False))
+        im.set_clim(vmin, vmax)
+        return im
 
     def pcolorfast(  # type: ignore
         self,
@@ -314,8 +612,21 @@ class AAxes(
         data: _t.Optional[np.ndarray] = None,
         labels: _t.Optional[dict] = None,
         colorbar: bool = True,
+        pyramid: _t.Optional[_t.Union[bool, str]] = None,
         **kwargs,
     ):
+        """Create a pseudocolor plot with a non-regular rectangular grid.
+
+        x and y can be the edges of the cells, as for Matplotlib `pcolorfast`,
+        or their centers, as for `imshow`. The fastest correct renderer is chosen
+        from the grid and stored in `renderer_choice` attribute of the result.
+
+        Args:
+            pyramid (bool | "mean" | "max" | "stride", optional): Draw a downsampled level of the data
+                that matches the pixel size of the axes, see `imshow`. Requires
+                regularly spaced x and y. Defaults to "stride" for lazily sliced arrays
+                on a regular grid and None otherwise.
+        """
         if len(args) == 1:
             data = args[0]
         elif len(args) == 3:
@@ -327,29 +638,62 @@ class AAxes(
 
         if data is None:
             raise ValueError("Data should be provided")
-        if x is not None and y is not None:
-            im = super().pcolorfast(
-                x,
-                y,
+        regular = x is None or y is None or choose_renderer(x, y).renderer == "AxesImage"
+        if pyramid is None and is_lazy_array(data) and regular:
+            pyramid = LAZY_PYRAMID_MODE
+        if pyramid:
+            return self.imshow(
                 data,
-                # **filter_set_kwargs(AxesImage, **kwargs),
+                extent=pcolorfast_extent(x, y),
+                interpolation="nearest",
+                aspect="auto",
+                colorbar=colorbar,
+                pyramid=pyramid,
+                **kwargs,
             )
+        if x is not None and y is not None:
+            choice = choose_renderer(x, y)
+            centers = np.ndim(x) == np.ndim(y) == 1 and np.shape(data)[:2] == (len(y), len(x))
+            if centers and choice.renderer == "AxesImage":
+                im = super().imshow(
+                    data,
+                    extent=[x[0], x[-1], y[0], y[-1]],
+                    origin="lower",
+                    interpolation="nearest",
+                    aspect="auto",
+                )
+            elif centers:
+                im = self._show_on_grid(data, x, y, choice.renderer)
+            elif choice.renderer == "QuadMesh" and np.ndim(x) == 1:
+                im = super().pcolormesh(x, y, data, shading="flat")
+            else:
+                # Edges of the cells: pcolorfast already picks AxesImage, PcolorImage or QuadMesh.
+                im = super().pcolorfast(
+                    x,
+                    y,
+                    data,
+                    # **filter_set_kwargs(AxesImage, **kwargs),
+                )
+                if choice.renderer == "NonUniformImage":
+                    choice = RendererChoice("PcolorImage", choice.reason)
         else:
+            choice = RendererChoice("AxesImage", "no coordinates")
             im = super().pcolorfast(
                 data,
                 # **filter_set_kwargs(AxesImage, **kwargs),
             )
+        im.renderer_choice = choice
 
         # utils.set_params(ax, **kwargs)
         divider = make_axes_locatable(self)
-        cax = divider.append_axes("right", size="5%", pad=0.05)
+        cax = divider.append_axes("right", size="5%", pad=0.05, axes_class=MplAxes)
         fig = self.get_figure()
         if fig is None:
             raise ValueError("The figure is None cannot add colorbar")
         if colorbar:
             cbar = fig.colorbar(im, cax=cax, orientation="vertical")
             cbar.ax.set_ylabel(kwargs.get("bar_label", ""))
-        return self
+        return self.update_result(im)
 
     def autoaxis(self, level: int = 0, func_name="plot") -> "AAxes":
         variables = get_auto_args(level, func_name)
@@ -368,18 +712,124 @@ class AAxes(
         keep_xlims: bool = False,
         keep_ylims: bool = False,
         axes=None,
+        decimate: _t.Optional[_t.Union[bool, str]] = None,
+        decimate_pixels: _t.Optional[int] = None,
+        collection: bool = False,
         **kwargs,
     ):
+        """Plot y versus x as lines and/or markers.
+
+        Args:
+            keep_xlims (bool): Restore the x-limits after plotting. Defaults to False.
+            keep_ylims (bool): Restore the y-limits after plotting. Defaults to False.
+            decimate (bool | "minmax" | "lttb", optional): Draw only a decimated version
+                of the visible x-range. The full data is kept and the line is re-decimated
+                when the x-limits change. True is the same as "minmax", that keeps
+                the first, min, max and last points of each pixel column. Defaults to None.
+            decimate_pixels (int, optional): Number of columns used for decimation.
+                Defaults to twice the width of the axes in pixels.
+            collection (bool): Plot 2d data of shape (n_traces, n_points) as a single
+                LineCollection. `color` and `alpha` can be given per trace. The result
+                is the LineCollection. Defaults to False.
+        """
         del axes
         xlims = self.get_xlim() if keep_xlims else None
         ylims = self.get_ylim() if keep_ylims else None
-        res = super().plot(*args, **kwargs)
+        if collection:
+            res = self._plot_collection(*args, **kwargs)
+        elif decimate:
+            res = self._plot_decimated(
+                *args,
+                mode="minmax" if decimate is True else decimate,
+                n_pixels=decimate_pixels,
+                **kwargs,
+            )
+        elif self._recycled is not None:
+            res = self._plot_recycled(args, kwargs)
+        else:
+            res = super().plot(*args, **kwargs)
         if xlims is not None:
             self.set_xlim(*xlims)
         if ylims is not None:
             self.set_ylim(*ylims)
         return res
 
+    def _plot_recycled(self, args: tuple, kwargs: dict) -> _t.List[Line2D]:
+        """Plot with a line of the previous page of a `FigurePool` if one has the same structure."""
+        assert self._recycled is not None
+        call = recycle.plot_call(args, kwargs)
+        line = self._recycled.take(call.key) if call is not None else None
+        if line is None:
+            lines = super().plot(*args, **kwargs)
+            if call is not None and len(lines) == 1:
+                recycle.register(lines[0], call.key)
+            return lines
+
+        if call.cycle_color:  # type: ignore
+            line.set_color(self._get_lines.get_next_color())
+        line.set_data(call.x, call.y)  # type: ignore
+        self.add_line(line)
+        if kwargs.get("scalex", True):
+            self._request_autoscale_view("x")
+        if kwargs.get("scaley", True):
+            self._request_autoscale_view("y")
+        return [line]
+
+    def _plot_collection(self, *args, color=None, alpha=None, **kwargs) -> LineCollection:
+        if len(args) == 1:
+            data = np.asarray(args[0])
+            x = np.arange(data.shape[-1])
+        elif len(args) == 2:
+            x, data = np.asarray(args[0]), np.asarray(args[1])
+        else:
+            raise ValueError("Collection mode supports only plot(data) or plot(x, data).")
+        data = np.atleast_2d(data)
+        if data.ndim != 2:
+            raise ValueError(f"Data should be 2d (n_traces, n_points), got {data.shape}")
+        x = np.broadcast_to(x, data.shape)
+        segments = np.stack([x, data], axis=-1)
+
+        if color is None:
+            color = self._get_lines.get_next_color()
+        colors = to_rgba_array(color)
+        colors = np.array(np.broadcast_to(colors, (len(data), 4)))
+        if alpha is not None:
+            colors[:, 3] = alpha
+
+        lc = LineCollection(segments, colors=colors, **kwargs)  # type: ignore
+        super().add_collection(lc, autolim=False)
+        with np.errstate(invalid="ignore"):
+            corners = [
+                [np.nanmin(x), np.nanmin(data)],
+                [np.nanmax(x), np.nanmax(data)],
+            ]
+        self.update_datalim(corners)
+        self.autoscale_view()
+        return lc
+
+    def _plot_decimated(self, *args, mode: str, n_pixels: _t.Optional[int], **kwargs):
+        x, y, fmt = split_plot_args(args)
+        decimated = DecimatedLine(x, y, mode=mode, n_pixels=n_pixels)
+        res = super().plot(*decimated.get_data(self), *fmt, **kwargs)
+        decimated.attach(res[0], self)
+        return res
+
+    def stream(
+        self, capacity: int, dtype: _t.Any = float, follow: bool = True, **kwargs
+    ) -> LineStream:
+        """Create a line that shows the last `capacity` appended points.
+
+        Args:
+            capacity (int): Number of points kept in the ring buffer.
+            dtype (optional): Data type of the buffer. Defaults to float.
+            follow (bool, optional): The x-limits follow the buffer content. Defaults to True.
+            **kwargs: Line properties passed to `plot`.
+
+        Returns:
+            LineStream: Handle with `append(y)` or `append(x, y)` method.
+        """
+        return LineStream(self, capacity, dtype=dtype, follow=follow, **kwargs)
+
     def axhline(self, y=0, xmin=0, xmax=1, **kwargs) -> "AAxes":  # type: ignore
         if isinstance(y, _t.Iterable):
             return self.update_result(
@@ -411,3 +861,6 @@ class AAxes(
         if label is not None:
             cbar.set_label(label)
         return self
+
+
+_install_chained_methods(AAxes)
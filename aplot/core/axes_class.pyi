@@ -1,6 +1,7 @@
 # flake8: noqa: E302, E704
 import datetime
 from typing import (
+    Any,
     Callable,
     Generic,
     Iterable,
@@ -37,7 +38,7 @@ from matplotlib.container import (
 )
 from matplotlib.contour import QuadContourSet
 from matplotlib.figure import Figure
-from matplotlib.image import AxesImage, PcolorImage
+from matplotlib.image import AxesImage, NonUniformImage, PcolorImage
 from matplotlib.lines import Line2D
 from matplotlib.markers import MarkerStyle
 from matplotlib.patches import FancyArrow, Patch, Polygon, Rectangle, StepPatch, Wedge
@@ -51,7 +52,10 @@ from matplotlib.transforms import Bbox, BboxTransformTo, Transform
 from numpy.typing import ArrayLike
 
 from .axes_list import AxesList
+from .density import DensityImage
 from .figure_class import AFigure
+from .histogram import Histogram2D
+from .stream import LineStream
 
 # from matplotlib._typing import ArrayLike, Color, Scalar
 Color = tuple[float, float, float] | str
@@ -218,7 +222,19 @@ class AAxes(MplAxes, Generic[_T]):
         linestyles: str | tuple | list = ...,
         **kwargs,
     ) -> "AAxes[list[EventCollection]]": ...
-    def plot(self, *args, scalex=..., scaley=..., data=..., **kwargs) -> "AAxes[list[Line2D]]": ...  # type: ignore
+    def plot(  # type: ignore
+        self,
+        *args,
+        scalex=...,
+        scaley=...,
+        data=...,
+        keep_xlims: bool = ...,
+        keep_ylims: bool = ...,
+        decimate: bool | Literal["minmax", "lttb"] | None = ...,
+        decimate_pixels: int | None = ...,
+        collection: bool = ...,
+        **kwargs,
+    ) -> "AAxes[list[Line2D]]": ...
     def plot_date(  # type: ignore
         self,
         x: ArrayLike,
@@ -408,8 +424,11 @@ class AAxes(MplAxes, Generic[_T]):
         *,
         edgecolors: Color = ...,
         plotnonfinite: bool = False,
+        density: bool | Literal["count", "mean"] | None = None,
+        density_norm: Literal["eq_hist", "log", "linear"] | Normalize = "eq_hist",
+        pixel_size: float = 1.0,
         **kwargs,
-    ) -> "AAxes[PathCollection]": ...
+    ) -> "AAxes[PathCollection | DensityImage]": ...
     def hexbin(  # type: ignore
         self,
         x: ArrayLike,
@@ -477,8 +496,9 @@ class AAxes(MplAxes, Generic[_T]):
         filterrad: float = 4,
         resample: bool = ...,
         url: str = ...,
+        pyramid: bool | Literal["mean", "max", "stride"] | None = ...,
         **kwargs,
-    ) -> "AAxes[AxesImage]": ...
+    ) -> "AAxes[AxesImage | NonUniformImage | QuadMesh]": ...
     def pcolor(  # type: ignore
         self,
         *args,
@@ -510,8 +530,9 @@ class AAxes(MplAxes, Generic[_T]):
         cmap: str | Colormap = ...,
         vmin: float | None = None,
         vmax: float | None = None,
+        pyramid: bool | Literal["mean", "max", "stride"] | None = ...,
         **kwargs,
-    ) -> "AAxes[tuple[AxesImage, PcolorImage, QuadMesh]]": ...
+    ) -> "AAxes[AxesImage | PcolorImage | NonUniformImage | QuadMesh]": ...
     def contour(self, *args, **kwargs) -> "AAxes[QuadContourSet]": ...  # type: ignore
     def contourf(self, *args, **kwargs) -> "AAxes[QuadContourSet]": ...  # type: ignore
     def clabel(self, CS, levels: ArrayLike = ..., **kwargs) -> "AAxes[None]": ...  # type: ignore
@@ -568,13 +589,15 @@ class AAxes(MplAxes, Generic[_T]):
     def hist2d(  # type: ignore
         self,
         x,
-        y,
+        y=None,
         bins: None | int | ArrayLike = ...,
         range=...,
         density: bool = False,
         weights=...,
         cmin: float | None = None,
         cmax: float | None = None,
+        *,
+        histogram: Histogram2D | None = None,
         **kwargs,
     ) -> (
         "AAxes[tuple[np.ndarray, np.ndarray, np.ndarray, tuple[float, float] | None]]"
@@ -865,7 +888,9 @@ class AAxes(MplAxes, Generic[_T]):
     last_result: _T = ...
     fit_result = ...
     res: _T = ...
-    def z_parametric(self, z: ArrayLike, **kwargs) -> "AAxes[Line2D]": ...
+    def z_parametric(
+        self, z: ArrayLike, *, density: bool | Literal["count", "mean"] | None = None, **kwargs
+    ) -> "AAxes[Line2D | DensityImage]": ...
     def autoaxis(self, level: int = 0, func_name: str = ...) -> "AAxes": ...
     def tight_layout(
         self: _S,
@@ -885,14 +910,23 @@ class AAxes(MplAxes, Generic[_T]):
     def colorbar(self: _Axes, *args, **kwargs) -> _Axes: ...
     def hist_z(  # type: ignore
         self,
-        z,
+        z=None,
         bins: None | int | ArrayLike = ...,
         range=...,
         density: bool = False,
         weights=...,
         cmin: float | None = None,
         cmax: float | None = None,
+        *,
+        histogram: Histogram2D | None = None,
         **kwargs,
     ) -> (
         "AAxes[tuple[np.ndarray, np.ndarray, np.ndarray, tuple[float, float] | None]]"
     ): ...
+    def stream(
+        self,
+        capacity: int,
+        dtype: Any = ...,
+        follow: bool = ...,
+        **kwargs,
+    ) -> LineStream: ...
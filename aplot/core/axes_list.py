@@ -1,9 +1,14 @@
+import functools
 import typing as _t
 
 import numpy as np
 
+from . import profiling
 from .axes_class import AAxes
+from .pyramid import lazy_item
+from .stream import StreamGroup
 from .utils import filter_set_kwargs, pop_from_dict
+from .ztransform import z_transform
 
 # from matplotlib import pyplot as plt
 
@@ -13,15 +18,20 @@ _L = _t.TypeVar("_L", bound="AxesList[AAxes]|AxesList[AxesList]")
 
 
 class AxesList(_t.List[_T]):
+    @profiling.profiled("AxesList.set")
     def set(self, **kwargs):
         kwargs = filter_set_kwargs(AAxes, **kwargs)
+        # Collect the values of each axes first, so each axes is set only once.
+        per_axes: _t.List[dict] = [{} for _ in range(len(self))]
         for k, v in kwargs.items():
             if isinstance(v, (list, tuple)) and len(self) == len(v):
-                for ax, val in zip(self, v):
-                    ax.set(**{k: val})
+                for ax_kwargs, val in zip(per_axes, v):
+                    ax_kwargs[k] = val
             else:
-                for ax in self:
-                    ax.set(**{k: v})
+                for ax_kwargs in per_axes:
+                    ax_kwargs[k] = v
+        for ax, ax_kwargs in zip(self, per_axes):
+            ax.set(**ax_kwargs)
         return self
 
     # def __getitem__(self, item):
@@ -30,10 +40,20 @@ class AxesList(_t.List[_T]):
     #         return self.__getitem__(item % len(self))[item // len(self)]
     #     return super().__getitem__(item)
 
-    def plot(self, x, data, *args, axes=None, **kwargs):
+    def plot(self, x, data, *args, axes=None, collection: bool = False, **kwargs):
         if axes is not None:
             ax = self[axes]
-            ax.plot(x, data, *args, **kwargs)
+            ax.plot(x, data, *args, collection=collection, **kwargs)
+            return self
+
+        if collection:
+            # 2d data is plotted on each axes, 3d data is split between the axes.
+            if np.ndim(data) == 3 and len(data) == len(self):
+                for i, ax in enumerate(self):
+                    ax.plot(x, data[i], *args, collection=True, **kwargs)
+            else:
+                for ax in self:
+                    ax.plot(x, data, *args, collection=True, **kwargs)
             return self
 
         if len(x) != len(data):
@@ -58,21 +78,18 @@ class AxesList(_t.List[_T]):
         z: np.ndarray,
         plot_format: _t.Literal["bode", "real_imag"] = "bode",
         unwrap: bool = False,
+        dtype: _t.Optional[_t.Any] = None,
         **kwargs,
     ):
         # if not isinstance(self[0], AxesList):
         #     raise ValueError("This method should be called on an AxesList with 2 axes")
 
         if plot_format == "bode":
-            data1 = np.abs(z)
-            data2 = np.angle(z) * 180 / np.pi
-            if unwrap:
-                data2 = np.unwrap(data2, period=360)
+            data1, data2 = z_transform(z, "bode", unwrap=unwrap, dtype=dtype)
             self[0].set_title("Amplitude")
             self[1].set_title("Phase")
         elif plot_format == "real_imag":
-            data1 = np.real(z)
-            data2 = np.imag(z)
+            data1, data2 = z_transform(z, "real_imag", dtype=dtype)
             self[0].set_title("Real")
             self[1].set_title("Imag")
         else:
@@ -91,22 +108,24 @@ class AxesList(_t.List[_T]):
         z: np.ndarray,
         plot_format: _t.Literal["bode", "real_imag"] = "bode",
         unwrap: bool = True,
+        dtype: _t.Optional[_t.Any] = None,
         # cmap: _t.Optional[str] = None,
         **kwargs,
     ):
+        """Plot complex 2d data as amplitude in dB and phase, or as real and imaginary parts.
+
+        The data to plot is computed in one pass over blocks of rows (see `z_transform`),
+        `dtype=np.float32` halves the memory of the result.
+        """
         # if not isinstance(self[0], AAxes):
         #     raise ValueError("This method should be called on an AxesList with 2 axes")
 
         if plot_format == "bode":
-            data1 = 20 * np.log10(np.abs(z))
-            data2 = np.angle(z) * 180 / np.pi
-            if unwrap:
-                data2 = np.unwrap(data2, period=360)
+            data1, data2 = z_transform(z, "bode_db", unwrap=unwrap, dtype=dtype)
             self[0].set_title("Amplitude")
             self[1].set_title("Phase")
         elif plot_format == "real_imag":
-            data1 = np.real(z)
-            data2 = np.imag(z)
+            data1, data2 = z_transform(z, "real_imag", dtype=dtype)
             self[0].set_title("Real")
             self[1].set_title("Imag")
         else:
@@ -124,16 +143,24 @@ class AxesList(_t.List[_T]):
         return self
 
     def imshow(self, data, *args, **kwargs):
+        # Maps are taken with lazy_item, so memory-mapped or other lazy stacks are not read here.
         if len(data) == len(self):
             for i, ax in enumerate(self):
-                ax.imshow(data=data[i], *args, **kwargs)
+                ax.imshow(data=lazy_item(data, i), *args, **kwargs)
         else:
             if len(data) == 1:
-                data = data[0]
+                data = lazy_item(data, 0)
             for _, ax in enumerate(self):
                 ax.imshow(data=data, *args, **kwargs)
         return self
 
+    def stream(self, capacity: int, **kwargs) -> StreamGroup:
+        """Create a stream on each axes, fed by a single `append` call.
+
+        See `AAxes.stream` for the arguments.
+        """
+        return StreamGroup([ax.stream(capacity, **kwargs) for ax in self.flat()])
+
     def tight_layout(self, *, pad=1.08, h_pad=None, w_pad=None, rect=None):
         self.figure.tight_layout(pad=pad, h_pad=h_pad, w_pad=w_pad, rect=rect)  # type: ignore
         return self
@@ -178,6 +205,9 @@ class AxesList(_t.List[_T]):
                 getattr(ax, key)(*args, **kwargs)
             return self
 
+        if profiling.active_profiler is not None:
+            return functools.partial(profiling.active_profiler.call, f"AxesList.{key}", mapping)
+
         return mapping
         # return super().__getattribute__(key)
 
@@ -218,10 +248,21 @@ class AxesList(_t.List[_T]):
                 res.append(ax)
         return AxesList(res)
 
-    def hist_z(self, z, **kwargs):
-        if len(z) == len(self):
-            for i, ax in enumerate(self):
-                ax.hist_z(z[i], **kwargs)
-            return self
-        self.map(lambda ax: ax.hist_z(z, **kwargs))
+    def hist_z(self, z=None, *, histogram=None, **kwargs):
+        """Plot the 2D histogram of complex values on each axes, see `AAxes.hist_z`.
+
+        If `z` has one element per axes, each axes shows its own element.
+        `histogram` can be a list of `Histogram2D`, one per axes, to accumulate batches.
+        """
+        if histogram is not None and not isinstance(histogram, (list, tuple)) and len(self.flat()) > 1:
+            raise ValueError("A single histogram cannot be shared by several axes, pass one per axes")
+        histograms = histogram if isinstance(histogram, (list, tuple)) else [histogram] * len(self)
+        if len(histograms) != len(self):
+            raise ValueError("histogram should contain one Histogram2D per axes")
+        if z is not None and len(z) == len(self):
+            for ax, data, hist in zip(self, z, histograms):
+                ax.hist_z(data, histogram=hist, **kwargs)
+        else:
+            for ax, hist in zip(self, histograms):
+                ax.hist_z(z, histogram=hist, **kwargs)
         return self
@@ -32,10 +32,12 @@ from matplotlib.spines import Spines
 from matplotlib.table import Table
 from matplotlib.ticker import Formatter
 from matplotlib.transforms import Bbox, BboxTransformTo, Transform
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, DTypeLike
 
 from .axes_class import AAxes
 from .figure_class import AFigure
+from .histogram import Histogram2D
+from .stream import StreamGroup
 
 # from matplotlib._typing import ArrayLike, Color, Scalar
 Color = tuple[float, float, float] | str
@@ -175,7 +177,19 @@ class AxesList(List[_T]):
         linestyles: str | tuple | list = ...,
         **kwargs,
     ) -> _S: ...
-    def plot(self: _S, *args, scalex=..., scaley=..., data=..., **kwargs) -> _S: ...  # type: ignore
+    def plot(  # type: ignore
+        self: _S,
+        *args,
+        scalex=...,
+        scaley=...,
+        data=...,
+        keep_xlims: bool = ...,
+        keep_ylims: bool = ...,
+        decimate: bool | Literal["minmax", "lttb"] | None = ...,
+        decimate_pixels: int | None = ...,
+        collection: bool = ...,
+        **kwargs,
+    ) -> _S: ...
     def plot_date(  # type: ignore
         self: _S,
         x: ArrayLike,
@@ -365,6 +379,9 @@ class AxesList(List[_T]):
         *,
         edgecolors: Color = ...,
         plotnonfinite: bool = False,
+        density: bool | Literal["count", "mean"] | None = None,
+        density_norm: Literal["eq_hist", "log", "linear"] | Normalize = "eq_hist",
+        pixel_size: float = 1.0,
         **kwargs,
     ) -> _S: ...
     def hexbin(  # type: ignore
@@ -434,6 +451,7 @@ class AxesList(List[_T]):
         filterrad: float = 4,
         resample: bool = ...,
         url: str = ...,
+        pyramid: bool | Literal["mean", "max", "stride"] | None = ...,
         **kwargs,
     ) -> _S: ...
     def pcolor(  # type: ignore
@@ -467,6 +485,7 @@ class AxesList(List[_T]):
         cmap: str | Colormap = ...,
         vmin: float | None = None,
         vmax: float | None = None,
+        pyramid: bool | Literal["mean", "max", "stride"] | None = ...,
         **kwargs,
     ) -> _S: ...
     def contour(self: _S, *args, **kwargs) -> _S: ...  # type: ignore
@@ -525,13 +544,15 @@ class AxesList(List[_T]):
     def hist2d(  # type: ignore
         self: _S,
         x,
-        y,
+        y=None,
         bins: None | int | ArrayLike = ...,
         range=...,
         density: bool = False,
         weights=...,
         cmin: float | None = None,
         cmax: float | None = None,
+        *,
+        histogram: Histogram2D | None = None,
         **kwargs,
     ) -> _S: ...
     def psd(  # type: ignore
@@ -825,7 +846,9 @@ class AxesList(List[_T]):
     last_result: _T = ...
     fit_result = ...
     res: _T = ...
-    def z_parametric(self: _S, z: ArrayLike, **kwargs) -> _S: ...
+    def z_parametric(
+        self: _S, z: ArrayLike, *, density: bool | Literal["count", "mean"] | None = None, **kwargs
+    ) -> _S: ...
     def tight_layout(
         self: _S,
         *,
@@ -841,6 +864,7 @@ class AxesList(List[_T]):
         z: ArrayLike,
         plot_format: Literal["bode", "real_imag"] = "bode",
         unwrap: bool = False,
+        dtype: DTypeLike | None = None,
         **kwargs,
     ) -> _S: ...
     def plot_z_2d(
@@ -850,6 +874,7 @@ class AxesList(List[_T]):
         z: ArrayLike,
         plot_format: Literal["bode", "real_imag"] = "bode",
         unwrap: bool = True,
+        dtype: DTypeLike | None = None,
         **kwargs,
     ) -> _S: ...
     def map(self: _S, func: Callable[[AAxes], Any]) -> _S: ...
@@ -861,14 +886,23 @@ class AxesList(List[_T]):
     def flat(self) -> "AxesList[AAxes]": ...
     def hist_z(  # type: ignore
         self,
-        z,
+        z=None,
         bins: None | int | ArrayLike = ...,
         range=...,
         density: bool = False,
         weights=...,
         cmin: float | None = None,
         cmax: float | None = None,
+        *,
+        histogram: Histogram2D | Sequence[Histogram2D] | None = None,
         **kwargs,
     ) -> (
         "AAxes[tuple[np.ndarray, np.ndarray, np.ndarray, tuple[float, float] | None]]"
     ): ...
+    def stream(
+        self,
+        capacity: int,
+        dtype: Any = ...,
+        follow: bool = ...,
+        **kwargs,
+    ) -> StreamGroup: ...
@@ -0,0 +1,149 @@
+import typing as _t
+
+import numpy as np
+
+if _t.TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.lines import Line2D
+
+DECIMATION_MODES = ("minmax", "lttb")
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Return indices of the first, min, max and last point of `y` between each pair of `edges`.
+
+    If each pair of edges is one pixel column, the line drawn through these points
+    rasterizes the same way as the full one. `x` should be sorted in increasing order.
+    """
+    starts = np.unique(np.concatenate([[0], np.searchsorted(x, edges)]))
+    starts = starts[starts < len(x)]
+    if len(x) <= 4 * len(starts):
+        return np.arange(len(x))
+    stops = np.append(starts[1:], len(x))
+    indices = np.empty((len(starts), 4), dtype=np.int64)
+    indices[:, 0], indices[:, 3] = starts, stops - 1
+    # A loop over pixel columns keeps the memory constant and costs only
+    # a few microseconds per column compared to O(N) of the reductions.
+    for i, (start, stop) in enumerate(zip(starts, stops)):
+        segment = y[start:stop]
+        indices[i, 1] = start + segment.argmin()
+        indices[i, 2] = start + segment.argmax()
+    return np.unique(indices)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return indices of the points selected by Largest-Triangle-Three-Buckets.
+
+    The first and the last points are always selected.
+    """
+    length = len(y)
+    if n_out < 3 or length <= n_out:
+        return np.arange(length)
+    edges = np.linspace(1, length - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, length - 1
+    selected = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else length
+        x_avg = x[stop:next_stop].mean() if next_stop > stop else x[-1]
+        y_avg = y[stop:next_stop].mean() if next_stop > stop else y[-1]
+        x_a, y_a = x[selected], y[selected]
+        area = np.abs(
+            (x_a - x_avg) * (y[start:stop] - y_a) - (x_a - x[start:stop]) * (y_avg - y_a)
+        )
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+    return indices
+
+
+def decimate(
+    x: np.ndarray,
+    y: np.ndarray,
+    edges: np.ndarray,
+    mode: str = "minmax",
+) -> _t.Tuple[np.ndarray, np.ndarray]:
+    """Decimate `(x, y)` to the pixel columns given by `edges`.
+
+    `x` should be sorted in increasing order. Only the points between the first and
+    the last edge are used, plus one point on each side, so the line continues
+    beyond the visible range.
+    """
+    start = max(int(np.searchsorted(x, edges[0], side="left")) - 1, 0)
+    stop = min(int(np.searchsorted(x, edges[-1], side="right")) + 1, len(x))
+    x_visible, y_visible = x[start:stop], y[start:stop]
+    if mode == "minmax":
+        indices = minmax_indices(x_visible, y_visible, edges)
+    elif mode == "lttb":
+        indices = lttb_indices(x_visible, y_visible, 2 * (len(edges) - 1))
+    else:
+        raise ValueError(f"Decimation mode should be one of {DECIMATION_MODES}, got {mode}")
+    return x_visible[indices], y_visible[indices]
+
+
+class DecimatedLine:
+    """Keep the full data of a line and redraw only its decimated version.
+
+    The line is re-decimated each time the x-limits of its axes change.
+    The object is stored on the line, so it lives as long as the line does.
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        mode: str = "minmax",
+        n_pixels: _t.Optional[int] = None,
+    ):
+        if mode not in DECIMATION_MODES:
+            raise ValueError(f"Decimation mode should be one of {DECIMATION_MODES}, got {mode}")
+        if len(x) > 1 and np.any(x[1:] < x[:-1]):
+            raise ValueError("Decimation requires x sorted in increasing order.")
+        self.x = x
+        self.y = y
+        self.mode = mode
+        self.n_pixels = n_pixels
+        self.line: _t.Optional["Line2D"] = None
+
+    def get_edges(self, ax: "Axes", xlim: _t.Optional[_t.Tuple[float, float]] = None):
+        """Return the x-edges of the pixel columns of the axes inside `xlim`."""
+        if xlim is None:
+            xlim = (self.x[0], self.x[-1]) if len(self.x) else (0, 1)
+        # Half-pixel columns absorb the misalignment between edges and the pixel grid.
+        n_pixels = self.n_pixels or max(int(np.ceil(2 * ax.bbox.width)), 1)
+        scale = ax.xaxis.get_transform()
+        edges = np.linspace(*scale.transform(sorted(xlim)), n_pixels + 1)
+        return scale.inverted().transform(edges)
+
+    def get_data(self, ax: "Axes", xlim: _t.Optional[_t.Tuple[float, float]] = None):
+        return decimate(self.x, self.y, self.get_edges(ax, xlim), mode=self.mode)
+
+    def attach(self, line: "Line2D", ax: "Axes"):
+        self.line = line
+        line._aplot_decimation = self  # type: ignore
+        ax.callbacks.connect("xlim_changed", self.update)
+
+    def update(self, ax: "Axes"):
+        if self.line is None or self.line.axes is not ax:
+            return
+        self.line.set_data(*self.get_data(ax, ax.get_xlim()))
+
+
+def split_plot_args(args: tuple) -> _t.Tuple[np.ndarray, np.ndarray, tuple]:
+    """Split `plot(*args)` arguments into x, y and the remaining format string."""
+    if args and isinstance(args[-1], str):
+        args, fmt = args[:-1], args[-1:]
+    else:
+        fmt = ()
+    if len(args) == 1:
+        y = np.asarray(args[0])
+        x = np.arange(len(y))
+    elif len(args) == 2:
+        x, y = np.asarray(args[0]), np.asarray(args[1])
+    else:
+        raise ValueError("Decimation supports only a single plot(x, y, [fmt]) call.")
+    if x.ndim != 1 or y.ndim != 1 or len(x) != len(y):
+        raise ValueError(
+            f"Decimation requires 1d x and y of the same length, got {x.shape} and {y.shape}"
+        )
+    return x, y, fmt
@@ -0,0 +1,258 @@
+import typing as _t
+
+import numpy as np
+from matplotlib.colors import LogNorm, Normalize
+from matplotlib.image import AxesImage
+
+from .histogram import BLOCK_SIZE, Histogram2D
+
+if _t.TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+DENSITY_MODES = ("count", "mean")
+DENSITY_NORMS = ("eq_hist", "log", "linear")
+
+
+class EqHistNorm(Normalize):
+    """Histogram equalization: each color is used by the same number of pixels.
+
+    The mapping is the empirical CDF of the values of the last equalized data,
+    with at most `n_levels` levels. Masked and non-finite values are ignored.
+    If `vmin` or `vmax` are given, only the values between them are equalized,
+    and the values outside are mapped to 0 or 1.
+    """
+
+    def __init__(self, vmin=None, vmax=None, clip: bool = False, n_levels: int = 256):
+        super().__init__(vmin, vmax, clip)
+        self.n_levels = n_levels
+        self.levels: _t.Optional[np.ndarray] = None
+        self.quantiles: _t.Optional[np.ndarray] = None
+        # Limits used for the current levels.
+        self._limits: _t.Optional[tuple] = None
+
+    def equalize(self, A):
+        """Compute the levels from the values of `A`, within `vmin` and `vmax` if they are set.
+
+        The limits that are not set are taken from the data. Callbacks are
+        notified only if the levels change.
+        """
+        values = np.ma.getdata(A)[~np.ma.getmaskarray(A)].ravel()
+        values = np.sort(values[np.isfinite(values)])
+        low = float(self.vmin) if self.vmin is not None else (float(values[0]) if values.size else 0.0)
+        high = float(self.vmax) if self.vmax is not None else (float(values[-1]) if values.size else 1.0)
+        values = values[(values >= low) & (values <= high)]
+        levels = np.unique(values)
+        if len(levels) > self.n_levels:
+            levels = np.unique(np.quantile(values, np.linspace(0, 1, self.n_levels)))
+        levels = np.unique(np.r_[low, levels, high])
+        if len(levels) == 1:
+            levels = np.array([levels[0], levels[0] + 1])
+        quantiles = np.searchsorted(values, levels, side="right") / max(values.size, 1)
+        span = quantiles[-1] - quantiles[0]
+        if span > 0:
+            # The lowest level is mapped to 0, so the full colormap is used.
+            quantiles = (quantiles - quantiles[0]) / span
+        else:
+            # Without values in the limits, e.g. before the first draw, the mapping is linear.
+            quantiles = np.linspace(0, 1, len(levels))
+
+        changed = not (
+            self.levels is not None
+            and self.quantiles is not None
+            and np.array_equal(levels, self.levels)
+            and np.array_equal(quantiles, self.quantiles)
+        )
+        self.levels, self.quantiles = levels, quantiles
+        with self.callbacks.blocked():
+            self.vmin, self.vmax = float(levels[0]), float(levels[-1])
+        self._limits = (self.vmin, self.vmax)
+        if changed:
+            self._changed()
+
+    def autoscale(self, A):
+        with self.callbacks.blocked():
+            self.vmin = self.vmax = None
+        self.equalize(A)
+
+    def autoscale_None(self, A):
+        if self.levels is None or self._limits != (self.vmin, self.vmax):
+            self.equalize(A)
+
+    def __call__(self, value, clip=None):
+        result, is_scalar = self.process_value(value)
+        self.autoscale_None(result)
+        assert self.levels is not None and self.quantiles is not None
+        data = np.interp(np.ma.getdata(result), self.levels, self.quantiles)
+        result = np.ma.array(data, mask=np.ma.getmask(result))
+        return result[0] if is_scalar else result
+
+    def inverse(self, value):
+        assert self.levels is not None and self.quantiles is not None
+        return np.interp(value, self.quantiles, self.levels)
+
+
+def density_norm(norm: _t.Union[str, Normalize, None], vmin=None, vmax=None) -> Normalize:
+    """Return the norm of a density image from its name, one of `DENSITY_NORMS`."""
+    if isinstance(norm, Normalize):
+        return norm
+    if norm is None or norm == "eq_hist":
+        return EqHistNorm(vmin, vmax)
+    if norm == "log":
+        return LogNorm(vmin, vmax)
+    if norm == "linear":
+        return Normalize(vmin, vmax)
+    raise ValueError(f"Density norm should be one of {DENSITY_NORMS} or a Normalize, got {norm}")
+
+
+class DensityImage(AxesImage):
+    """Image of the number of points (or of the mean value) in each pixel of the view.
+
+    Points are kept and aggregated again on each draw where the limits or the size
+    of the axes changed, so zooming shows the full resolution of the data.
+    Points can be added in chunks with `add`. Bins are uniform in data coordinates.
+
+    Args:
+        ax (Axes): Axes of the image.
+        mode ("count" | "mean", optional): Number of points per pixel, or mean of `c`.
+            Defaults to "count".
+        pixel_size (float, optional): Size of the bins in screen pixels. Defaults to 1.
+        norm (str | Normalize, optional): One of `DENSITY_NORMS` or a Normalize.
+            Defaults to "eq_hist".
+        **kwargs: Other arguments of `AxesImage`, e.g. `cmap` and `alpha`.
+    """
+
+    def __init__(
+        self,
+        ax: "Axes",
+        mode: str = "count",
+        pixel_size: float = 1.0,
+        norm: _t.Union[str, Normalize, None] = "eq_hist",
+        vmin: _t.Optional[float] = None,
+        vmax: _t.Optional[float] = None,
+        **kwargs,
+    ):
+        if mode not in DENSITY_MODES:
+            raise ValueError(f"Density mode should be one of {DENSITY_MODES}, got {mode}")
+        # The norm is scaled by the data of each aggregation, unless it was given.
+        self.auto_norm = not isinstance(norm, Normalize) and vmin is None and vmax is None
+        super().__init__(
+            ax,
+            norm=density_norm(norm, vmin, vmax),
+            origin="lower",
+            interpolation=kwargs.pop("interpolation", "nearest"),
+            **kwargs,
+        )
+        self.mode = mode
+        self.pixel_size = pixel_size
+        self.chunks: _t.List[_t.Tuple[np.ndarray, np.ndarray, _t.Optional[np.ndarray]]] = []
+        self.bounds: _t.Optional[_t.Tuple[float, float, float, float]] = None
+        self._view: _t.Optional[tuple] = None
+        self.set_data(np.ma.masked_all((1, 1)))
+
+    def add(self, x, y, c=None) -> "DensityImage":
+        """Add a chunk of points. `c` gives the values averaged in the "mean" mode."""
+        x, y = np.asarray(x).ravel(), np.asarray(y).ravel()
+        if x.shape != y.shape:
+            raise ValueError(f"x and y should have the same size, got {x.size} and {y.size}")
+        if self.mode == "mean":
+            if c is None:
+                raise ValueError("The mean density mode requires the values c")
+            c = np.asarray(c, dtype=float).ravel()
+            if c.shape != x.shape:
+                raise ValueError(f"c should have the same size as x, got {c.size} and {x.size}")
+        else:
+            c = None
+        self.chunks.append((x, y, c))
+
+        finite = np.isfinite(x) & np.isfinite(y)
+        if finite.any():
+            bounds = (x[finite].min(), x[finite].max(), y[finite].min(), y[finite].max())
+            if self.bounds is not None:
+                bounds = (
+                    min(bounds[0], self.bounds[0]),
+                    max(bounds[1], self.bounds[1]),
+                    min(bounds[2], self.bounds[2]),
+                    max(bounds[3], self.bounds[3]),
+                )
+            self.bounds = tuple(float(value) for value in bounds)  # type: ignore
+            self._extent = self.bounds
+            self.axes.update_datalim([self.bounds[::2], self.bounds[1::2]])
+            self.axes._request_autoscale_view()  # pylint: disable=protected-access
+        self._view = None
+        self.stale = True
+        return self
+
+    def __len__(self):
+        return sum(len(x) for x, _, _ in self.chunks)
+
+    def aggregate(
+        self,
+        xlim: _t.Tuple[float, float],
+        ylim: _t.Tuple[float, float],
+        shape: _t.Tuple[int, int],
+    ) -> np.ma.MaskedArray:
+        """Return the grid of shape (ny, nx) of the points in `xlim` x `ylim`.
+
+        Pixels without points are masked.
+        """
+        ny, nx = shape
+        hist = Histogram2D((nx, ny), [sorted(xlim), sorted(ylim)])
+        size = nx * ny
+        counts = np.zeros(size, dtype=np.int64)
+        sums = np.zeros(size) if self.mode == "mean" else None
+        for x, y, c in self.chunks:
+            for start in range(0, len(x), BLOCK_SIZE):
+                stop = start + BLOCK_SIZE
+                index, inside = hist.flat_indices(x[start:stop], y[start:stop])
+                index = index[inside]
+                counts += np.bincount(index, minlength=size)
+                if sums is not None and c is not None:
+                    sums += np.bincount(index, c[start:stop][inside], minlength=size)
+        empty = counts == 0
+        if sums is None:
+            grid = counts
+        else:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                grid = sums / counts
+        # Counts are (nx, ny) like in np.histogram2d, images are (ny, nx).
+        return np.ma.array(grid, mask=empty).reshape(nx, ny).T
+
+    def update_view(self):
+        """Aggregate the points again if the limits or the size of the axes changed."""
+        ax = self.axes
+        xlim, ylim = tuple(ax.get_xlim()), tuple(ax.get_ylim())
+        bbox = ax.bbox
+        shape = (
+            max(int(np.ceil(abs(bbox.height) / self.pixel_size)), 1),
+            max(int(np.ceil(abs(bbox.width) / self.pixel_size)), 1),
+        )
+        view = (xlim, ylim, shape)
+        if view == self._view:
+            return
+        self._view = view
+        grid = self.aggregate(xlim, ylim, shape)
+        self.set_data(grid)
+        norm = self.norm
+        if isinstance(norm, EqHistNorm):
+            # The colors are equalized on the visible points, within the given limits if any.
+            if self.auto_norm:
+                norm.autoscale(grid)
+            else:
+                norm.equalize(grid)
+        elif self.auto_norm:
+            limits = (norm.vmin, norm.vmax)
+            with norm.callbacks.blocked():
+                norm.vmin = norm.vmax = None
+                norm.autoscale_None(grid if not isinstance(norm, LogNorm) else np.ma.masked_less_equal(grid, 0))
+            if (norm.vmin, norm.vmax) != limits:
+                norm.callbacks.process("changed")
+
+    def draw(self, renderer, *args, **kwargs):
+        self.update_view()
+        (x0, x1), (y0, y1) = self._view[:2]  # type: ignore
+        full_extent = self._extent
+        self._extent = (min(x0, x1), max(x0, x1), min(y0, y1), max(y0, y1))
+        try:
+            return super().draw(renderer, *args, **kwargs)
+        finally:
+            self._extent = full_extent
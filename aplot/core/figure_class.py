@@ -20,6 +20,9 @@ if TYPE_CHECKING:
 
 from .axes_class import AAxes
 from .axes_list import AxesList
+from .profiling import profiled
+from .render_cache import RenderCache, get_render_cache
+from .render_stats import RenderStats, render_stats
 
 _T = TypeVar("_T")
 _F = TypeVar("_F", bound="AFigure")
@@ -28,6 +31,8 @@ _T = TypeVar("_T")
 
 
 class AFigure(MplFigure):
+    # True while `colorbar` creates its axes, which should be plain Matplotlib axes.
+    _colorbar_axes = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -38,14 +43,79 @@ class AFigure(MplFigure):
 
     def add_subplot(self, *args, **kwargs) -> AAxes:  # type: ignore
         # Ensuring that the custom axes class is used
-        if "projection" not in kwargs and "polar" not in kwargs:
+        if "projection" not in kwargs and "polar" not in kwargs and not self._colorbar_axes:
             kwargs.update({"axes_class": AAxes})
         return super().add_subplot(*args, **kwargs)
 
-    def savefig(self, fname: Any, *, transparent=None, **kwargs):  # type: ignore
-        super().savefig(fname, transparent=transparent, **kwargs)
+    def colorbar(self, mappable, cax=None, ax=None, use_gridspec=True, **kwargs):
+        """Add a colorbar, see `matplotlib.figure.Figure.colorbar`.
+
+        The axes created for the colorbar are plain Matplotlib axes: Colorbar expects
+        `pcolormesh` of its axes to return the mesh, not the chained axes.
+        """
+        self._colorbar_axes = True
+        try:
+            return super().colorbar(mappable, cax=cax, ax=ax, use_gridspec=use_gridspec, **kwargs)
+        finally:
+            self._colorbar_axes = False
+
+    def savefig(  # type: ignore
+        self,
+        fname: Any,
+        *,
+        transparent=None,
+        cache: Optional[Union[bool, RenderCache]] = None,
+        **kwargs,
+    ):
+        """Save the figure, see `matplotlib.figure.Figure.savefig`.
+
+        Args:
+            cache (bool | RenderCache, optional): Copy the file from a render cache if a figure
+                with the same structure and data was already saved. None uses the cache set
+                with `set_render_cache` if any, False disables it. Defaults to None.
+        """
+        render_cache = get_render_cache() if cache is None or cache is True else cache
+        if cache is True and render_cache is None:
+            raise ValueError("No render cache is set, use set_render_cache first")
+        if not render_cache:
+            super().savefig(fname, transparent=transparent, **kwargs)
+            return self
+
+        def save(target):
+            super(AFigure, self).savefig(target, transparent=transparent, **kwargs)
+
+        render_cache.savefig(self, fname, save, transparent=transparent, **kwargs)
         return self
 
+    def render_stats(
+        self,
+        fmt: str = "png",
+        dpi: Optional[float] = None,
+        tight_layout: bool = False,
+        **kwargs,
+    ) -> RenderStats:
+        """Save the figure once to memory and time the drawing of each axes and artist.
+
+        Args:
+            fmt (str, optional): Format of the file. Defaults to "png".
+            dpi (float, optional): Resolution. Defaults to the figure dpi.
+            tight_layout (bool, optional): Call and time `tight_layout` before saving.
+                The time of the layout engine of the figure, if any, is always reported.
+                Defaults to False.
+            **kwargs: Other arguments of `savefig`, e.g. `bbox_inches`.
+
+        Returns:
+            RenderStats: Times of the layout, of the draw and of the encoding, and draw times
+                of the artists sorted by self time. Tick labels are part of the time of their axis.
+
+        Example:
+            ```
+                stats = ap.axs(1, 2).imshow(maps).fig.render_stats()
+                print(stats.table(limit=10))
+            ```
+        """
+        return render_stats(self, fmt=fmt, dpi=dpi, tight_layout=tight_layout, **kwargs)
+
     def tight_layout(self, *args, **kwargs):  # type: ignore
         super().tight_layout(*args, **kwargs)
         return self
@@ -62,7 +132,7 @@ class AFigure(MplFigure):
     def add_axes(self, ax: _T) -> _T: ...  # type: ignore
 
     def add_axes(self, *args, **kwargs):  # type: ignore
-        if "projection" not in kwargs and "polar" not in kwargs:
+        if "projection" not in kwargs and "polar" not in kwargs and not self._colorbar_axes:
             kwargs.update({"axes_class": AAxes})
         return super().add_axes(*args, **kwargs)  # type: ignore
 
@@ -73,6 +143,7 @@ class AFigure(MplFigure):
     def axes(self) -> "AxesList[AAxes]":  # type: ignore
         return AxesList(self._axstack.as_list())  # type: ignore
 
+    @profiled("AFigure.label_axes")
     def label_axes(
         self: _F,
         labels: Union[
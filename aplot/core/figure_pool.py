@@ -0,0 +1,265 @@
+"""Reuse figures with the same layout for the pages of a report.
+
+Example:
+    ```
+        pool = ap.FigurePool(2, 2, figsize=(8, 6))
+        for record in records:
+            with pool.page() as (fig, axs):
+                axs[0][0].plot(record.time, record.signal).set(title=record.name)
+                axs[0][1].imshow(record.map)
+                fig.savefig(f"{record.name}.png")
+    ```
+"""
+
+import contextlib
+import typing as _t
+
+from matplotlib.transforms import Bbox
+
+from .axes_class import AAxes
+from .figure_class import AFigure
+from .front import layout_axes
+from .recycle import RecycledArtists
+
+# Attributes of the figure holding the texts of `suptitle`, `supxlabel` and `supylabel`.
+_SUPER_LABELS = ("_suptitle", "_supxlabel", "_supylabel")
+_SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+# Arguments of `ap.subplots` that are not passed to the figure.
+_SUBPLOTS_KWARGS = ("sharex", "sharey", "squeeze", "width_ratios", "height_ratios", "subplot_kw", "gridspec_kw")
+
+
+class _AxisState(_t.NamedTuple):
+    scale: str
+    major_locator: _t.Any
+    minor_locator: _t.Any
+    major_formatter: _t.Any
+    minor_formatter: _t.Any
+
+
+class _AxesState(_t.NamedTuple):
+    """State of an axes of the template, restored by `FigurePool.acquire`."""
+
+    xlim: _t.Tuple[float, float]
+    ylim: _t.Tuple[float, float]
+    autoscale: _t.Tuple[bool, bool]
+    margins: _t.Tuple[float, float]
+    aspect: _t.Any
+    axes_locator: _t.Any
+    axes: _t.Tuple[_AxisState, _AxisState]
+
+    @classmethod
+    def of(cls, ax: AAxes) -> "_AxesState":
+        return cls(
+            ax.get_xlim(),
+            ax.get_ylim(),
+            (ax.get_autoscalex_on(), ax.get_autoscaley_on()),
+            ax.margins(),
+            ax.get_aspect(),
+            ax.get_axes_locator(),
+            tuple(  # type: ignore
+                _AxisState(
+                    axis.get_scale(),
+                    axis.get_major_locator(),
+                    axis.get_minor_locator(),
+                    axis.get_major_formatter(),
+                    axis.get_minor_formatter(),
+                )
+                for axis in (ax.xaxis, ax.yaxis)
+            ),
+        )
+
+
+class _FigureState(_t.NamedTuple):
+    axes: _t.List[AAxes]
+    states: _t.List[_AxesState]
+    layout: _t.Any
+    size: _t.Tuple[float, float]
+    subplot_params: _t.Dict[str, float]
+    layout_engine: _t.Any
+
+
+def _reset_axes(ax: AAxes, state: _AxesState):
+    recycled = ax._recycled  # pylint: disable=protected-access
+    assert recycled is not None
+    recycled.clear()
+    recycled.axes_locator = ax.get_axes_locator()
+    for artists in (ax.lines, ax.images):
+        for artist in list(artists):
+            artist.remove()
+            if getattr(artist, "_recycle_key", None) is not None:
+                recycled.add(artist)
+    for artists in (ax.collections, ax.patches, ax.texts, ax.tables, ax.artists):
+        for artist in list(artists):
+            artist.remove()
+    for child in list(ax.child_axes):
+        child.remove()
+    if ax.legend_ is not None:
+        ax.legend_.remove()
+    ax.containers.clear()
+
+    for loc in ("left", "center", "right"):
+        ax.set_title("", loc=loc)
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_prop_cycle(None)
+    for axis, set_scale, axis_state in zip((ax.xaxis, ax.yaxis), (ax.set_xscale, ax.set_yscale), state.axes):
+        if axis.get_scale() != axis_state.scale:
+            set_scale(axis_state.scale)
+        if axis.get_major_locator() is not axis_state.major_locator:
+            axis.set_major_locator(axis_state.major_locator)
+        if axis.get_minor_locator() is not axis_state.minor_locator:
+            axis.set_minor_locator(axis_state.minor_locator)
+        if axis.get_major_formatter() is not axis_state.major_formatter:
+            axis.set_major_formatter(axis_state.major_formatter)
+        if axis.get_minor_formatter() is not axis_state.minor_formatter:
+            axis.set_minor_formatter(axis_state.minor_formatter)
+    if ax.get_aspect() != state.aspect:
+        ax.set_aspect(state.aspect)
+    if ax.margins() != state.margins:
+        ax.margins(*state.margins)
+    ax.set_axes_locator(state.axes_locator)
+    spec = ax.get_subplotspec()
+    if spec is not None:
+        ax.set_subplotspec(spec)
+
+    ax.dataLim.set_points(Bbox.null().get_points())
+    ax.ignore_existing_data_limits = True
+    ax.set_xlim(state.xlim)
+    ax.set_ylim(state.ylim)
+    ax.set_autoscalex_on(state.autoscale[0])
+    ax.set_autoscaley_on(state.autoscale[1])
+    ax._last_result = None  # pylint: disable=protected-access
+
+
+class FigurePool:
+    """Reuse figures with the same layout for the pages of a report.
+
+    Creating a figure, its GridSpec, axes, tick machinery and colorbar axes is a large
+    fixed cost when each page of a report plots little data. The pool builds the layout
+    once per figure. `acquire` returns an idle figure reset to the state of the template,
+    and `release` gives it back to the pool.
+
+    On the axes of a pooled figure, `plot` of a single line and `imshow` of a regular
+    grid reuse the Line2D or the AxesImage, with its colorbar axes, drawn on the previous
+    page by a call with the same arguments except the data. Their data is replaced
+    with `set_data`, and the properties changed after that call are set back to their
+    values at creation. The other artists are removed on reset.
+
+    The reset restores the titles, labels, limits, scales, tick locators and formatters,
+    aspect and position of the axes, and removes the figure texts, legends and the axes
+    added by the page. Other properties changed by a page, e.g. `grid` or `tick_params`,
+    are kept. Pooled figures are not registered in pyplot: they are not shown by `ap.show`
+    and do not need to be closed.
+
+    Args:
+        nrows (int, optional): Number of rows of the layout. Defaults to 1.
+        ncols (int, optional): Number of columns of the layout. Defaults to 1.
+        max_idle (int, optional): Number of idle figures kept by the pool.
+            Figures released beyond that are dropped. Defaults to 4.
+        **kwargs: Other arguments of `ap.subplots`, e.g. `figsize`, `sharex` or `gridspec_kw`.
+    """
+
+    def __init__(self, nrows: int = 1, ncols: int = 1, max_idle: int = 4, **kwargs):
+        self.nrows = nrows
+        self.ncols = ncols
+        self.max_idle = max_idle
+        self._subplots_kwargs = {key: kwargs.pop(key) for key in _SUBPLOTS_KWARGS if key in kwargs}
+        self._figure_kwargs = kwargs
+        self._idle: _t.List[AFigure] = []
+        self._states: _t.Dict[AFigure, _FigureState] = {}
+        self.created = 0
+        self.reused = 0
+
+    def _build(self) -> AFigure:
+        fig = AFigure(**self._figure_kwargs)
+        axes = fig.subplots(self.nrows, self.ncols, **self._subplots_kwargs)
+        template = fig.get_axes()
+        for ax in template:
+            ax._recycled = RecycledArtists()  # pylint: disable=protected-access
+        params = fig.subplotpars
+        self._states[fig] = _FigureState(
+            template,
+            [_AxesState.of(ax) for ax in template],  # type: ignore
+            layout_axes(self.nrows, self.ncols, axes),
+            tuple(fig.get_size_inches()),  # type: ignore
+            {key: getattr(params, key) for key in _SUBPLOT_PARAMS},
+            fig.get_layout_engine(),
+        )
+        self.created += 1
+        return fig
+
+    def _reset(self, fig: AFigure):
+        state = self._states[fig]
+        for artists in (fig.texts, fig.lines, fig.patches, fig.images, fig.legends, fig.artists):
+            for artist in list(artists):
+                artist.remove()
+        for name in _SUPER_LABELS:
+            setattr(fig, name, None)
+        for ax in fig.get_axes():
+            if not any(ax is template for template in state.axes):
+                fig.delaxes(ax)
+
+        if fig.get_layout_engine() is not state.layout_engine:
+            fig.set_layout_engine(state.layout_engine)
+        if tuple(fig.get_size_inches()) != state.size:
+            fig.set_size_inches(state.size)
+        params = fig.subplotpars
+        if any(getattr(params, key) != value for key, value in state.subplot_params.items()):
+            params.update(**state.subplot_params)
+        for ax, ax_state in zip(state.axes, state.states):
+            _reset_axes(ax, ax_state)
+        fig.stale = True
+
+    def acquire(self) -> AFigure:
+        """Return a figure with a clean layout, reused from the pool if one is idle."""
+        if not self._idle:
+            return self._build()
+        fig = self._idle.pop()
+        self._reset(fig)
+        self.reused += 1
+        return fig
+
+    def release(self, fig: AFigure):
+        """Give a figure back to the pool. It should not be used after that."""
+        if fig not in self._states:
+            raise ValueError("The figure was not acquired from this pool")
+        if any(fig is idle for idle in self._idle):
+            raise ValueError("The figure was already released")
+        if len(self._idle) >= self.max_idle:
+            del self._states[fig]
+            return
+        self._idle.append(fig)
+
+    def axes(self, fig: AFigure):
+        """Return the axes of the layout of a pooled figure, as returned by `ap.subplots`."""
+        return self._states[fig].layout
+
+    @contextlib.contextmanager
+    def page(self) -> _t.Iterator[_t.Tuple[AFigure, _t.Any]]:
+        """Acquire a figure for a `with` block and release it at the end.
+
+        Yields:
+            Tuple: The figure and its axes, as returned by `ap.subplots`.
+        """
+        fig = self.acquire()
+        try:
+            yield fig, self.axes(fig)
+        finally:
+            self.release(fig)
+
+    def clear(self):
+        """Drop the idle figures."""
+        for fig in self._idle:
+            del self._states[fig]
+        self._idle = []
+
+    @property
+    def idle(self) -> int:
+        """Number of idle figures."""
+        return len(self._idle)
+
+    def __repr__(self):
+        return (
+            f"FigurePool({self.nrows}x{self.ncols}, idle={self.idle}, "
+            f"created={self.created}, reused={self.reused})"
+        )
@@ -62,14 +62,19 @@ def subplots(
         gridspec_kw=gridspec_kw,  # type: ignore
         **fig_kw,
     )
+    return fig, layout_axes(nrows, ncols, axes)
+
+
+def layout_axes(nrows: int, ncols: int, axes):
+    """Wrap the axes returned by `Figure.subplots` into (nested) AxesList."""
     if nrows == 1 and ncols == 1:
-        return fig, axes
+        return axes
     if nrows == 1 or ncols == 1:
-        return fig, AxesList(axes)
+        return AxesList(axes)
     res = []
     for row in axes:
         res.append(AxesList(row))
-    return fig, AxesList(res)
+    return AxesList(res)
 
 
 def axs(
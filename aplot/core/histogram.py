@@ -0,0 +1,240 @@
+import typing as _t
+
+import numpy as np
+from matplotlib.axes import Axes as MplAxes
+
+if _t.TYPE_CHECKING:
+    from matplotlib.collections import QuadMesh
+
+BLOCK_SIZE = 1 << 20
+
+_Bins = _t.Union[int, _t.Sequence[int], np.ndarray, _t.Sequence[np.ndarray]]
+_Range = _t.Optional[_t.Sequence[_t.Sequence[float]]]
+
+
+def _axis_bins(bins, axis: int) -> _t.Union[int, np.ndarray]:
+    # Same convention as `np.histogram2d`: two elements are the bins of each axis.
+    if not np.iterable(bins):
+        return int(bins)
+    if len(bins) == 2:
+        bins = bins[axis]
+        return int(bins) if np.ndim(bins) == 0 else np.asarray(bins, dtype=float)
+    return np.asarray(bins, dtype=float)
+
+
+def _data_range(values: np.ndarray) -> _t.Tuple[float, float]:
+    finite = values[np.isfinite(values)]
+    if not finite.size:
+        return 0.0, 1.0
+    low, high = float(finite.min()), float(finite.max())
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return low, high
+
+
+class _Axis:
+    """Bins of one axis. Uniform bins are indexed arithmetically, others with searchsorted."""
+
+    def __init__(self, bins: _t.Union[int, np.ndarray], value_range: _t.Optional[_t.Sequence[float]]):
+        self.uniform = np.ndim(bins) == 0
+        self.edges: _t.Optional[np.ndarray] = None
+        self.bins = int(bins) if self.uniform else len(bins) - 1  # type: ignore
+        if not self.uniform:
+            self.set_edges(np.asarray(bins, dtype=float))
+        elif value_range is not None:
+            self.set_edges(np.linspace(value_range[0], value_range[1], self.bins + 1))
+
+    def set_edges(self, edges: np.ndarray):
+        if np.any(np.diff(edges) < 0):
+            raise ValueError("Bin edges should increase monotonically")
+        self.edges = edges
+        self.low, self.high = float(edges[0]), float(edges[-1])
+        self.scale = self.bins / (self.high - self.low) if self.high > self.low else 0.0
+
+    def indices(self, values: np.ndarray) -> _t.Tuple[np.ndarray, np.ndarray]:
+        """Return the bin of each value and the mask of the values inside the range.
+
+        Like `np.histogram`, the last bin includes its right edge.
+        """
+        assert self.edges is not None
+        inside = (values >= self.low) & (values <= self.high)
+        if not self.uniform:
+            index = np.searchsorted(self.edges, values, side="right") - 1
+            np.minimum(index, self.bins - 1, out=index)
+            return index, inside
+        with np.errstate(invalid="ignore"):
+            index = ((values - self.low) * self.scale).astype(np.intp)
+        np.clip(index, 0, self.bins - 1, out=index)
+        # Same correction as `np.histogram`, for values next to the edges.
+        index -= values < self.edges[index]
+        index += (values >= self.edges[index + 1]) & (index != self.bins - 1)
+        return index, inside
+
+
+class Histogram2D:
+    """2D histogram with fixed bins, accumulated over several calls of `add`.
+
+    The bin of each point is computed arithmetically for uniform bins, and the counts
+    are accumulated with `np.bincount`, which is much faster than `np.histogram2d` for
+    large data. Data is processed in blocks, so the temporaries have a fixed size.
+    The histogram is drawn as a `QuadMesh` that is updated in place by later draws.
+
+    Args:
+        bins (int | [int, int] | array | [array, array], optional): Number of bins or bin edges,
+            for both axes or for each axis, as in `np.histogram2d`. Defaults to 10.
+        range ([[xmin, xmax], [ymin, ymax]], optional): Range of uniform bins.
+            If None, the range is taken from the data of the first call of `add`,
+            and the points of later calls outside of it are not counted.
+        weights_dtype (optional): Type of the counts when weights are used. Defaults to float.
+        block_size (int, optional): Number of points processed at once.
+
+    Example:
+        ```
+            hist = ap.Histogram2D(bins=200, range=[[-1, 1], [-1, 1]])
+            ax = ap.ax()
+            for shots in acquisition:
+                ax.hist_z(shots, histogram=hist)  # adds the shots and updates the image
+        ```
+    """
+
+    def __init__(
+        self,
+        bins: _Bins = 10,
+        range: _Range = None,  # pylint: disable=redefined-builtin
+        weights_dtype: _t.Any = float,
+        block_size: int = BLOCK_SIZE,
+    ):
+        self.axes = tuple(
+            _Axis(_axis_bins(bins, axis), None if range is None else range[axis]) for axis in (0, 1)
+        )
+        self.weights_dtype = weights_dtype
+        self.block_size = block_size
+        self.counts = np.zeros((self.axes[0].bins, self.axes[1].bins), dtype=np.int64)
+        self.mesh: _t.Optional["QuadMesh"] = None
+        self._autoscale = True
+
+    @property
+    def shape(self) -> _t.Tuple[int, int]:
+        return self.counts.shape  # type: ignore
+
+    @property
+    def xedges(self) -> np.ndarray:
+        if self.axes[0].edges is None:
+            raise ValueError("The range is not known yet, add some data first")
+        return self.axes[0].edges
+
+    @property
+    def yedges(self) -> np.ndarray:
+        if self.axes[1].edges is None:
+            raise ValueError("The range is not known yet, add some data first")
+        return self.axes[1].edges
+
+    @property
+    def total(self):
+        """Number of points (or sum of the weights) inside the bins."""
+        return self.counts.sum()
+
+    def add(self, x, y=None, weights=None) -> "Histogram2D":
+        """Add points to the histogram.
+
+        Args:
+            x (array): x coordinates, or complex values if `y` is None.
+            y (array, optional): y coordinates.
+            weights (array, optional): Weight of each point. The counts become floats.
+        """
+        if y is None:
+            z = np.asarray(x).ravel()
+            x, y = z.real, z.imag
+        x, y = np.asarray(x).ravel(), np.asarray(y).ravel()
+        if x.shape != y.shape:
+            raise ValueError(f"x and y should have the same size, got {x.size} and {y.size}")
+        if weights is not None:
+            weights = np.asarray(weights).ravel()
+            if self.counts.dtype.kind in "iu":
+                self.counts = self.counts.astype(self.weights_dtype)
+        for axis, values in zip(self.axes, (x, y)):
+            if axis.edges is None:
+                axis.set_edges(np.linspace(*_data_range(values), axis.bins + 1))
+
+        flat_counts = self.counts.reshape(-1)
+        size = flat_counts.size
+        for start in range(0, x.size, self.block_size):
+            stop = start + self.block_size
+            index, inside = self.flat_indices(x[start:stop], y[start:stop])
+            if weights is None:
+                flat_counts += np.bincount(index[inside], minlength=size)
+            else:
+                flat_counts += np.bincount(index[inside], weights[start:stop][inside], minlength=size).astype(
+                    self.counts.dtype, copy=False
+                )
+        return self
+
+    def flat_indices(self, x: np.ndarray, y: np.ndarray) -> _t.Tuple[np.ndarray, np.ndarray]:
+        """Return the index of the bin of each point in `counts.ravel()` and the mask of the points inside."""
+        ix, inside_x = self.axes[0].indices(x)
+        iy, inside_y = self.axes[1].indices(y)
+        return ix * self.axes[1].bins + iy, inside_x & inside_y
+
+    def add_z(self, z, weights=None) -> "Histogram2D":
+        """Add complex points, e.g. IQ shots, with the real part on x and the imaginary part on y."""
+        return self.add(z, weights=weights)
+
+    def reset(self) -> "Histogram2D":
+        self.counts[...] = 0
+        return self
+
+    def values(
+        self,
+        density: bool = False,
+        cmin: _t.Optional[float] = None,
+        cmax: _t.Optional[float] = None,
+    ) -> np.ndarray:
+        """Return the counts, normalized as in `np.histogram2d` if `density`.
+
+        Bins with values below `cmin` or above `cmax` are set to NaN, as in `Axes.hist2d`.
+        With `density`, the normalized values are compared.
+        """
+        values = self.counts
+        if density:
+            area = np.diff(self.xedges)[:, None] * np.diff(self.yedges)[None, :]
+            values = values / max(values.sum(), 1) / area
+        if cmin is not None or cmax is not None:
+            values = values.astype(float)
+            with np.errstate(invalid="ignore"):
+                if cmin is not None:
+                    values[values < cmin] = np.nan
+                if cmax is not None:
+                    values[values > cmax] = np.nan
+        return values
+
+    def draw(
+        self,
+        ax: MplAxes,
+        density: bool = False,
+        cmin: _t.Optional[float] = None,
+        cmax: _t.Optional[float] = None,
+        **kwargs,
+    ) -> _t.Tuple[np.ndarray, np.ndarray, np.ndarray, "QuadMesh"]:
+        """Draw the histogram on `ax`, or update the mesh of the previous draw on the same axes.
+
+        Returns:
+            Tuple: counts, xedges, yedges and the mesh, like `Axes.hist2d`.
+        """
+        values = self.values(density, cmin, cmax)
+        mesh = self.mesh
+        if mesh is not None and mesh.axes is ax and mesh.get_array().shape == values.T.shape:
+            mesh.set_array(values.T)
+            if self._autoscale:
+                mesh.norm.vmin = mesh.norm.vmax = None
+                mesh.autoscale_None()
+            return values, self.xedges, self.yedges, mesh
+
+        mesh = MplAxes.pcolormesh(ax, self.xedges, self.yedges, values.T, **kwargs)
+        ax.set_xlim(self.xedges[0], self.xedges[-1])
+        ax.set_ylim(self.yedges[0], self.yedges[-1])
+        self.mesh = mesh
+        self._autoscale = not any(key in kwargs for key in ("vmin", "vmax", "norm"))
+        return values, self.xedges, self.yedges, mesh
+
+    def __repr__(self):
+        return f"Histogram2D(shape={self.shape}, total={self.total})"
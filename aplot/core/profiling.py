@@ -0,0 +1,203 @@
+"""Time the aplot calls of a block of code.
+
+The chained methods of `AAxes`, the methods mapped over an `AxesList`, `AxesList.set`
+and `AFigure.label_axes` report to the active profiler. Without an active profiler
+they only check a module attribute, so profiling costs nothing when it is not used.
+
+Example:
+    ```
+        import aplot as ap
+
+        with ap.profile() as prof:
+            ap.axs(2, 2).plot(x, y).imshow(data).set(title="Map").fig.label_axes()
+        print(prof.table())
+        prof.to_json("profile.json")
+    ```
+"""
+
+import functools
+import json
+import time
+import typing as _t
+
+# Profiler of the current `with` block, None when profiling is disabled.
+active_profiler: _t.Optional["Profiler"] = None
+
+
+class CallStats:
+    """Statistics of one method.
+
+    Args:
+        name (str): Qualified name of the method, e.g. "AAxes.plot".
+        count (int): Number of calls.
+        total_time (float): Cumulative time in seconds, including the nested aplot calls.
+        self_time (float): Time in seconds spent outside the nested aplot calls.
+        array_elements (int): Total number of elements of the array arguments.
+        max_array_elements (int): Number of elements of the largest array argument.
+    """
+
+    __slots__ = ("name", "count", "total_time", "self_time", "array_elements", "max_array_elements")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.array_elements = 0
+        self.max_array_elements = 0
+
+    def to_dict(self) -> _t.Dict[str, _t.Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self):
+        return f"CallStats({self.name}, count={self.count}, total_time={self.total_time:.6f})"
+
+
+def _array_elements(values: _t.Iterable[_t.Any]) -> _t.List[int]:
+    sizes = []
+    for value in values:
+        shape = getattr(value, "shape", None)
+        if isinstance(shape, tuple):
+            size = 1
+            for dim in shape:
+                size *= int(dim)
+            sizes.append(size)
+    return sizes
+
+
+class Profiler:
+    """Collect call counts, times and argument sizes of aplot methods.
+
+    Use it as a context manager, see `profile`. Profilers can be nested,
+    the outer one is restored at the end of the inner block. Self times
+    assume that the calls are made from a single thread.
+    """
+
+    def __init__(self):
+        self.stats: _t.Dict[str, CallStats] = {}
+        self._children: _t.List[float] = []
+        self._depth: _t.Dict[str, int] = {}
+        self._previous: _t.Optional["Profiler"] = None
+        self.wall_time = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> "Profiler":
+        global active_profiler  # pylint: disable=global-statement
+        self._previous, active_profiler = active_profiler, self
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        global active_profiler  # pylint: disable=global-statement
+        self.wall_time += time.perf_counter() - self._start
+        active_profiler, self._previous = self._previous, None
+
+    def call(self, name: str, func: _t.Callable, *args, **kwargs):
+        """Call `func(*args, **kwargs)` and record it under `name`."""
+        depth = self._depth.get(name, 0)
+        self._depth[name] = depth + 1
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            self._depth[name] = depth
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = CallStats(name)
+            stats.count += 1
+            stats.self_time += elapsed - children
+            # Recursive calls are already included in the time of the outer call.
+            if depth == 0:
+                stats.total_time += elapsed
+            sizes = _array_elements(args) + _array_elements(kwargs.values())
+            if sizes:
+                stats.array_elements += sum(sizes)
+                stats.max_array_elements = max(stats.max_array_elements, *sizes)
+
+    def sorted_stats(self, sort: str = "total_time") -> _t.List[CallStats]:
+        """Return the statistics sorted in decreasing order of one of the `CallStats` fields."""
+        if sort not in CallStats.__slots__:
+            raise ValueError(f"sort should be one of {CallStats.__slots__}, got {sort}")
+        return sorted(self.stats.values(), key=lambda stats: getattr(stats, sort), reverse=sort != "name")
+
+    def table(self, sort: str = "total_time", limit: _t.Optional[int] = None) -> str:
+        """Return the statistics as a text table, sorted by `sort`."""
+        rows = self.sorted_stats(sort)[:limit]
+        width = max([len("method")] + [len(stats.name) for stats in rows])
+        lines = [
+            f"{'method':<{width}} {'calls':>7} {'total, ms':>10} {'self, ms':>10} "
+            f"{'per call, ms':>12} {'array elements':>15} {'max array':>10}"
+        ]
+        for stats in rows:
+            lines.append(
+                f"{stats.name:<{width}} {stats.count:>7} {stats.total_time * 1e3:>10.3f} "
+                f"{stats.self_time * 1e3:>10.3f} {stats.total_time / stats.count * 1e3:>12.4f} "
+                f"{stats.array_elements:>15} {stats.max_array_elements:>10}"
+            )
+        lines.append(f"Wall time of the block: {self.wall_time * 1e3:.3f} ms")
+        return "\n".join(lines)
+
+    def to_dict(self) -> _t.Dict[str, _t.Any]:
+        return {
+            "wall_time": self.wall_time,
+            "calls": [stats.to_dict() for stats in self.sorted_stats()],
+        }
+
+    def to_json(self, path: _t.Optional[str] = None, **kwargs) -> str:
+        """Return the statistics as JSON and write them to `path` if given.
+
+        `kwargs` are passed to `json.dumps`, e.g. `indent=2`.
+        """
+        text = json.dumps(self.to_dict(), **kwargs)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+        return text
+
+    def reset(self):
+        self.stats = {}
+        self.wall_time = 0.0
+
+    def __repr__(self):
+        return f"Profiler({len(self.stats)} methods, wall_time={self.wall_time:.6f})"
+
+
+def profile() -> Profiler:
+    """Profile the aplot calls made inside a `with` block.
+
+    Records, per method, the number of calls, the cumulative and self time
+    and the sizes of the array arguments.
+
+    Returns:
+        Profiler: Context manager holding the statistics, see `Profiler.table`
+            and `Profiler.to_json`.
+
+    Example:
+        ```
+            with ap.profile() as prof:
+                ap.axs(1, 2).imshow(maps).set(title="Maps")
+            print(prof.table(limit=10))
+        ```
+    """
+    return Profiler()
+
+
+def profiled(name: str) -> _t.Callable[[_t.Callable], _t.Callable]:
+    """Decorate a method so its calls are reported to the active profiler under `name`."""
+
+    def decorator(func: _t.Callable) -> _t.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = active_profiler
+            if profiler is None:
+                return func(*args, **kwargs)
+            return profiler.call(name, func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,246 @@
+import typing as _t
+
+import numpy as np
+from matplotlib.image import AxesImage
+
+PYRAMID_MODES = ("mean", "max")
+LAZY_PYRAMID_MODE = "stride"
+
+
+def _pool_axis(data: np.ndarray, axis: int, how: str) -> np.ndarray:
+    """Pool pairs of elements along `axis`. An odd last element is kept as it is."""
+    length = data.shape[axis]
+    half = length // 2
+    shape = list(data.shape)
+    shape[axis] = half + length % 2
+    dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.float64
+    out = np.empty(shape, dtype=dtype)
+
+    def take(start, stop=None, step=None):
+        index = [slice(None)] * data.ndim
+        index[axis] = slice(start, stop, step)
+        return tuple(index)
+
+    body = out[take(0, half)]
+    if how == "mean":
+        np.add(data[take(0, 2 * half, 2)], data[take(1, 2 * half, 2)], out=body)
+        body *= 0.5
+    else:
+        np.maximum(data[take(0, 2 * half, 2)], data[take(1, 2 * half, 2)], out=body)
+    if length % 2:
+        out[take(half, None)] = data[take(length - 1, None)]
+    return out
+
+
+def pool2(data: np.ndarray, how: str = "mean") -> np.ndarray:
+    """Downsample a 2d array by 2 in each direction with mean or max pooling."""
+    if how not in PYRAMID_MODES:
+        raise ValueError(f"Pyramid mode should be one of {PYRAMID_MODES}, got {how}")
+    if data.shape[0] > 1:
+        data = _pool_axis(data, 0, how)
+    if data.shape[1] > 1:
+        data = _pool_axis(data, 1, how)
+    return data
+
+
+class ImagePyramid:
+    """Downsampled versions of a 2d array, built lazily with mean or max pooling.
+
+    Level 0 is the original array (not copied), each next level is twice smaller
+    in each direction. Levels are computed on the first request and cached.
+    """
+
+    def __init__(self, data: np.ndarray, how: str = "mean", min_size: int = 64):
+        if how not in PYRAMID_MODES:
+            raise ValueError(f"Pyramid mode should be one of {PYRAMID_MODES}, got {how}")
+        if np.ndim(data) != 2:
+            raise ValueError(f"Pyramid mode requires 2d data, got {np.shape(data)}")
+        self.how = how
+        self.levels: _t.List[np.ndarray] = [data]
+        self.max_level = max(int(np.floor(np.log2(max(max(data.shape), 1) / min_size))), 0)
+
+    @property
+    def shape(self) -> _t.Tuple[int, int]:
+        return self.levels[0].shape  # type: ignore
+
+    def level(self, k: int) -> np.ndarray:
+        k = min(max(k, 0), self.max_level)
+        while len(self.levels) <= k:
+            self.levels.append(pool2(self.levels[-1], self.how))
+        return self.levels[k]
+
+    def level_for(self, data_per_pixel: float) -> int:
+        """Return the coarsest level that still has at least one data point per pixel."""
+        if not np.isfinite(data_per_pixel) or data_per_pixel < 2:
+            return 0
+        return min(int(np.floor(np.log2(data_per_pixel))), self.max_level)
+
+
+class StridedView:
+    """Every `step`-th row and column of a sliceable array, read only when sliced."""
+
+    def __init__(self, data, step: int):
+        self.data = data
+        self.step = step
+        self.shape = tuple(-(-length // step) for length in data.shape)
+
+    def __getitem__(self, index: _t.Tuple[slice, slice]) -> np.ndarray:
+        step = self.step
+        rows, cols = (
+            slice((s.start or 0) * step, None if s.stop is None else s.stop * step, step) for s in index
+        )
+        return np.asarray(self.data[rows, cols])
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self[:, :], dtype=dtype)
+
+
+class StridedPyramid(ImagePyramid):
+    """Pyramid whose levels are strided views of the data instead of pooled copies.
+
+    Nothing is computed in advance, each draw reads only the visible window
+    with the stride of the level, so it works with `np.memmap` or any object
+    with `shape`, `ndim` and slicing with steps (e.g. h5py or zarr datasets).
+    """
+
+    def __init__(self, data, min_size: int = 64):
+        if np.ndim(data) != 2:
+            raise ValueError(f"Pyramid mode requires 2d data, got {np.shape(data)}")
+        self.how = "stride"
+        self.data = data
+        self.levels = []
+        self.max_level = max(int(np.floor(np.log2(max(max(data.shape), 1) / min_size))), 0)
+
+    @property
+    def shape(self) -> _t.Tuple[int, int]:
+        return tuple(self.data.shape)  # type: ignore
+
+    def level(self, k: int) -> StridedView:  # type: ignore
+        return StridedView(self.data, 2 ** min(max(k, 0), self.max_level))
+
+    def sample(self, max_size: int = 1 << 18) -> np.ndarray:
+        """Return the finest level with at most `max_size` elements."""
+        k = 0
+        while k < self.max_level and np.prod(self.level(k).shape) > max_size:
+            k += 1
+        return np.asarray(self.level(k))
+
+
+def is_lazy_array(data) -> bool:
+    """Return True for memory-mapped arrays and array-like objects that are not numpy arrays,
+    but can be sliced without reading everything (e.g. h5py or zarr datasets)."""
+    if isinstance(data, np.memmap):
+        return True
+    return (
+        not isinstance(data, np.ndarray)
+        and hasattr(data, "shape")
+        and hasattr(data, "dtype")
+        and hasattr(data, "__getitem__")
+    )
+
+
+class LazyItem:
+    """`data[index]` of a lazily sliced array, without reading it."""
+
+    def __init__(self, data, index: int):
+        self.data = data
+        self.index = index
+        self.shape = tuple(data.shape[1:])
+        self.ndim = len(self.shape)
+        self.dtype = data.dtype
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        return self.data[(self.index,) + key]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.data[self.index], dtype=dtype)
+
+
+def lazy_item(data, index: int):
+    """Return `data[index]`, keeping it lazy if `data` is a lazily sliced array."""
+    if is_lazy_array(data) and not isinstance(data, np.ndarray):
+        return LazyItem(data, index)
+    return data[index]
+
+
+def default_extent(shape: _t.Tuple[int, int], origin: str) -> _t.Tuple[float, float, float, float]:
+    ny, nx = shape
+    if origin == "upper":
+        return (-0.5, nx - 0.5, ny - 0.5, -0.5)
+    return (-0.5, nx - 0.5, -0.5, ny - 0.5)
+
+
+class PyramidImage(AxesImage):
+    """AxesImage that draws only the visible window of a pyramid level.
+
+    The level is chosen on each draw to match the pixel size of the axes,
+    so Matplotlib never resamples more data than there are pixels on the screen.
+    `get_extent` returns the extent of the full image outside of drawing.
+    """
+
+    pyramid: ImagePyramid
+    _full_extent: _t.Tuple[float, float, float, float]
+    _window: _t.Optional[tuple] = None
+    _draw_extent: _t.Optional[_t.Tuple[float, float, float, float]] = None
+
+    @classmethod
+    def from_image(cls, im: AxesImage, pyramid: ImagePyramid) -> "PyramidImage":
+        """Turn an existing AxesImage into a PyramidImage."""
+        im.__class__ = cls
+        im.pyramid = pyramid  # type: ignore
+        im._full_extent = tuple(im.get_extent())  # type: ignore
+        return im  # type: ignore
+
+    def get_extent(self):
+        if self._draw_extent is not None:
+            return self._draw_extent
+        return super().get_extent()
+
+    def _visible_range(self, lim, first, last, length):
+        """Convert the axis limits to the [start, stop) range of data indices."""
+        step = (last - first) / length
+        ends = sorted(((lim[0] - first) / step, (lim[1] - first) / step))
+        start = int(np.clip(np.floor(ends[0]) - 1, 0, length))
+        stop = int(np.clip(np.ceil(ends[1]) + 1, 0, length))
+        return start, max(stop, start + 1), abs(ends[1] - ends[0])
+
+    def select_window(self):
+        """Return the level, the rows and columns slices and the extent to draw."""
+        ny, nx = self.pyramid.shape
+        left, right, bottom, top = self._full_extent
+        y_first, y_last = (top, bottom) if self.origin == "upper" else (bottom, top)
+        x0, x1, visible_x = self._visible_range(self.axes.get_xlim(), left, right, nx)
+        y0, y1, visible_y = self._visible_range(self.axes.get_ylim(), y_first, y_last, ny)
+
+        bbox = self.axes.bbox
+        data_per_pixel = min(
+            visible_x / max(bbox.width, 1), visible_y / max(bbox.height, 1)
+        )
+        k = self.pyramid.level_for(data_per_pixel)
+        level = self.pyramid.level(k)
+        fy, fx = ny / level.shape[0], nx / level.shape[1]
+        rows = slice(int(y0 // fy), int(np.ceil(y1 / fy)))
+        cols = slice(int(x0 // fx), int(np.ceil(x1 / fx)))
+
+        dx, dy = (right - left) / nx, (y_last - y_first) / ny
+        xs = (left + cols.start * fx * dx, left + min(cols.stop * fx, nx) * dx)
+        ys = (y_first + rows.start * fy * dy, y_first + min(rows.stop * fy, ny) * dy)
+        if self.origin == "upper":
+            ys = ys[::-1]
+        return k, rows, cols, (xs[0], xs[1], ys[0], ys[1])
+
+    def draw(self, renderer, *args, **kwargs):
+        k, rows, cols, extent = self.select_window()
+        window = (k, rows.start, rows.stop, cols.start, cols.stop)
+        if window != self._window:
+            self._window = window
+            self.set_data(np.asarray(self.pyramid.level(k)[rows, cols]))
+        self._draw_extent = extent
+        try:
+            return super().draw(renderer, *args, **kwargs)
+        finally:
+            self._draw_extent = None
@@ -0,0 +1,189 @@
+"""Reuse the lines and images of the previous page of a `FigurePool`.
+
+When a pooled figure is reset, the artists created by `plot` and `imshow` are
+removed from their axes and kept, keyed by the structure of the call that created
+them: the arguments except the data. The next call with the same structure takes
+the artist back and only replaces its data with `set_data`.
+"""
+
+import typing as _t
+
+import numpy as np
+from matplotlib import cbook
+from matplotlib.artist import ArtistInspector
+from matplotlib.axes._base import _process_plot_format
+from matplotlib.lines import Line2D
+
+from .decimation import split_plot_args
+
+if _t.TYPE_CHECKING:
+    from matplotlib.artist import Artist
+
+# Properties holding the data or the place of an artist in the figure, set again on reuse.
+_PLACE_PROPERTIES = frozenset(
+    ("data", "xdata", "ydata", "array", "extent", "clim", "transform", "clip_box", "clip_path", "figure")
+)
+_PROPERTY_NAMES: _t.Dict[type, _t.Tuple[str, ...]] = {}
+# Arguments of `imshow` that depend on the data and are set again on reuse.
+IMAGE_DATA_KWARGS = ("extent", "vmin", "vmax")
+# Small arrays, e.g. colors, are compared by value. Larger ones are not reused.
+_MAX_KEY_ARRAY_SIZE = 16
+
+
+class _Same:
+    """Compare an object by identity inside a key, and keep it alive so its id is not reused."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _Same) and other.obj is self.obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+
+def structure_key(kwargs: _t.Dict[str, _t.Any]) -> _t.Optional[tuple]:
+    """Return a hashable key of keyword arguments, None if one of them is a large array.
+
+    Scalars, strings and small arrays are compared by value, other objects
+    (e.g. norms and colormaps) by identity.
+    """
+    items = []
+    for name, value in sorted(kwargs.items()):
+        if value is None or isinstance(value, (str, bool, int, float)):
+            items.append((name, value))
+        elif isinstance(value, (tuple, list, np.ndarray)):
+            array = np.asarray(value, dtype=object)
+            if array.size > _MAX_KEY_ARRAY_SIZE:
+                return None
+            items.append((name, array.shape, tuple(array.ravel().tolist())))
+        else:
+            items.append((name, _Same(value)))
+    try:
+        hash(tuple(items))
+    except TypeError:
+        return None
+    return tuple(items)
+
+
+class PlotCall(_t.NamedTuple):
+    """`plot(x, y, [fmt], **kwargs)` call that draws a single line."""
+
+    key: tuple
+    x: np.ndarray
+    y: np.ndarray
+    cycle_color: bool
+
+
+def plot_call(args: tuple, kwargs: _t.Dict[str, _t.Any]) -> _t.Optional[PlotCall]:
+    """Return the reusable structure of a `plot` call, None if it does not draw one numeric line."""
+    if "data" in kwargs or any(np.ma.isMaskedArray(arg) for arg in args):
+        return None
+    try:
+        x, y, fmt = split_plot_args(args)
+    except (ValueError, TypeError):
+        return None
+    if x.dtype.kind not in "biuf" or y.dtype.kind not in "biuf":
+        return None
+    kwargs_key = structure_key(kwargs)
+    if kwargs_key is None:
+        return None
+    # The color of the line is taken from the property cycle, as in `Axes.plot`.
+    cycle_color = "color" not in cbook.normalize_kwargs(kwargs, Line2D) and (
+        not fmt or _process_plot_format(fmt[0])[2] is None
+    )
+    return PlotCall(("plot", fmt, kwargs_key), x, y, cycle_color)
+
+
+def image_key(
+    imshow_kwargs: _t.Dict[str, _t.Any], kwargs: _t.Dict[str, _t.Any], colorbar: bool
+) -> _t.Optional[tuple]:
+    """Return the reusable structure of an `imshow` call, None if it cannot be reused."""
+    structure = {key: value for key, value in imshow_kwargs.items() if key not in IMAGE_DATA_KWARGS}
+    imshow_key, kwargs_key = structure_key(structure), structure_key(kwargs)
+    if imshow_key is None or kwargs_key is None:
+        return None
+    return ("imshow", imshow_key, kwargs_key, colorbar)
+
+
+def _property_names(artist: "Artist") -> _t.Tuple[str, ...]:
+    """Return the properties of an artist with a getter and a setter, except its data and place."""
+    cls = type(artist)
+    if cls not in _PROPERTY_NAMES:
+        setters = ArtistInspector(artist).get_setters()
+        _PROPERTY_NAMES[cls] = tuple(
+            sorted(name for name in setters if name not in _PLACE_PROPERTIES and hasattr(artist, f"get_{name}"))
+        )
+    return _PROPERTY_NAMES[cls]
+
+
+def _equal(value1, value2) -> bool:
+    if value1 is value2:
+        return True
+    try:
+        if isinstance(value1, (np.ndarray, list, tuple)) or isinstance(value2, (np.ndarray, list, tuple)):
+            return bool(np.array_equal(np.asarray(value1, dtype=object), np.asarray(value2, dtype=object)))
+        return bool(value1 == value2)
+    except (TypeError, ValueError):
+        return False
+
+
+def register(artist: "Artist", key: tuple):
+    """Mark a new artist as reusable by calls with the structure `key` and save its properties.
+
+    The properties are restored when the artist is reused, so the changes made
+    by a page after the call do not leak into the next page.
+    """
+    properties = {name: getattr(artist, f"get_{name}")() for name in _property_names(artist)}
+    norm = getattr(artist, "norm", None)
+    if norm is not None:
+        properties["norm"] = norm
+    artist._recycle_key = key  # type: ignore
+    artist._recycle_properties = properties  # type: ignore
+
+
+def restore_properties(artist: "Artist"):
+    """Set back the properties saved by `register` that were changed since."""
+    properties: _t.Dict[str, _t.Any] = artist._recycle_properties  # type: ignore
+    for name, value in properties.items():
+        current = artist.norm if name == "norm" else getattr(artist, f"get_{name}")()  # type: ignore
+        if not _equal(current, value):
+            getattr(artist, f"set_{name}")(value)
+
+
+class RecycledArtists:
+    """Artists removed from an axes by `FigurePool`, waiting to be reused.
+
+    Artists are taken back in the order they were drawn, so the drawing order
+    of a page with the same structure does not change.
+    """
+
+    def __init__(self):
+        self.artists: _t.Dict[tuple, _t.List["Artist"]] = {}
+        # Locator of the axes set by the colorbars of the recycled images.
+        self.axes_locator: _t.Optional[_t.Callable] = None
+
+    def add(self, artist: "Artist"):
+        self.artists.setdefault(artist._recycle_key, []).append(artist)  # type: ignore
+
+    def take(self, key: _t.Optional[tuple]) -> _t.Optional[_t.Any]:
+        """Return the first artist created by a call with the structure `key`, None if there is none.
+
+        The properties of the artist are restored to their values after its creation.
+        """
+        artists = self.artists.get(key) if key is not None else None
+        if not artists:
+            return None
+        artist = artists.pop(0)
+        restore_properties(artist)
+        return artist
+
+    def clear(self):
+        self.artists = {}
+        self.axes_locator = None
+
+    def __len__(self):
+        return sum(len(artists) for artists in self.artists.values())
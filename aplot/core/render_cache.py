@@ -0,0 +1,328 @@
+"""On-disk cache of the files written by `AFigure.savefig`.
+
+The key of a figure is a structural hash: the types of its artists, their simple
+properties and the digests of their data arrays, plus the savefig arguments.
+If a figure with the same key was already saved, the cached file is copied
+instead of rendering the figure again.
+
+Example:
+    ```
+        import aplot as ap
+
+        ap.set_render_cache("~/.cache/aplot", max_bytes=1 << 30)
+        ap.axs().plot(x, y).figure.savefig("report/trace.png")  # rendered
+        ap.axs().plot(x, y).figure.savefig("report/trace.png")  # copied from the cache
+        print(ap.get_render_cache().stats())
+    ```
+"""
+
+import hashlib
+import io
+import os
+import shutil
+import typing as _t
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axis import Axis
+from matplotlib.cm import ScalarMappable
+from matplotlib.transforms import TransformNode
+
+if _t.TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+FULL_DIGEST_BYTES = 16 << 20
+SAMPLE_SIZE = 1 << 18
+
+# Prefixes of the rcParams read when the figure is rendered, not when its artists are created.
+_RENDER_RCPARAMS = ("savefig.", "path.", "agg.", "pdf.", "ps.", "svg.", "text.", "image.composite_image")
+
+# Attributes that point back to containers or hold runtime state and do not change the output.
+_SKIPPED_ATTRIBUTES = {
+    "figure",
+    "_figure",
+    "_parent_figure",
+    "axes",
+    "_axes",
+    "stale",
+    "_stale",
+    "stale_callback",
+    "_remove_method",
+    "callbacks",
+    "_callbacks",
+    "_axobservers",
+    "_canvas_callbacks",
+    "_button_pick_id",
+    "_scroll_pick_id",
+    "_mouseover_set",
+    "_cachedRenderer",
+    "_renderer",
+    "canvas",
+    "_animated",
+    "_number",
+}
+
+
+class _Digest:
+    """Feed Python and NumPy values into a hash, without following cycles."""
+
+    def __init__(self, full_digest_bytes: int, sample_size: int):
+        self.hash = hashlib.blake2b(digest_size=20)
+        self.full_digest_bytes = full_digest_bytes
+        self.sample_size = sample_size
+        self._seen: _t.Set[int] = set()
+        self._arrays: _t.Dict[tuple, _t.Tuple[int, np.ndarray]] = {}
+        # Texts are small and many, they are hashed together on the next array or digest.
+        self._texts: _t.List[str] = []
+
+    def text(self, value: str):
+        self._texts.append(value)
+
+    def _flush(self):
+        if self._texts:
+            self._texts.append("")
+            self.hash.update("\0".join(self._texts).encode("utf-8", "surrogatepass"))
+            self._texts = []
+
+    def array(self, value: np.ndarray):
+        self.text(f"array{value.shape}{value.dtype}")
+        # Artists keep several references to the same data, e.g. the data and the path of a line.
+        memory = (value.__array_interface__["data"][0], value.shape, value.strides, value.dtype.str)
+        if memory in self._arrays:
+            self.text(f"same as {self._arrays[memory][0]}")
+            return
+        # The reference keeps temporary arrays alive, so their memory is not reused.
+        self._arrays[memory] = (len(self._arrays), value)
+        if value.dtype.hasobject:
+            for item in value.ravel()[: self.sample_size]:
+                self.value(item, 1)
+            return
+        if isinstance(value, np.ma.MaskedArray):
+            self.array(np.ma.getmaskarray(value))
+            value = value.data
+        if value.nbytes > self.full_digest_bytes:
+            # Large arrays are sampled with a stride, plus their first and last elements.
+            flat = value.reshape(-1)
+            step = max(flat.size // self.sample_size, 1)
+            value = np.concatenate([flat[::step], flat[-self.sample_size // 16 :]])
+        self._flush()
+        self.hash.update(np.ascontiguousarray(value).view(np.uint8).reshape(-1).data)
+
+    def value(self, value: _t.Any, depth: int):
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+            self.text(repr(value))
+        elif isinstance(value, np.ndarray):
+            self.array(value)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            self.text(type(value).__name__)
+            items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+            for item in items:
+                self.value(item, depth)
+            self.text("end")
+        elif isinstance(value, dict):
+            self.text("dict")
+            for key in sorted(value, key=repr):
+                self.value(key, depth)
+                self.value(value[key], depth)
+            self.text("end")
+        elif isinstance(value, Artist):
+            # Artists are hashed on their own by the figure walk.
+            self.text(type(value).__name__)
+        elif isinstance(value, TransformNode):
+            self.text(type(value).__name__)
+            if hasattr(value, "get_points"):
+                self.array(np.asarray(value.get_points()))
+            elif value.is_affine and hasattr(value, "get_matrix"):
+                self.array(np.asarray(value.get_matrix()))
+        elif hasattr(value, "__dict__") and depth > 0 and id(value) not in self._seen:
+            self._seen.add(id(value))
+            self.text(type(value).__qualname__)
+            self.attributes(value, depth - 1)
+        else:
+            self.text(type(value).__qualname__)
+
+    def attributes(self, obj: _t.Any, depth: int):
+        for key in sorted(vars(obj)):
+            if key in _SKIPPED_ATTRIBUTES:
+                continue
+            self.text(key)
+            self.value(vars(obj)[key], depth)
+
+    def color_mapping(self, mappable: ScalarMappable):
+        """Hash the colormap and the norm of a mappable, which are not simple attributes."""
+        cmap, norm = mappable.get_cmap(), mappable.norm
+        self.text(f"cmap {cmap.name}")
+        self.array(np.asarray(cmap(np.arange(cmap.N)), dtype=float))
+        self.value([cmap.get_bad(), cmap.get_under(), cmap.get_over()], 0)
+        self.text(f"norm {type(norm).__qualname__}")
+        self.value([norm.vmin, norm.vmax, norm.clip], 0)
+        # Parameters of other norms, e.g. the boundaries of a BoundaryNorm.
+        self.attributes(norm, 0)
+
+    def hexdigest(self) -> str:
+        self._flush()
+        return self.hash.hexdigest()
+
+
+def figure_key(
+    fig: "Figure",
+    savefig_kwargs: _t.Optional[dict] = None,
+    full_digest_bytes: int = FULL_DIGEST_BYTES,
+    sample_size: int = SAMPLE_SIZE,
+) -> str:
+    """Return the structural hash of a figure and of the arguments of `savefig`.
+
+    Arrays up to `full_digest_bytes` are hashed entirely, larger ones are sampled
+    with `sample_size` elements.
+    """
+    digest = _Digest(full_digest_bytes, sample_size)
+    digest.text(mpl.__version__)
+    digest.value(savefig_kwargs or {}, 2)
+    digest.value({key: value for key, value in mpl.rcParams.items() if key.startswith(_RENDER_RCPARAMS)}, 1)
+    # Locators and formatters are not simple attributes: the ticks they produce are hashed instead.
+    # Tick labels are formatted before the walk, since it can create new ticks.
+    for axis in fig.findobj(Axis):
+        for minor in (False, True):
+            digest.array(np.asarray(axis.get_ticklocs(minor=minor), dtype=float))
+            digest.value([label.get_text() for label in axis.get_ticklabels(minor=minor)], 0)
+    for artist in fig.findobj(include_self=True):
+        digest.text(type(artist).__qualname__)
+        digest.attributes(artist, 1)
+        if isinstance(artist, ScalarMappable):
+            digest.color_mapping(artist)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Directory of rendered figures with size-based LRU eviction.
+
+    The least recently used files are removed when the total size exceeds `max_bytes`.
+    `hits` and `misses` count the calls of `savefig` that used the cache.
+
+    Args:
+        directory (str): Cache directory, created if needed.
+        max_bytes (int, optional): Maximal size of the cache. Defaults to 512 MB.
+        full_digest_bytes (int, optional): Data arrays up to this size are hashed entirely,
+            larger ones are sampled. Use a large value to always hash the full data.
+            Defaults to 16 MB.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 512 << 20,
+        full_digest_bytes: int = FULL_DIGEST_BYTES,
+    ):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        self.full_digest_bytes = full_digest_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, fig: "Figure", savefig_kwargs: dict) -> str:
+        return figure_key(fig, savefig_kwargs, full_digest_bytes=self.full_digest_bytes)
+
+    def path(self, key: str, fmt: str) -> str:
+        return os.path.join(self.directory, f"{key}.{fmt}")
+
+    def savefig(self, fig: "Figure", fname: _t.Any, save: _t.Callable[[_t.Any], None], **kwargs) -> bool:
+        """Write the cached file of `fig` to `fname` or render it with `save(target)`.
+
+        Returns:
+            bool: True if the file was taken from the cache.
+        """
+        fmt = _get_format(fname, kwargs)
+        path = self.path(self.key(fig, {"format": fmt, "dpi": fig.dpi, **kwargs}), fmt)
+        if os.path.exists(path):
+            self.hits += 1
+            os.utime(path)
+            _copy_to(path, fname)
+            return True
+
+        self.misses += 1
+        buffer = io.BytesIO()
+        save(buffer)
+        data = buffer.getvalue()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+        _write_to(data, fname)
+        self.evict()
+        return False
+
+    def files(self) -> _t.List[os.DirEntry]:
+        return [entry for entry in os.scandir(self.directory) if entry.is_file() and not entry.name.endswith(".tmp")]
+
+    def size(self) -> int:
+        return sum(entry.stat().st_size for entry in self.files())
+
+    def evict(self):
+        """Remove the least recently used files until the cache fits in `max_bytes`."""
+        entries = sorted(self.files(), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+
+    def clear(self):
+        for entry in self.files():
+            os.remove(entry.path)
+        self.hits = self.misses = 0
+
+    def stats(self) -> _t.Dict[str, int]:
+        files = self.files()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "files": len(files),
+            "bytes": sum(entry.stat().st_size for entry in files),
+        }
+
+
+def _get_format(fname: _t.Any, kwargs: dict) -> str:
+    fmt = kwargs.get("format")
+    if fmt is None and isinstance(fname, (str, os.PathLike)):
+        fmt = os.path.splitext(os.fspath(fname))[1][1:]
+    return (fmt or mpl.rcParams["savefig.format"]).lower()
+
+
+def _copy_to(path: str, fname: _t.Any):
+    if isinstance(fname, (str, os.PathLike)):
+        shutil.copyfile(path, fname)
+    else:
+        with open(path, "rb") as file:
+            fname.write(file.read())
+
+
+def _write_to(data: bytes, fname: _t.Any):
+    if isinstance(fname, (str, os.PathLike)):
+        with open(fname, "wb") as file:
+            file.write(data)
+    else:
+        fname.write(data)
+
+
+_render_cache: _t.Optional[RenderCache] = None
+
+
+def set_render_cache(
+    directory: _t.Optional[_t.Union[str, RenderCache]],
+    max_bytes: int = 512 << 20,
+    **kwargs,
+) -> _t.Optional[RenderCache]:
+    """Enable the render cache of `AFigure.savefig` for all figures, or disable it with None."""
+    global _render_cache  # pylint: disable=global-statement
+    if directory is None or isinstance(directory, RenderCache):
+        _render_cache = directory
+    else:
+        _render_cache = RenderCache(directory, max_bytes=max_bytes, **kwargs)
+    return _render_cache
+
+
+def get_render_cache() -> _t.Optional[RenderCache]:
+    return _render_cache
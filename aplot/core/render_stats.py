@@ -0,0 +1,270 @@
+"""Time the drawing of each axes and artist of a figure.
+
+`AFigure.render_stats` saves the figure once to memory with the `draw` method of
+every artist wrapped by a timer, and reports where the time goes: artists, layout
+and encoding of the file.
+
+Example:
+    ```
+        stats = fig.render_stats()
+        print(stats.table(limit=10))
+        print(stats.by_axes())
+    ```
+"""
+
+import io
+import time
+import typing as _t
+
+import numpy as np
+
+if _t.TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.figure import Figure
+
+
+class ArtistTiming(_t.NamedTuple):
+    """Draw time of one artist.
+
+    Args:
+        name (str): Type of the artist and its label, e.g. "Line2D 'signal'".
+        axes (str): Name of the axes of the artist, "figure" for figure-level artists.
+        artist (Artist): The artist itself.
+        calls (int): Number of calls of `draw`. Figures with a layout engine are drawn twice by `savefig`.
+        total_time (float): Time in seconds, including the artists drawn by this one.
+        self_time (float): Time in seconds without the timed children.
+        size (int): Number of data points of the artist, 0 if it has no data.
+    """
+
+    name: str
+    axes: str
+    artist: "Artist"
+    calls: int
+    total_time: float
+    self_time: float
+    size: int
+
+
+class RenderStats(_t.NamedTuple):
+    """Report of `AFigure.render_stats`.
+
+    Args:
+        artists (List[ArtistTiming]): Timings of the artists, sorted by self time.
+        total_time (float): Time of the whole `savefig` call in seconds.
+        draw_time (float): Time of the figure draw in seconds, without the layout.
+        layout_time (float): Time of `tight_layout` and of the layout engine in seconds.
+        encode_time (float): Remaining time, spent to set up the renderer and to encode the file.
+        format (str): Format of the file.
+        dpi (float): Resolution of the rendering.
+    """
+
+    artists: _t.List[ArtistTiming]
+    total_time: float
+    draw_time: float
+    layout_time: float
+    encode_time: float
+    format: str
+    dpi: float
+
+    def by_axes(self) -> _t.Dict[str, float]:
+        """Return the self time of all the artists of each axes, sorted by decreasing time."""
+        times: _t.Dict[str, float] = {}
+        for timing in self.artists:
+            times[timing.axes] = times.get(timing.axes, 0.0) + timing.self_time
+        return dict(sorted(times.items(), key=lambda item: item[1], reverse=True))
+
+    def by_type(self) -> _t.Dict[str, float]:
+        """Return the self time per type of artist, sorted by decreasing time."""
+        times: _t.Dict[str, float] = {}
+        for timing in self.artists:
+            kind = type(timing.artist).__name__
+            times[kind] = times.get(kind, 0.0) + timing.self_time
+        return dict(sorted(times.items(), key=lambda item: item[1], reverse=True))
+
+    def table(self, limit: _t.Optional[int] = 20) -> str:
+        """Return the costliest artists and the stages of the rendering as a text table."""
+        rows = self.artists[:limit]
+        name_width = max([len("artist")] + [len(timing.name) for timing in rows])
+        axes_width = max([len("axes")] + [len(timing.axes) for timing in rows])
+        lines = [
+            f"{'artist':<{name_width}} {'axes':<{axes_width}} {'self, ms':>10} {'total, ms':>10} {'size':>10}"
+        ]
+        for timing in rows:
+            lines.append(
+                f"{timing.name:<{name_width}} {timing.axes:<{axes_width}} {timing.self_time * 1e3:>10.3f} "
+                f"{timing.total_time * 1e3:>10.3f} {timing.size:>10}"
+            )
+        lines.append(
+            f"{self.format} at {self.dpi:g} dpi: total {self.total_time * 1e3:.3f} ms = "
+            f"layout {self.layout_time * 1e3:.3f} ms + draw {self.draw_time * 1e3:.3f} ms "
+            f"+ encoding {self.encode_time * 1e3:.3f} ms"
+        )
+        return "\n".join(lines)
+
+    def to_dict(self) -> _t.Dict[str, _t.Any]:
+        return {
+            "format": self.format,
+            "dpi": self.dpi,
+            "total_time": self.total_time,
+            "draw_time": self.draw_time,
+            "layout_time": self.layout_time,
+            "encode_time": self.encode_time,
+            "artists": [
+                {key: value for key, value in timing._asdict().items() if key != "artist"}
+                for timing in self.artists
+            ],
+        }
+
+
+def artist_size(artist: "Artist") -> int:
+    """Return the number of data points of an artist, 0 if it has none."""
+    for getter in ("get_xydata", "get_array", "get_offsets", "get_path"):
+        func = getattr(artist, getter, None)
+        if func is None:
+            continue
+        try:
+            data = func()
+        except Exception:  # pylint: disable=broad-except
+            continue
+        if getter == "get_path":
+            return len(data.vertices) if data is not None else 0
+        if data is not None and np.size(data) > 0:
+            return int(np.shape(data)[0]) if getter != "get_array" else int(np.size(data))
+    return 0
+
+
+def _artist_name(artist: "Artist") -> str:
+    name = type(artist).__name__
+    label = artist.get_text() if hasattr(artist, "get_text") else getattr(artist, "get_label", str)()
+    if isinstance(label, str) and label and not label.startswith("_"):
+        name += f" {label[:30]!r}"
+    return name
+
+
+def _axes_names(fig: "Figure") -> _t.Dict[int, str]:
+    """Return the name of the axes of each artist, keyed by the id of the artist."""
+    names = {}
+    for i, ax in enumerate(fig.get_axes()):
+        # Colorbars of make_axes_locatable or fig.colorbar are separate axes.
+        name = f"axes {i}" + (" (colorbar)" if getattr(ax, "_colorbar", None) is not None else "")
+        for artist in ax.findobj(include_self=True):
+            names.setdefault(id(artist), name)
+    return names
+
+
+class _DrawTimer:
+    """Wrap `draw` of every artist of a figure to time it, inside a `with` block."""
+
+    def __init__(self, fig: "Figure"):
+        self.fig = fig
+        self.times: _t.Dict[int, _t.List[float]] = {}
+        self.artists: _t.Dict[int, "Artist"] = {}
+        self._children: _t.List[float] = []
+        self._patched: _t.List[_t.Tuple[_t.Any, str]] = []
+        self.layout_time = 0.0
+
+    def __enter__(self) -> "_DrawTimer":
+        for artist in self.fig.findobj(include_self=True):
+            if "draw" in vars(artist):
+                continue
+            self.artists[id(artist)] = artist
+            artist.draw = self._timed(artist, artist.draw)  # type: ignore
+            self._patched.append((artist, "draw"))
+        engine = self.fig.get_layout_engine()
+        if engine is not None and "execute" not in vars(engine):
+            engine.execute = self._timed_layout(engine.execute)  # type: ignore
+            self._patched.append((engine, "execute"))
+        return self
+
+    def __exit__(self, *exc_info):
+        for obj, name in self._patched:
+            delattr(obj, name)
+        self._patched = []
+
+    def _timed(self, artist: "Artist", draw: _t.Callable) -> _t.Callable:
+        key = id(artist)
+
+        def timed_draw(*args, **kwargs):
+            self._children.append(0.0)
+            start = time.perf_counter()
+            try:
+                return draw(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = self._children.pop()
+                if self._children:
+                    self._children[-1] += elapsed
+                times = self.times.setdefault(key, [0, 0.0, 0.0])
+                times[0] += 1
+                times[1] += elapsed
+                times[2] += elapsed - children
+
+        return timed_draw
+
+    def _timed_layout(self, execute: _t.Callable) -> _t.Callable:
+        def timed_execute(*args, **kwargs):
+            self._children.append(0.0)
+            start = time.perf_counter()
+            try:
+                return execute(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._children.pop()
+                # The layout is not part of the self time of the figure.
+                if self._children:
+                    self._children[-1] += elapsed
+                self.layout_time += elapsed
+
+        return timed_execute
+
+
+def render_stats(
+    fig: "Figure",
+    fmt: str = "png",
+    dpi: _t.Optional[float] = None,
+    tight_layout: bool = False,
+    **savefig_kwargs,
+) -> RenderStats:
+    """Save the figure to memory once and time each stage. See `AFigure.render_stats`."""
+    from matplotlib.figure import Figure
+
+    layout_time = 0.0
+    if tight_layout:
+        start = time.perf_counter()
+        fig.tight_layout()
+        layout_time = time.perf_counter() - start
+
+    dpi = dpi or fig.dpi
+    timer = _DrawTimer(fig)
+    start = time.perf_counter()
+    with timer:
+        Figure.savefig(fig, io.BytesIO(), format=fmt, dpi=dpi, **savefig_kwargs)
+    save_time = time.perf_counter() - start
+
+    axes_names = _axes_names(fig)
+    timings = []
+    for key, (calls, total, self_time) in timer.times.items():
+        artist = timer.artists[key]
+        timings.append(
+            ArtistTiming(
+                _artist_name(artist),
+                axes_names.get(key, "figure"),
+                artist,
+                calls,
+                total,
+                self_time,
+                artist_size(artist),
+            )
+        )
+    timings.sort(key=lambda timing: timing.self_time, reverse=True)
+
+    figure_time = timer.times.get(id(fig), [0, 0.0, 0.0])[1]
+    return RenderStats(
+        artists=timings,
+        total_time=save_time + layout_time,
+        draw_time=figure_time - timer.layout_time,
+        layout_time=layout_time + timer.layout_time,
+        encode_time=save_time - figure_time,
+        format=fmt,
+        dpi=dpi,
+    )
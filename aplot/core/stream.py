@@ -0,0 +1,171 @@
+import typing as _t
+
+import numpy as np
+
+if _t.TYPE_CHECKING:
+    from matplotlib.lines import Line2D
+
+    from .axes_class import AAxes
+
+
+class RingBuffer:
+    """Fixed-capacity buffer that keeps the last `capacity` values.
+
+    Every value is stored twice, so the content is always available
+    in chronological order as a contiguous view without copying.
+    """
+
+    def __init__(self, capacity: int, dtype: _t.Any = float):
+        if capacity < 1:
+            raise ValueError(f"Capacity should be positive, got {capacity}")
+        self.capacity = capacity
+        self.size = 0
+        self._end = 0
+        self._data = np.empty(2 * capacity, dtype=dtype)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def full(self) -> bool:
+        return self.size == self.capacity
+
+    def extend(self, values: np.ndarray):
+        values = np.asarray(values).ravel()[-self.capacity :]
+        length, end, capacity = len(values), self._end, self.capacity
+        first = min(length, capacity - end)
+        self._data[end : end + first] = values[:first]
+        self._data[end + capacity : end + capacity + first] = values[:first]
+        rest = length - first
+        if rest:
+            self._data[:rest] = values[first:]
+            self._data[capacity : capacity + rest] = values[first:]
+        self._end = (end + length) % capacity
+        self.size = min(self.size + length, capacity)
+
+    def view(self) -> np.ndarray:
+        start = (self._end - self.size) % self.capacity
+        return self._data[start : start + self.size]
+
+    def clear(self):
+        self.size = 0
+        self._end = 0
+
+
+def split_stream_args(args: tuple) -> _t.Tuple[_t.Optional[np.ndarray], np.ndarray]:
+    if len(args) == 1:
+        return None, np.asarray(args[0])
+    if len(args) == 2:
+        return np.asarray(args[0]), np.asarray(args[1])
+    raise ValueError(f"append takes y or x, y, got {len(args)} arguments")
+
+
+class LineStream:
+    """Line that shows the last `capacity` points appended to it.
+
+    The line is created once and updated with `set_data`. Data limits are updated
+    with the new chunk only, without a full `relim`. If `follow` is True, the x-limits
+    follow the content of the buffer, assuming x is increasing.
+
+    Example:
+        ```
+            stream = ap.axs().stream(10_000)
+            for chunk in acquisition():
+                stream.append(chunk)
+                stream.figure.canvas.draw_idle()
+        ```
+    """
+
+    def __init__(
+        self,
+        ax: "AAxes",
+        capacity: int,
+        dtype: _t.Any = float,
+        follow: bool = True,
+        **kwargs,
+    ):
+        self.ax = ax
+        self.follow = follow
+        self.x = RingBuffer(capacity, dtype=dtype)
+        self.y = RingBuffer(capacity, dtype=dtype)
+        self.line: "Line2D" = ax.plot([], [], **kwargs).res[0]
+        self._count = 0
+
+    @property
+    def figure(self):
+        return self.ax.figure
+
+    def append(self, *args) -> "LineStream":
+        """Append a chunk of data. Takes `y` or `x, y`.
+
+        If x is not provided, the index of the sample since the creation or the last `clear` is used.
+        """
+        x, y = split_stream_args(args)
+        y = np.ravel(y)
+        if x is None:
+            x = np.arange(self._count, self._count + len(y))
+        x = np.ravel(x)
+        if len(x) != len(y):
+            raise ValueError(f"x and y should have the same length, got {len(x)} and {len(y)}")
+        self._count += len(y)
+        self.x.extend(x)
+        self.y.extend(y)
+        self.line.set_data(self.x.view(), self.y.view())
+        self._update_limits(x, y)
+        return self
+
+    def _update_limits(self, x: np.ndarray, y: np.ndarray):
+        ax = self.ax
+        ax.update_datalim(np.column_stack([x[-self.x.capacity :], y[-self.y.capacity :]]))
+        if self.follow and self.x.full:
+            xs = self.x.view()
+            ax.dataLim.intervalx = (xs[0], xs[-1])
+        ax.autoscale_view()
+
+    def clear(self) -> "LineStream":
+        self.x.clear()
+        self.y.clear()
+        self.line.set_data([], [])
+        self._count = 0
+        return self
+
+
+class StreamGroup:
+    """Streams on several axes fed by a single `append` call."""
+
+    def __init__(self, streams: _t.List[LineStream]):
+        self.streams = streams
+
+    def __len__(self):
+        return len(self.streams)
+
+    def __iter__(self):
+        return iter(self.streams)
+
+    def __getitem__(self, index: int) -> LineStream:
+        return self.streams[index]
+
+    @property
+    def figure(self):
+        return self.streams[0].figure
+
+    def append(self, *args) -> "StreamGroup":
+        """Append a chunk of data to all streams. Takes `y` or `x, y`.
+
+        If y is 2d with one row per stream, each stream receives its own row,
+        otherwise all streams receive the same data. Same for x.
+        """
+        x, y = split_stream_args(args)
+        for i, stream in enumerate(self.streams):
+            y_i = y[i] if y.ndim == 2 and len(y) == len(self) else y
+            if x is None:
+                stream.append(y_i)
+            else:
+                x_i = x[i] if x.ndim == 2 and len(x) == len(self) else x
+                stream.append(x_i, y_i)
+        return self
+
+    def clear(self) -> "StreamGroup":
+        for stream in self.streams:
+            stream.clear()
+        return self
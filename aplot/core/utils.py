@@ -1,8 +1,14 @@
+import functools
+import sys
 import typing as _t
 
+import numpy as np
+
 from .typing import NoneType
 
 if _t.TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
     from .axes_class import AAxes
     from .typing import ArrayLike
 
@@ -16,15 +22,53 @@ def res(ax_or_any: _t.Union[_T, "AAxes[_T]"], /) -> _T:
     return ax_or_any  # type: ignore
 
 
+def get_figure(obj) -> "Figure":
+    """Return the figure of a figure, an axes, an artist or a list of axes."""
+    while hasattr(obj, "figure") and obj.figure is not obj and obj.figure is not None:
+        obj = obj.figure
+    return obj
+
+
+_SETTER_INDEX: _t.Dict[type, _t.Tuple[_t.Tuple[int, ...], _t.FrozenSet[str]]] = {}
+
+
+def setter_names(obj) -> _t.FrozenSet[str]:
+    """Return the names `k` for which the class of `obj` has a `set_k` method.
+
+    `obj` can be a class or an instance. The names are computed once per class and
+    recomputed if an attribute was added to or removed from the class or one of its
+    parents. Use `clear_setter_index` after replacing a `set_` method by a non-callable.
+    """
+    cls = obj if isinstance(obj, type) else type(obj)
+    version = tuple(len(vars(base)) for base in cls.__mro__)
+    cached = _SETTER_INDEX.get(cls)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    names = frozenset(
+        name[4:]
+        for name in dir(cls)
+        if name.startswith("set_") and callable(getattr(cls, name, None))
+    )
+    _SETTER_INDEX[cls] = (version, names)
+    return names
+
+
+def clear_setter_index(cls: _t.Optional[type] = None):
+    """Forget the setter names of `cls` and its subclasses, or of all classes if None."""
+    if cls is None:
+        _SETTER_INDEX.clear()
+        return
+    for key in list(_SETTER_INDEX):
+        if issubclass(key, cls):
+            del _SETTER_INDEX[key]
+
+
 def filter_set_kwargs(obj, additional_: _t.Optional[_t.List[str]] = None, **kwargs):
     """Filter kwargs to one that can be set with set_... method."""
-    for k in list(kwargs.keys()):
-        if additional_ and k in additional_:
-            continue
-        func = getattr(obj, f"set_{k}", None)
-        if not callable(func):
-            kwargs.pop(k)
-    return kwargs
+    names = setter_names(obj)
+    if additional_:
+        names = names.union(additional_)
+    return {k: v for k, v in kwargs.items() if k in names}
 
 
 def filter_none_types(kwargs: dict) -> dict:
@@ -49,31 +93,143 @@ def imshow_kwds(
     return dict(aspect="auto", origin="lower", interpolation="None", extent=extent)
 
 
-def get_auto_args(level: int = 0, name="plot"):
-    import inspect
-    import re
-
-    stack = inspect.stack()
-    if len(stack) < 3 + level:
+class RendererChoice(_t.NamedTuple):
+    """Renderer picked for 2d data and the reason of the choice."""
+
+    renderer: _t.Literal["AxesImage", "NonUniformImage", "PcolorImage", "QuadMesh"]
+    reason: str
+
+
+def classify_grid(
+    arr: "ArrayLike", rtol: float = 0.01
+) -> _t.Tuple[_t.Literal["regular", "monotonic", "irregular"], str]:
+    """Classify 1d coordinates in O(n).
+
+    Returns:
+        - "regular" if all coordinates are within `rtol` steps of the evenly spaced
+          grid from the first to the last one,
+        - "monotonic" if steps have the same sign but different sizes (e.g. log scale),
+        - "irregular" if the coordinates are not 1d, not finite or not monotonic.
+        And a short reason of the classification.
+    """
+    arr = np.asarray(arr)
+    if arr.ndim != 1:
+        return "irregular", f"coordinates are {arr.ndim}d"
+    if len(arr) < 3:
+        return "regular", f"{len(arr)} points"
+    arr = arr.astype(float, copy=False)
+    diff = np.diff(arr)
+    if not np.all(np.isfinite(diff)):
+        return "irregular", "non-finite coordinates"
+    step = (arr[-1] - arr[0]) / (len(arr) - 1)
+    if step == 0 or not (np.all(diff > 0) if step > 0 else np.all(diff < 0)):
+        return "irregular", "not strictly monotonic"
+    # Positions are compared, not steps: small step errors add up along the grid.
+    deviation = float(np.max(np.abs(arr - np.linspace(arr[0], arr[-1], len(arr))))) / abs(step)
+    if deviation <= rtol:
+        return "regular", f"position deviation {deviation:.2g} steps <= {rtol}"
+    return "monotonic", f"position deviation {deviation:.2g} steps > {rtol}"
+
+
+def choose_renderer(
+    x: _t.Optional["ArrayLike"] = None,
+    y: _t.Optional["ArrayLike"] = None,
+    rtol: float = 0.01,
+) -> RendererChoice:
+    """Choose the fastest renderer that shows data on the x, y grid correctly.
+
+    AxesImage (imshow) for regular grids, NonUniformImage for monotonic ones
+    and QuadMesh (pcolormesh) for everything else.
+    """
+    if x is None or y is None:
+        return RendererChoice("AxesImage", "no coordinates")
+    (kind_x, reason_x), (kind_y, reason_y) = classify_grid(x, rtol), classify_grid(y, rtol)
+    reason = f"x: {kind_x}, {reason_x}; y: {kind_y}, {reason_y}"
+    if "irregular" in (kind_x, kind_y):
+        return RendererChoice("QuadMesh", reason)
+    if "monotonic" in (kind_x, kind_y):
+        return RendererChoice("NonUniformImage", reason)
+    return RendererChoice("AxesImage", reason)
+
+
+def pcolorfast_extent(
+    x: _t.Optional["ArrayLike"] = None,
+    y: _t.Optional["ArrayLike"] = None,
+):
+    """Return the extent that pcolorfast uses for regularly spaced x and y.
+
+    Raises ValueError if x or y are not regularly spaced, since such data
+    cannot be shown as an image."""
+    if x is None or y is None:
+        return None
+    choice = choose_renderer(x, y)
+    if choice.renderer != "AxesImage":
+        raise ValueError(f"x and y should be regularly spaced 1d arrays ({choice.reason})")
+    return [x[0], x[-1], y[0], y[-1]]
+
+
+def get_auto_args(level: int = 0, name="plot") -> _t.List[str]:
+    """Return labels made from the arguments of the `name(...)` call
+    in the statement that called the caller of this function.
+
+    `level` is the number of additional frames to go up. The arguments are
+    parsed once per code object and line number.
+    """
+    try:
+        frame = sys._getframe(2 + level)  # pylint: disable=protected-access
+    except ValueError:
         return []
-    caller_frame = stack[2 + level]
-    frame, filename, line_number, function_name, lines, index = caller_frame
-    # print(function_name.capitalize(), lines)
-    if lines:  # Lines is a list of lines of context from the source code
-        # Use the first line of context, which should be the call
-        line = " ".join(lines).strip()
-        # print(line)
-        # line = lines[0].strip()
-        # Use regex to find variable names within the function call
-        pattern = rf"{name}\(([^)]+)\)"
-        match = re.search(pattern, line)
-        if match:
-            # Extract the argument part and split by commas to get variable names
-            arguments = match.group(1).split(",")
-            # Use strip to clean any spaces and capture only the variable names
-            var_names = [var_to_label(arg.split("=")[-1]) for arg in arguments]
-            return var_names
-    return []
+    return list(_call_arg_labels(frame.f_code, frame.f_lineno, name))
+
+
+@functools.lru_cache(maxsize=1024)
+def _call_arg_labels(code: _t.Any, line_number: int, name: str) -> _t.Tuple[str, ...]:
+    import ast
+    import linecache
+
+    source = "".join(linecache.getlines(code.co_filename))
+    if not source:
+        return ()
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return ()
+
+    # The innermost statement that contains the line, so multi-line calls are supported.
+    statement = None
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.stmt)
+            and node.lineno <= line_number <= (node.end_lineno or node.lineno)
+            and (statement is None or node.lineno >= statement.lineno)
+        ):
+            statement = node
+    if statement is None:
+        return ()
+
+    calls = sorted(
+        (
+            node
+            for node in ast.walk(statement)
+            if isinstance(node, ast.Call) and _call_name(node) == name
+        ),
+        key=lambda node: (node.lineno, node.col_offset),
+    )
+    if not calls:
+        return ()
+    call = calls[0]
+    arguments = list(call.args) + [keyword.value for keyword in call.keywords]
+    return tuple(
+        var_to_label(" ".join((ast.get_source_segment(source, arg) or "").split()))
+        for arg in arguments
+    )
+
+
+def _call_name(node: _t.Any) -> _t.Optional[str]:
+    func = node.func
+    if hasattr(func, "attr"):
+        return func.attr
+    return getattr(func, "id", None)
 
 
 def var_to_label(var: str) -> str:
@@ -0,0 +1,90 @@
+import typing as _t
+
+import numpy as np
+
+Z_MODES = {
+    "bode": ("abs", "phase"),
+    "bode_db": ("dB", "phase"),
+    "real_imag": ("real", "imag"),
+    "dB": ("dB",),
+    "phase": ("phase",),
+}
+
+BLOCK_SIZE = 1 << 18
+
+
+def _component(z: np.ndarray, component: str, out: np.ndarray, unwrap: bool):
+    if component == "real":
+        np.copyto(out, z.real, casting="same_kind")
+    elif component == "imag":
+        np.copyto(out, z.imag, casting="same_kind")
+    elif component in ("abs", "dB"):
+        np.abs(z, out=out, casting="same_kind")
+        if component == "dB":
+            with np.errstate(divide="ignore"):
+                np.log10(out, out=out)
+            out *= 20
+    elif component == "phase":
+        np.arctan2(z.imag, z.real, out=out, casting="same_kind")
+        np.rad2deg(out, out=out)
+        if unwrap:
+            out[...] = np.unwrap(out, period=360)
+    else:
+        raise ValueError(f"Unknown component {component}")
+
+
+def z_transform(
+    z: "np.ndarray",
+    mode: str = "bode",
+    unwrap: bool = False,
+    dtype: _t.Optional[_t.Any] = None,
+    out: _t.Optional[_t.Sequence[np.ndarray]] = None,
+    block_size: int = BLOCK_SIZE,
+) -> _t.Tuple[np.ndarray, ...]:
+    """Turn complex data into the real arrays to plot.
+
+    The output is computed in one pass over blocks of rows, so the temporaries
+    are the size of one block and not of the full data. The phase is in degrees
+    and is unwrapped along the last axis.
+
+    Args:
+        z (np.ndarray): Complex data.
+        mode (str, optional): One of "bode" (abs, phase), "bode_db" (dB, phase),
+            "real_imag" (real, imag), "dB" or "phase". Defaults to "bode".
+        unwrap (bool, optional): Unwrap the phase. Defaults to False.
+        dtype (optional): Type of the output, e.g. np.float32 to halve the memory.
+            Defaults to the precision of `z`.
+        out (Sequence[np.ndarray], optional): Preallocated outputs, one per component,
+            with the same shape as `z`. They can be reused between calls.
+        block_size (int, optional): Number of elements processed at once.
+
+    Returns:
+        Tuple[np.ndarray, ...]: One array per component of the mode.
+    """
+    if mode not in Z_MODES:
+        raise ValueError(f"Mode should be one of {tuple(Z_MODES)}, got {mode}")
+    components = Z_MODES[mode]
+    z = np.asanyarray(z)
+    if dtype is None:
+        dtype = z.real.dtype if np.issubdtype(z.real.dtype, np.floating) else np.float64
+    if out is None:
+        out = tuple(np.empty(z.shape, dtype=dtype) for _ in components)
+    elif len(out) != len(components) or any(o.shape != z.shape for o in out):
+        raise ValueError(f"out should be {len(components)} arrays of shape {z.shape}")
+
+    if z.ndim == 0:
+        for component, o in zip(components, out):
+            _component(z, component, o, unwrap)
+        return tuple(out)
+
+    # Rows are independent along the last axis, which is the unwrapping axis.
+    rows = z.reshape(-1, z.shape[-1]) if z.ndim > 1 else z[None]
+    out_rows = [o.reshape(rows.shape) for o in out]
+    if any(not np.shares_memory(o, o_rows) for o, o_rows in zip(out, out_rows) if o.size):
+        raise ValueError("out arrays should be contiguous")
+    step = max(block_size // max(rows.shape[1], 1), 1)
+    for start in range(0, len(rows), step):
+        block = rows[start : start + step]
+        for component, o in zip(components, out_rows):
+            _component(block, component, o[start : start + step], unwrap)
+    return tuple(out)
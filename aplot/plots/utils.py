@@ -6,6 +6,7 @@ import numpy as np
 from matplotlib.figure import Figure
 
 from ..code_utils import pop_from_dict  # pylint: disable=W0611 # noqa: F401
+from ..core.utils import filter_set_kwargs
 
 
 def push_labels_to_kwargs(labels: _t.Optional[_t.Dict[str, str]], kwargs: _t.Dict[str, str]):
@@ -84,17 +85,6 @@ def run_plot_on_axes_list(func, axes, data, *args, **kwargs):
     return
 
 
-def filter_set_kwargs(obj, additional_: _t.Optional[_t.List[str]] = None, **kwargs):
-    """Filter kwargs to one that can be set with set_... method."""
-    for k in list(kwargs.keys()):
-        if additional_ and k in additional_:
-            continue
-        func = getattr(obj, f"set_{k}", None)
-        if not callable(func):
-            kwargs.pop(k)
-    return kwargs
-
-
 def set_params(ax: plt.Axes, **kwargs):
     """Set the parameters of the Axes if they exist.
 
@@ -0,0 +1,237 @@
+"""Compare figures by rendering them to memory.
+
+Figures are drawn with the Agg canvas into RGBA buffers and compared with numpy,
+without writing files. Images are written only when a comparison fails, to help
+debugging.
+
+Example:
+    ```
+        import aplot as ap
+        from aplot.testing import assert_figures_equal
+
+        fig1 = ap.axs().plot([1, 2, 3]).figure
+        fig2 = ap.axs().plot([1, 2, 3]).figure
+        assert_figures_equal(fig1, fig2, diff_dir="failed_images")
+    ```
+"""
+
+import os
+import typing as _t
+
+import numpy as np
+
+from .core.utils import get_figure
+
+# Rec. 601 luma weights used for the structural similarity.
+_LUMA = np.array([0.299, 0.587, 0.114])
+_SSIM_WINDOW = 7
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+
+
+class ImageComparison(_t.NamedTuple):
+    """Result of `compare_images`.
+
+    Args:
+        equal (bool): True if all the requested metrics are within their tolerances.
+        mean_diff (float): Mean absolute difference over all components, in percent of 255.
+        channel_diff (tuple): Mean absolute difference per channel, in percent of 255.
+        max_diff (int): Largest absolute difference of a component.
+        diff_fraction (float): Fraction of pixels with at least one different component.
+        ssim (float): Mean structural similarity of the luminance, 1 for identical images.
+        reason (str): Why the images differ, empty if they are equal.
+        diff_path (str, optional): Path of the diff image written on failure.
+    """
+
+    equal: bool
+    mean_diff: float
+    channel_diff: _t.Tuple[float, ...]
+    max_diff: int
+    diff_fraction: float
+    ssim: float
+    reason: str = ""
+    diff_path: _t.Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return self.equal
+
+
+def render_rgba(fig, dpi: _t.Optional[float] = None) -> np.ndarray:
+    """Draw a figure with the Agg canvas and return its RGBA buffer.
+
+    Args:
+        fig (AFigure | AAxes | AxesList): Figure to draw or any of its axes.
+        dpi (float, optional): Resolution of the drawing. Defaults to the figure dpi.
+
+    Returns:
+        np.ndarray: Array of shape (height, width, 4) and type uint8.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = get_figure(fig)
+    original_canvas, original_dpi = fig.canvas, fig.dpi
+    # Interactive canvases do not always expose an RGBA buffer.
+    canvas = original_canvas if isinstance(original_canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    try:
+        if dpi is not None:
+            fig.dpi = dpi
+        canvas.draw()
+        return np.array(canvas.buffer_rgba())
+    finally:
+        fig.dpi = original_dpi
+        if canvas is not original_canvas:
+            fig.set_canvas(original_canvas)
+
+
+def _box_mean(image: np.ndarray, size: int) -> np.ndarray:
+    """Mean over all the `size` x `size` windows fully inside the image."""
+    cumsum = np.zeros((image.shape[0] + 1, image.shape[1] + 1))
+    np.cumsum(np.cumsum(image, axis=0), axis=1, out=cumsum[1:, 1:])
+    total = cumsum[size:, size:] - cumsum[:-size, size:] - cumsum[size:, :-size] + cumsum[:-size, :-size]
+    return total / size**2
+
+
+def structural_similarity(image1: np.ndarray, image2: np.ndarray, window: int = _SSIM_WINDOW) -> float:
+    """Mean structural similarity (SSIM) of the luminance of two RGB(A) or grayscale images."""
+    if image1.ndim == 3:
+        image1 = image1[..., :3] @ _LUMA[: image1.shape[2]]
+        image2 = image2[..., :3] @ _LUMA[: image2.shape[2]]
+    image1, image2 = image1.astype(float), image2.astype(float)
+    window = min(window, *image1.shape)
+    mean1, mean2 = _box_mean(image1, window), _box_mean(image2, window)
+    var1 = _box_mean(image1 * image1, window) - mean1**2
+    var2 = _box_mean(image2 * image2, window) - mean2**2
+    covariance = _box_mean(image1 * image2, window) - mean1 * mean2
+    ssim = ((2 * mean1 * mean2 + _SSIM_C1) * (2 * covariance + _SSIM_C2)) / (
+        (mean1**2 + mean2**2 + _SSIM_C1) * (var1 + var2 + _SSIM_C2)
+    )
+    return float(ssim.mean())
+
+
+def diff_image(image1: np.ndarray, image2: np.ndarray) -> np.ndarray:
+    """Return an RGB image of the absolute difference, stretched to the full range."""
+    diff = np.abs(image1.astype(np.int16) - image2.astype(np.int16))
+    if diff.ndim == 3:
+        diff = diff[..., :3] if diff.shape[2] >= 3 else np.repeat(diff[..., :1], 3, axis=2)
+        # The alpha difference is added to the color channels to stay visible.
+        if image1.shape[2] == 4:
+            diff = np.maximum(diff, np.abs(image1[..., 3:].astype(np.int16) - image2[..., 3:]))
+    else:
+        diff = np.repeat(diff[..., None], 3, axis=2)
+    scale = 255 / max(int(diff.max()), 1)
+    return np.clip(diff * scale, 0, 255).astype(np.uint8)
+
+
+def _save_image(image: np.ndarray, path: str):
+    from PIL import Image
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    Image.fromarray(image).save(path)
+
+
+def compare_images(
+    image1: np.ndarray,
+    image2: np.ndarray,
+    tolerance: float = 0.02,
+    channel_tolerance: _t.Optional[float] = None,
+    max_diff: _t.Optional[int] = None,
+    min_ssim: _t.Optional[float] = None,
+    diff_path: _t.Optional[str] = None,
+) -> ImageComparison:
+    """Compare two uint8 images of shape (height, width[, channels]).
+
+    Args:
+        image1, image2 (np.ndarray): Images to compare.
+        tolerance (float, optional): Maximal mean absolute difference over all components,
+            in percent of 255. Defaults to 0.02.
+        channel_tolerance (float, optional): Maximal mean absolute difference of each channel,
+            in percent of 255. Not checked by default.
+        max_diff (int, optional): Maximal absolute difference of any component.
+            Not checked by default.
+        min_ssim (float, optional): Minimal structural similarity. Not checked by default.
+        diff_path (str, optional): Where to write the diff image if the comparison fails.
+
+    Returns:
+        ImageComparison: Metrics of the comparison. Evaluates to True if the images are equal.
+    """
+    image1, image2 = np.asarray(image1), np.asarray(image2)
+    if image1.shape != image2.shape:
+        return ImageComparison(
+            False, np.inf, (), 255, 1.0, 0.0, f"Shapes differ: {image1.shape} != {image2.shape}"
+        )
+
+    diff = np.abs(image1.astype(np.int16) - image2.astype(np.int16))
+    channels = diff.reshape(-1, diff.shape[2] if diff.ndim == 3 else 1)
+    channel_diff = tuple(float(value) / 255 * 100 for value in channels.mean(axis=0))
+    mean_diff = float(channels.mean()) / 255 * 100
+    largest = int(diff.max()) if diff.size else 0
+    different = diff.any(axis=2) if diff.ndim == 3 else diff > 0
+    diff_fraction = float(different.mean()) if different.size else 0.0
+    ssim = 1.0 if largest == 0 else structural_similarity(image1, image2)
+
+    reasons = []
+    if mean_diff > tolerance:
+        reasons.append(f"mean difference {mean_diff:.4f}% > {tolerance}%")
+    if channel_tolerance is not None and max(channel_diff) > channel_tolerance:
+        reasons.append(
+            f"channel difference {', '.join(f'{value:.4f}' for value in channel_diff)}% > {channel_tolerance}%"
+        )
+    if max_diff is not None and largest > max_diff:
+        reasons.append(f"max difference {largest} > {max_diff}")
+    if min_ssim is not None and ssim < min_ssim:
+        reasons.append(f"structural similarity {ssim:.4f} < {min_ssim}")
+
+    if reasons and diff_path is not None:
+        _save_image(diff_image(image1, image2), diff_path)
+    else:
+        diff_path = None
+    return ImageComparison(
+        not reasons, mean_diff, channel_diff, largest, diff_fraction, ssim, "; ".join(reasons), diff_path
+    )
+
+
+def compare_figures(
+    fig1,
+    fig2,
+    *,
+    dpi: _t.Optional[float] = None,
+    diff_dir: _t.Optional[str] = None,
+    name: str = "figure",
+    **kwargs,
+) -> ImageComparison:
+    """Render two figures in memory and compare them with `compare_images`.
+
+    Args:
+        fig1, fig2 (AFigure | AAxes | AxesList): Figures to compare or any of their axes.
+        dpi (float, optional): Resolution of the rendering. Defaults to the figure dpi.
+        diff_dir (str, optional): If the comparison fails, both images and their difference
+            are written to this folder as `{name}_fig1.png`, `{name}_fig2.png`
+            and `{name}_diff.png`.
+        name (str, optional): Prefix of the written files. Defaults to "figure".
+        **kwargs: Tolerances passed to `compare_images`.
+    """
+    image1, image2 = render_rgba(fig1, dpi), render_rgba(fig2, dpi)
+    diff_path = None if diff_dir is None else os.path.join(diff_dir, f"{name}_diff.png")
+    result = compare_images(image1, image2, diff_path=diff_path, **kwargs)
+    if not result and diff_dir is not None:
+        _save_image(image1, os.path.join(diff_dir, f"{name}_fig1.png"))
+        _save_image(image2, os.path.join(diff_dir, f"{name}_fig2.png"))
+    return result
+
+
+def assert_figures_equal(fig1, fig2, **kwargs) -> ImageComparison:
+    """Raise an AssertionError if the figures differ. Takes the arguments of `compare_figures`."""
+    result = compare_figures(fig1, fig2, **kwargs)
+    if not result:
+        where = f" Diff image: {result.diff_path}" if result.diff_path else ""
+        raise AssertionError(f"Figures differ: {result.reason}.{where}")
+    return result
+
+
+def assert_figures_not_equal(fig1, fig2, **kwargs) -> ImageComparison:
+    """Raise an AssertionError if the figures are equal. Takes the arguments of `compare_figures`."""
+    # Differences are expected here, so no image is written.
+    result = compare_figures(fig1, fig2, **{**kwargs, "diff_dir": None})
+    if result:
+        raise AssertionError(f"Figures are equal: mean difference {result.mean_diff:.4f}%")
+    return result
@@ -0,0 +1,63 @@
+"""Frame rate of full redraws and of blitting on a 2x2 grid with the Agg backend.
+
+Usage:
+    python benchmarks/bench_animation.py
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+import aplot as ap  # noqa: E402
+from aplot.animation import BlitAnimator  # noqa: E402
+
+N_FRAMES = 200
+N_POINTS = 1000
+
+
+def make_grid():
+    x = np.linspace(0, 2 * np.pi, N_POINTS)
+    axs = ap.axs(2, 2, figsize=(8, 6)).plot(x, np.sin(x))
+    axs.set(xlabel="Time", ylabel="Signal")
+    lines = [ax.get_lines()[0] for ax in axs.flat()]
+    return axs, x, lines
+
+
+def update_lines(lines, x, i):
+    for j, line in enumerate(lines):
+        line.set_ydata(np.sin(x + (i + j) / 10))
+
+
+def bench_full_redraw():
+    axs, x, lines = make_grid()
+    canvas = axs.figure.canvas
+    canvas.draw()
+    start = time.perf_counter()
+    for i in range(N_FRAMES):
+        update_lines(lines, x, i)
+        canvas.draw()
+    return N_FRAMES / (time.perf_counter() - start)
+
+
+def bench_blit():
+    axs, x, lines = make_grid()
+    animator = BlitAnimator(axs, *lines, fps=None).cache_background()
+    start = time.perf_counter()
+    animator.run(lambda i: update_lines(lines, x, i), N_FRAMES)
+    return N_FRAMES / (time.perf_counter() - start)
+
+
+def main():
+    full = bench_full_redraw()
+    blit = bench_blit()
+    print(f"full redraw: {full:8.1f} fps")
+    print(f"blitting:    {blit:8.1f} fps")
+    print(f"speedup:     {blit / full:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Minimum search on a stack of maps: `argmin2d_batch` against a loop of `argmin2d`.
+
+The loop uses the previous `argmin2d`, which needed a copy of each map
+since it wrote NaNs into its input.
+
+Usage:
+    python benchmarks/bench_argmin2d.py
+"""
+
+import time
+
+import numpy as np
+import scipy.ndimage
+
+from aplot.analysis import argmin2d_batch
+
+N_MAPS, NY, NX = 2000, 64, 64
+
+
+def legacy_argmin2d(d, x_mask=None, y_mask=None, filter_=None):
+    if filter_ and filter_ > 1:
+        d = scipy.ndimage.uniform_filter(d, size=3, mode="nearest")
+    if x_mask is not None:
+        d[:, 0 : x_mask[0]] = np.nan
+        d[:, x_mask[1] + 1 :] = np.nan
+    if y_mask is not None:
+        d[~np.array(y_mask), :] = np.nan
+    index = np.nanargmin(d)
+    return index // d.shape[1], index % d.shape[1]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(N_MAPS, NY, NX))
+    x_mask = (8, 55)
+    y_mask = np.ones(NY, dtype=bool)
+    y_mask[:4] = False
+    print(f"{N_MAPS} maps of {NY}x{NX}")
+    print(f"{'':>12} {'loop':>10} {'batch':>10} {'speedup':>8}")
+    for filter_ in (None, 3):
+        loop, expected = timed(
+            lambda: [legacy_argmin2d(d.copy(), x_mask, y_mask, filter_) for d in data]
+        )
+        batch, (iy, ix) = timed(lambda: argmin2d_batch(data, x_mask, y_mask, filter_))
+        assert [tuple(i) for i in zip(iy, ix)] == expected
+        print(f"{'filter ' + str(filter_):>12} {loop*1e3:>7.1f} ms {batch*1e3:>7.1f} ms {loop/batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
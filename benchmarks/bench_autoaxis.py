@@ -0,0 +1,67 @@
+"""Cost of `AAxes.autoaxis` in a loop.
+
+Compares the frame-based `get_auto_args`, which parses each call site once,
+with the previous implementation based on `inspect.stack()` and a regex.
+
+Usage:
+    python benchmarks/bench_autoaxis.py
+"""
+
+import inspect
+import re
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+from aplot.core.utils import get_auto_args, var_to_label  # noqa: E402
+
+
+def legacy_get_auto_args(level: int = 0, name="plot"):
+    stack = inspect.stack()
+    if len(stack) < 3 + level:
+        return []
+    lines = stack[2 + level][4]
+    if lines:
+        match = re.search(rf"{name}\(([^)]+)\)", " ".join(lines).strip())
+        if match:
+            return [var_to_label(arg.split("=")[-1]) for arg in match.group(1).split(",")]
+    return []
+
+
+def plot(*args):
+    """Stand-in for `ax.plot`, so only the argument parsing is measured."""
+    return args
+
+
+def bench(get_args, x, y, number: int = 2000):
+    def autoaxis(_):
+        return get_args(0, "plot")
+
+    assert autoaxis(plot(x, y)) == ["x", "y"]
+    return timeit.timeit(lambda: autoaxis(plot(x, y)), number=number) / number
+
+
+def main():
+    time_s, voltage = np.arange(10), np.arange(10)
+    # Deep stacks, as in notebooks or test runners, make inspect.stack() slower.
+    for depth in (0, 30):
+
+        def nested(n, get_args):
+            if n:
+                return nested(n - 1, get_args)
+            return bench(get_args, time_s, voltage)
+
+        before = nested(depth, legacy_get_auto_args)
+        after = nested(depth, get_auto_args)
+        print(
+            f"stack depth +{depth:>3}: before {before*1e6:>9.1f} us, after {after*1e6:>7.1f} us, "
+            f"speedup {before/after:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Overhead of the chained methods of AAxes.
+
+Compares the precompiled wrappers of `AAxes` with the previous implementation,
+which built a new closure in `__getattribute__` on every attribute access.
+
+Usage:
+    python benchmarks/bench_chained_methods.py
+"""
+
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.axes import Axes as MplAxes  # noqa: E402
+
+from aplot.core.axes_class import WRAPPER_METHODS, AAxes  # noqa: E402
+
+
+class LegacyAAxes(MplAxes):
+    """AAxes as it was implemented with a `__getattribute__` hook."""
+
+    name = "LegacyAAxis"
+    _last_result = None
+
+    def __getattribute__(self, name: str):
+        if name.startswith("set") or name in WRAPPER_METHODS:
+            func = super().__getattribute__(name)
+
+            def wrapper(*args, **kwargs):
+                result = func(*args, **kwargs)
+                if isinstance(result, MplAxes):
+                    return result
+                self._last_result = result
+                return self
+
+            return wrapper
+        return super().__getattribute__(name)
+
+
+def make_axes(axes_class):
+    fig = plt.figure(figsize=(6, 4))
+    ax = fig.add_subplot(axes_class=axes_class)
+    x = np.linspace(0, 10, 1000)
+    for i in range(5):
+        ax.plot(x, np.sin(x + i))
+    ax.set_title("title")
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    return fig, ax
+
+
+def bench(axes_class, number_calls: int = 100_000, number_draws: int = 30):
+    fig, ax = make_axes(axes_class)
+    attr = timeit.timeit(lambda: ax.get_xlim, number=number_calls) / number_calls
+    call = timeit.timeit(lambda: ax.set_xmargin(0.05), number=number_calls) / number_calls
+    fig.canvas.draw()
+    draw = timeit.timeit(fig.canvas.draw, number=number_draws) / number_draws
+    plt.close(fig)
+    return attr, call, draw
+
+
+def main():
+    print(f"{'':>12} {'attr access':>14} {'set_* call':>14} {'draw':>12}")
+    results = {}
+    for label, cls in (("before", LegacyAAxes), ("after", AAxes)):
+        attr, call, draw = bench(cls)
+        results[label] = (attr, call, draw)
+        print(f"{label:>12} {attr*1e9:>11.0f} ns {call*1e9:>11.0f} ns {draw*1e3:>9.2f} ms")
+    before, after = results["before"], results["after"]
+    print(
+        f"{'speedup':>12} {before[0]/after[0]:>13.2f}x {before[1]/after[1]:>13.2f}x "
+        f"{before[2]/after[2]:>11.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Rendering of a few million IQ points with `scatter`.
+
+Compares markers (`ax.scatter(x, y, s=1)`) with the density mode
+(`ax.scatter(x, y, density=True)`), for the time of `savefig` and the size of the file.
+
+Usage:
+    python benchmarks/bench_density.py [number of points]
+"""
+
+import io
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+import aplot as ap  # noqa: E402
+
+
+def save(fig, fmt: str):
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    fig.savefig(buffer, format=fmt, cache=False)
+    return time.perf_counter() - start, len(buffer.getvalue())
+
+
+def main(size: int = 2_000_000):
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=size), rng.normal(size=size)
+    print(f"{size:,} points")
+    for fmt in ("png", "svg"):
+        for name, kwargs in (("markers", {"s": 1}), ("density", {"density": True})):
+            fig = ap.figure()
+            fig.add_subplot().scatter(x, y, **kwargs)
+            duration, length = save(fig, fmt)
+            print(f"{fmt} {name:8}: {duration:7.2f} s {length / 1e6:8.2f} MB")
+            ap.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,70 @@
+"""Pages per second of a report with a 2x2 layout: two lines, an image with a colorbar and a scatter.
+
+Compares a new figure per page with `ap.subplots`, as before, with a `FigurePool`
+that reuses the layout, the lines and the image with its colorbar. Pages are
+built only, then built and saved to PNG in memory.
+
+Usage:
+    python benchmarks/bench_figure_pool.py [number of pages]
+"""
+
+import io
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+import aplot as ap  # noqa: E402
+
+FIGSIZE = (8, 6)
+
+
+def draw_page(fig, axs, data):
+    signal, image, points = data
+    axs[0][0].plot(signal[0]).plot(signal[1]).set(title="Signal", xlabel="time")
+    axs[0][1].imshow(image)
+    axs[1][0].plot(signal[0], signal[1], "o", ms=2).set(title="IQ")
+    axs[1][1].scatter(points.real, points.imag, s=4)
+    fig.suptitle("Report page")
+
+
+def run(pages, save: bool, pool=None) -> float:
+    start = time.perf_counter()
+    for data in pages:
+        if pool is None:
+            fig, axs = ap.subplots(2, 2, figsize=FIGSIZE)
+        else:
+            fig = pool.acquire()
+            axs = pool.axes(fig)
+        draw_page(fig, axs, data)
+        if save:
+            fig.savefig(io.BytesIO(), format="png", dpi=50)
+        if pool is None:
+            plt.close(fig)
+        else:
+            pool.release(fig)
+    return len(pages) / (time.perf_counter() - start)
+
+
+def main(n_pages: int = 100):
+    rng = np.random.default_rng(0)
+    pages = [
+        (rng.normal(size=(2, 500)), rng.normal(size=(50, 60)), rng.normal(size=200) + 1j * rng.normal(size=200))
+        for _ in range(n_pages)
+    ]
+    print(f"{n_pages} pages")
+    for save in (False, True):
+        legacy = run(pages, save)
+        pooled = run(pages, save, ap.FigurePool(2, 2, figsize=FIGSIZE))
+        stage = "build + savefig" if save else "build"
+        print(f"{stage:<15} ap.subplots: {legacy:7.1f} pages/s")
+        print(f"{stage:<15} FigurePool:  {pooled:7.1f} pages/s  ({pooled / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
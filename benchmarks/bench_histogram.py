@@ -0,0 +1,40 @@
+"""Binning of single-shot IQ points into a 200x200 histogram.
+
+Compares `Histogram2D`, which computes the bin of each point arithmetically and
+counts with `np.bincount`, with `np.histogram2d`, which `AAxes.hist2d` used before.
+
+Usage:
+    python benchmarks/bench_histogram.py [number of points]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from aplot.core.histogram import Histogram2D
+
+BINS = 200
+RANGE = [[-4, 4], [-4, 4]]
+
+
+def main(size: int = 20_000_000):
+    rng = np.random.default_rng(0)
+    z = (rng.normal(size=size) + 1j * rng.normal(size=size)).astype(np.complex64)
+
+    start = time.perf_counter()
+    counts = np.histogram2d(z.real, z.imag, bins=BINS, range=RANGE)[0]
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hist = Histogram2D(BINS, RANGE).add_z(z)
+    new = time.perf_counter() - start
+    assert np.array_equal(hist.counts, counts)
+
+    print(f"{size:,} points")
+    print(f"np.histogram2d: {legacy:6.2f} s")
+    print(f"Histogram2D:    {new:6.2f} s  ({legacy / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
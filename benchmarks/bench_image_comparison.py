@@ -0,0 +1,68 @@
+"""Time of one figure comparison of 1000x800 pixels.
+
+Compares `aplot.testing.compare_figures`, which renders both figures to memory
+and compares the RGBA buffers with numpy, with the previous test helper, which
+saved both figures as PNG files and summed the pixel differences in Python.
+
+Usage:
+    python benchmarks/bench_image_comparison.py
+"""
+
+import os
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+import aplot as ap  # noqa: E402
+from aplot.testing import compare_figures  # noqa: E402
+
+
+def legacy_images_are_similar(image1_path, image2_path, tolerance=0.02):
+    with Image.open(image1_path) as img1, Image.open(image2_path) as img2:
+        if img1.size != img2.size or img1.mode != img2.mode:
+            return False
+        pairs = zip(img1.getdata(), img2.getdata())
+        dif = sum(abs(c1 - c2) for p1, p2 in pairs for c1, c2 in zip(p1, p2))
+        ncomponents = img1.size[0] * img1.size[1] * len(img1.getbands())
+        return (dif / 255.0 * 100) / ncomponents <= tolerance
+
+
+def legacy_compare(fig1, fig2, folder):
+    path1, path2 = os.path.join(folder, "fig1.png"), os.path.join(folder, "fig2.png")
+    fig1.savefig(path1)
+    fig2.savefig(path2)
+    return legacy_images_are_similar(path1, path2)
+
+
+def make_figure():
+    x = np.linspace(0, 10, 1000)
+    return ap.axs(2, 2, figsize=(10, 8), dpi=100).plot(x, np.sin(x)).figure
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    fig1, fig2 = make_figure(), make_figure()
+    with tempfile.TemporaryDirectory() as folder:
+        legacy, legacy_result = best_time(lambda: legacy_compare(fig1, fig2, folder))
+    new, new_result = best_time(lambda: compare_figures(fig1, fig2).equal)
+    assert legacy_result and new_result
+    print(f"legacy (savefig + python loop): {legacy * 1e3:8.1f} ms")
+    print(f"in-memory numpy comparison:     {new * 1e3:8.1f} ms  ({legacy / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Import time of aplot reported by `python -X importtime`.
+
+"before" imports everything that `import aplot` used to load eagerly
+(analysis with scipy.ndimage and scipy.signal, styles, animation),
+"after" is a plain `import aplot` with lazy module loading.
+
+Usage:
+    python benchmarks/bench_import_time.py [repeat]
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import Tuple
+
+STATEMENTS = {
+    "before": (
+        "import aplot, aplot.analysis, aplot.animation, aplot.styles, "
+        "scipy.ndimage, scipy.signal"
+    ),
+    "after": "import aplot",
+}
+
+
+def import_time(statement: str) -> Tuple[float, int]:
+    """Return the total import time in milliseconds and the number of modules."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, n_modules = 0, 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, _ = line[len("import time:") :].split("|")
+        total += int(self_us)
+        n_modules += 1
+    return total / 1000, n_modules
+
+
+def main(repeat: int = 5):
+    results = {}
+    for label, statement in STATEMENTS.items():
+        times = [import_time(statement) for _ in range(repeat)]
+        results[label] = statistics.median(t for t, _ in times)
+        print(f"{label:>8}: {results[label]:8.1f} ms, {times[0][1]} modules  ({statement})")
+    print(f"{'saved':>8}: {results['before'] - results['after']:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,83 @@
+"""Cost of `AxesList.set` on a 10x10 grid.
+
+Compares the per-class setter index of `filter_set_kwargs` and the grouped
+`AxesList.set` with the previous implementation, which probed
+`getattr(obj, f"set_{k}")` for every keyword and called `ax.set` once per keyword.
+
+Usage:
+    python benchmarks/bench_set_kwargs.py
+"""
+
+import timeit
+import typing as _t
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+import aplot as ap  # noqa: E402
+from aplot.core import axes_class, axes_list, utils  # noqa: E402
+
+KWARGS = dict(
+    title="Trace",
+    xlabel="Time",
+    ylabel="Signal",
+    xlim=(0, 1),
+    facecolor="white",
+    alpha=1,
+    not_a_property=1,
+)
+
+
+def legacy_filter_set_kwargs(obj, additional_: _t.Optional[_t.List[str]] = None, **kwargs):
+    for k in list(kwargs.keys()):
+        if additional_ and k in additional_:
+            continue
+        func = getattr(obj, f"set_{k}", None)
+        if not callable(func):
+            kwargs.pop(k)
+    return kwargs
+
+
+def legacy_axes_list_set(self, **kwargs):
+    kwargs = legacy_filter_set_kwargs(axes_class.AAxes, **kwargs)
+    for k, v in kwargs.items():
+        if isinstance(v, (list, tuple)) and len(self) == len(v):
+            for ax, val in zip(self, v):
+                ax.set(**{k: val})
+        else:
+            for ax in self:
+                ax.set(**{k: v})
+    return self
+
+
+def bench(filter_func, axes_list_set, number: int = 20):
+    axes_class.filter_set_kwargs = filter_func
+    axes_list.AxesList.set = axes_list_set
+    axs = ap.axs(10, 10, figsize=(12, 12))
+    axs.set(**KWARGS)
+    total = min(timeit.repeat(lambda: axs.set(**KWARGS), number=number, repeat=5)) / number
+    probe = min(timeit.repeat(lambda: filter_func(axes_class.AAxes, **KWARGS), number=10_000, repeat=5)) / 10_000
+    plt.close("all")
+    return total, probe
+
+
+def main():
+    print(f"{'':>8} {'AxesList.set 10x10':>20} {'filter_set_kwargs':>20}")
+    results = {}
+    implementations = {
+        "before": (legacy_filter_set_kwargs, legacy_axes_list_set),
+        "after": (utils.filter_set_kwargs, axes_list.AxesList.set),
+    }
+    for label, (filter_func, axes_list_set) in implementations.items():
+        results[label] = bench(filter_func, axes_list_set)
+        total, probe = results[label]
+        print(f"{label:>8} {total*1e3:>17.2f} ms {probe*1e6:>17.2f} us")
+    (total_0, probe_0), (total_1, probe_1) = results["before"], results["after"]
+    print(f"{'speedup':>8} {total_0/total_1:>19.2f}x {probe_0/probe_1:>19.2f}x")
+
+
+if __name__ == "__main__":
+    main()
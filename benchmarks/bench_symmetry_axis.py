@@ -0,0 +1,51 @@
+"""Symmetry axis of 2k x 2k maps: 1d rFFT row correlation against the full 2d fftconvolve.
+
+Usage:
+    python benchmarks/bench_symmetry_axis.py
+"""
+
+import time
+
+import numpy as np
+import scipy.signal
+
+from aplot.analysis import find_h_symmetry_axes, find_h_symmetry_axis
+
+N_MAPS, NY, NX = 4, 2048, 2048
+
+
+def legacy_find_h_symmetry_axis(data):
+    data = (data - np.mean(data)) / np.std(data)
+    corr = scipy.signal.fftconvolve(data, data[::-1], mode="full")
+    return int((np.argmax(corr) % corr.shape[-1]) / 2)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    rng = np.random.default_rng(0)
+    x = np.arange(NX)
+    centers = rng.uniform(0.3 * NX, 0.7 * NX, N_MAPS)
+    maps = np.array(
+        [np.exp(-(((x - c) / 50) ** 2))[None] + 0.3 * rng.normal(size=(NY, NX)) for c in centers]
+    )
+    find_h_symmetry_axes(maps[:1])  # warm up the FFT plans
+
+    before, legacy = timed(lambda: [legacy_find_h_symmetry_axis(m) for m in maps])
+    after_int, compatible = timed(lambda: [find_h_symmetry_axis(m) for m in maps])
+    after, positions = timed(lambda: find_h_symmetry_axes(maps))
+    assert legacy == compatible
+
+    print(f"{N_MAPS} maps of {NY}x{NX}, per map:")
+    print(f"{'fftconvolve 2d':>28} {before / N_MAPS * 1e3:>8.1f} ms")
+    print(f"{'find_h_symmetry_axis':>28} {after_int / N_MAPS * 1e3:>8.1f} ms {before / after_int:>6.1f}x")
+    print(f"{'find_h_symmetry_axes float32':>28} {after / N_MAPS * 1e3:>8.1f} ms {before / after:>6.1f}x")
+    print(f"max error to the true centers: {np.max(np.abs(positions - centers)):.3f} px")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Peak memory of the data preparation of `AxesList.plot_z_2d`.
+
+Compares `z_transform` (one pass over blocks of rows, float64 or float32 output)
+with the previous code, which allocated a full-size temporary for every step.
+Each case runs in a fresh process, the peak RSS above the input is reported.
+
+Usage:
+    python benchmarks/bench_z_transform_memory.py [size]
+"""
+
+import multiprocessing
+import resource
+import sys
+import time
+
+import numpy as np
+
+
+def legacy(z):
+    data1 = 20 * np.log10(np.abs(z))
+    data2 = np.angle(z) * 180 / np.pi
+    data2 = np.unwrap(data2, period=360)
+    return data1, data2
+
+
+def new(z, dtype=None):
+    from aplot.core.ztransform import z_transform
+
+    return z_transform(z, "bode_db", unwrap=True, dtype=dtype)
+
+
+CASES = {
+    "before": legacy,
+    "after": new,
+    "after float32": lambda z: new(z, np.float32),
+}
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(case: str, size: int, queue):
+    if case != "before":
+        import aplot.core.ztransform  # noqa: F401  # pylint: disable=unused-import
+
+    rng = np.random.default_rng(0)
+    z = np.empty((size, size), dtype=np.complex128)
+    for i in range(size):
+        z[i] = np.exp(1j * rng.uniform(0, 2 * np.pi, size))
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    result = CASES[case](z)
+    elapsed = time.perf_counter() - start
+    output = sum(r.nbytes for r in result) / 2**20
+    queue.put((peak_rss_mb() - baseline, output, elapsed))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    print(f"z: {size}x{size} complex128, {size * size * 16 / 2**20:.0f} MB")
+    print(f"{'':>14} {'peak above input':>18} {'output':>10} {'temporaries':>12} {'time':>8}")
+    context = multiprocessing.get_context("spawn")
+    for case in CASES:
+        queue = context.Queue()
+        process = context.Process(target=run, args=(case, size, queue))
+        process.start()
+        peak, output, elapsed = queue.get()
+        process.join()
+        print(f"{case:>14} {peak:>15.0f} MB {output:>7.0f} MB {peak - output:>9.0f} MB {elapsed:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
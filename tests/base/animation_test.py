@@ -0,0 +1,54 @@
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aplot as ap
+from aplot.animation import BlitAnimator
+
+
+def make_grid():
+    x = np.linspace(0, 2 * np.pi, 100)
+    axs = ap.axs(2, 2).plot(x, np.sin(x))
+    return axs, x, [ax.get_lines()[0] for ax in axs.flat()]
+
+
+class BlitAnimatorTest(unittest.TestCase):
+    def tearDown(self):
+        plt.close("all")
+
+    def test_frame_same_as_full_draw(self):
+        axs, x, lines = make_grid()
+        animator = BlitAnimator(axs, *lines, fps=None)
+
+        def update(i):
+            for line in lines:
+                line.set_ydata(np.cos(x + i))
+
+        animator.run(update, frames=3)
+        blitted = np.asarray(axs.figure.canvas.buffer_rgba()).copy()
+
+        axs2, _, lines2 = make_grid()
+        for line in lines2:
+            line.set_ydata(np.cos(x + 2))
+        axs2.figure.canvas.draw()
+        full = np.asarray(axs2.figure.canvas.buffer_rgba())
+
+        np.testing.assert_array_equal(blitted, full)
+
+    def test_disconnect(self):
+        axs, _, lines = make_grid()
+        animator = BlitAnimator(axs[0][0], lines[0])
+        self.assertTrue(lines[0].get_animated())
+        animator.disconnect()
+        self.assertFalse(lines[0].get_animated())
+
+    def test_wrong_figure(self):
+        axs, _, _ = make_grid()
+        _, _, lines = make_grid()
+        with self.assertRaises(ValueError):
+            BlitAnimator(axs, lines[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
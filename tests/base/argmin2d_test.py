@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+import scipy.ndimage
+
+from aplot.analysis import argmin2d, argmin2d_batch
+
+
+def reference(d, x_mask=None, y_mask=None, filter_=None):
+    d = np.array(d, dtype=float)
+    if filter_:
+        d = scipy.ndimage.uniform_filter(d, size=filter_, mode="nearest")
+    if x_mask is not None:
+        d[:, ~np.asarray(x_mask)] = np.nan
+    if y_mask is not None:
+        d[~np.asarray(y_mask), :] = np.nan
+    index = np.nanargmin(d)
+    return index // d.shape[1], index % d.shape[1]
+
+
+class Argmin2dTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(size=(40, 20, 30))
+        self.data[:, 3, 4] = np.nan
+        self.x_mask = np.zeros(30, dtype=bool)
+        self.x_mask[5:21] = True
+        self.y_mask = rng.random(20) > 0.3
+
+    def test_same_as_loop(self):
+        for filter_ in (None, 3, 5):
+            iy, ix = argmin2d_batch(self.data, x_mask=(5, 20), y_mask=self.y_mask, filter_=filter_)
+            for i, d in enumerate(self.data):
+                expected = reference(d, self.x_mask, self.y_mask, filter_)
+                self.assertEqual((iy[i], ix[i]), expected)
+                self.assertEqual(argmin2d(d, x_mask=(5, 20), y_mask=self.y_mask, filter_=filter_), expected)
+
+    def test_per_map_masks(self):
+        x_masks = np.random.default_rng(1).random((40, 30)) > 0.5
+        iy, ix = argmin2d_batch(self.data, x_mask=x_masks)
+        for i, d in enumerate(self.data):
+            self.assertEqual((iy[i], ix[i]), reference(d, x_masks[i]))
+
+    def test_input_not_modified(self):
+        data = self.data.copy()
+        argmin2d_batch(self.data, x_mask=(5, 20), y_mask=self.y_mask, filter_=3)
+        argmin2d(self.data[0], x_mask=self.x_mask, y_mask=(2, 10))
+        np.testing.assert_array_equal(self.data, data)
+
+    def test_all_nan(self):
+        data = self.data.copy()
+        data[2, :, :10] = np.nan
+        with self.assertRaises(ValueError):
+            argmin2d_batch(data, x_mask=(0, 9))
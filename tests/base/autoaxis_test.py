@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+import aplot as ap
+from aplot.core.utils import get_auto_args
+
+
+def get_args_of_caller(name="plot"):
+    return get_auto_args(0, name)
+
+
+class AutoAxisTest(unittest.TestCase):
+    def test_single_line(self):
+        time, signal_amplitude = np.arange(10), np.arange(10)
+        ax = ap.axs().plot(time, signal_amplitude).autoaxis()
+        self.assertEqual(ax.get_xlabel(), "Time")
+        self.assertEqual(ax.get_ylabel(), "Signal amplitude")
+
+    def test_multi_line(self):
+        x = np.linspace(0, 1, 10)
+        ax = (
+            ap.axs()
+            .plot(
+                x,
+                np.sin(2 * x),
+                label="sin",
+            )
+            .autoaxis()
+        )
+        self.assertEqual(ax.get_xlabel(), "x")
+        self.assertEqual(ax.get_ylabel(), "Np.sin(2 * x)")
+
+    def test_other_function(self):
+        self.assertEqual(get_args_of_caller("max"), [])
+        self.assertEqual(
+            [get_args_of_caller("sorted"), sorted([3, 1], reverse=True)][0],
+            ["[3, 1]", "True"],
+        )
+
+    def test_no_call(self):
+        ax = ap.axs()
+        ax.plot([1, 2], [3, 4])
+        self.assertEqual(ax.autoaxis().get_xlabel(), "")
+
+    def test_in_loop(self):
+        frequency = np.arange(5)
+        for power__dbm in [frequency, frequency**2]:
+            ax = ap.axs().plot(frequency, power__dbm).autoaxis()
+            self.assertEqual((ax.get_xlabel(), ax.get_ylabel()), ("Frequency", "Power, dbm"))
@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+import scipy.signal
+
+from aplot.analysis import remove_background
+
+
+def convolve_remove_background(data, convolve_len=None):
+    """Previous implementation with convolve2d."""
+    if convolve_len is None:
+        convolve_len = min(50, len(data) // 15)
+    data = (
+        data
+        - scipy.signal.convolve2d(data, np.ones((convolve_len, 1)), mode="same", boundary="symm")
+        / convolve_len
+    )
+    return data - data.mean(axis=1)[:, np.newaxis]
+
+
+class RemoveBackgroundTest(unittest.TestCase):
+    def test_same_as_convolve(self):
+        rng = np.random.default_rng(0)
+        for shape, convolve_len in [((300, 40), None), ((100, 7), 8), ((30, 20), 50), ((64, 3), 1)]:
+            data = rng.normal(size=shape) + np.linspace(0, 5, shape[0])[:, None]
+            np.testing.assert_allclose(
+                remove_background(data, convolve_len, block_size=100),
+                convolve_remove_background(data, convolve_len),
+                atol=1e-12,
+            )
+
+    def test_inplace_and_float32(self):
+        data = np.random.default_rng(1).normal(size=(200, 30))
+        expected = convolve_remove_background(data)
+
+        result = remove_background(data, dtype=np.float32)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+
+        copy = data.copy()
+        result = remove_background(copy, inplace=True)
+        self.assertIs(result, copy)
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            remove_background(np.ones((10, 10), dtype=int), inplace=True)
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import aplot as ap
+from aplot.batch import RenderSpec, render_batch
+
+
+def plot_trace(x, y, title=""):
+    return ap.axs().plot(x, y).set(title=title)
+
+
+def plot_fail(x):
+    raise RuntimeError(f"Cannot plot {len(x)} points")
+
+
+class RenderBatchTest(unittest.TestCase):
+    def test_bytes_and_errors(self):
+        x = np.linspace(0, 1, 1000)
+        specs = [
+            RenderSpec(plot_trace, {"x": x, "y": np.sin(x * i)}, {"title": str(i)})
+            for i in range(3)
+        ]
+        specs.insert(1, RenderSpec(plot_fail, {"x": x}))
+        results = render_batch(specs, processes=2, shared_memory_threshold=0)
+
+        self.assertEqual([r.index for r in results], [0, 1, 2, 3])
+        self.assertEqual([r.ok for r in results], [True, False, True, True])
+        self.assertIn("Cannot plot 1000 points", results[1].error)
+        self.assertTrue(results[0].data.startswith(b"\x89PNG"))
+
+    def test_save_to_path(self):
+        x = np.linspace(0, 1, 100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.png")
+            results = render_batch([RenderSpec(plot_trace, {"x": x, "y": x}, path=path)], processes=1)
+            self.assertEqual(results[0].path, path)
+            self.assertIsNone(results[0].data)
+            self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aplot as ap
+from aplot.core.axes_class import AAxes
+
+
+class ChainedMethodsTest(unittest.TestCase):
+    def tearDown(self):
+        plt.close("all")
+
+    def test_plot_returns_axes(self):
+        ax = ap.axs()
+        res = ax.plot(np.arange(3), np.arange(3))
+        self.assertIs(res, ax)
+        self.assertEqual(len(ax.res), 1)
+
+    def test_set_returns_axes(self):
+        ax = ap.axs()
+        self.assertIs(ax.set_xlim(0, 2), ax)
+        self.assertEqual(tuple(ax.res), (0, 2))
+
+    def test_axes_result_is_not_wrapped(self):
+        ax = ap.axs()
+        ax2 = ax.twinx()
+        self.assertIsNot(ax2, ax)
+
+    def test_no_getattribute_hook(self):
+        self.assertNotIn("__getattribute__", vars(AAxes))
+
+    def test_subclass_methods_are_chained(self):
+        class MyAxes(AAxes):
+            def set_something(self, value):
+                return value * 2
+
+        fig = plt.figure()
+        ax = MyAxes(fig, (0, 0, 1, 1))
+        self.assertIs(ax.set_something(2), ax)
+        self.assertEqual(ax.res, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+import aplot as ap
+
+from ..test_utils import ImageTest
+
+
+def get_traces(n_traces: int = 20, length: int = 100):
+    x = np.linspace(0, 2 * np.pi, length)
+    return x, np.sin(x + np.linspace(0, 1, n_traces)[:, None])
+
+
+class CollectionTest(ImageTest):
+    def test_same_as_lines(self):
+        x, data = get_traces()
+        ax1 = ap.axs().plot(x, data, collection=True, color="C0")
+        self.assertIsInstance(ax1.res, LineCollection)
+
+        _, ax2 = plt.subplots()
+        for trace in data:
+            ax2.plot(x, trace, color="C0")
+
+        self.assertFigEqual(ax1, ax2)
+
+    def test_per_trace_colors(self):
+        x, data = get_traces(3)
+        ax = ap.axs().plot(x, data, collection=True, color=["r", "g", "b"], alpha=[0.1, 0.5, 1])
+        colors = ax.res.get_colors()
+        np.testing.assert_allclose(colors[:, 3], [0.1, 0.5, 1])
+        np.testing.assert_allclose(colors[0, :3], [1, 0, 0])
+
+    def test_axes_list(self):
+        x, data = get_traces(4)
+        axs = ap.axs(1, 2).plot(x, data, collection=True, keep_xlims=True)
+        for ax in axs:
+            self.assertEqual(len(ax.collections), 1)
+            self.assertEqual(ax.get_xlim(), (0, 1))
+
+        axs = ap.axs(1, 2).plot(x, np.stack([data, 2 * data]), collection=True)
+        self.assertAlmostEqual(axs[1].dataLim.ymax, 2 * data.max())
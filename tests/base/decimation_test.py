@@ -0,0 +1,58 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aplot as ap
+from aplot.core.decimation import lttb_indices, minmax_indices
+
+from ..test_utils import ImageTest
+
+
+def get_long_data(length: int = 200_000):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 10, length)
+    y = np.sin(x) + 0.3 * rng.standard_normal(length)
+    return x, y
+
+
+class DecimationTest(ImageTest):
+    def test_minmax_same_as_full(self):
+        x, y = get_long_data()
+        ax1 = ap.axs().plot(x, y, decimate=True)
+        self.assertLess(len(ax1.res[0].get_xdata()), 8 * ax1.bbox.width)
+
+        _, ax2 = plt.subplots()
+        ax2.plot(x, y)
+
+        self.assertFigEqual(ax1, ax2)
+
+    def test_redecimate_on_xlim_changed(self):
+        x, y = get_long_data()
+        ax1 = ap.axs().plot(x, y, decimate="minmax").set_xlim(2, 3)
+        xdata = ax1.get_lines()[0].get_xdata()
+        self.assertLess(xdata[-1] - xdata[0], 1.01)
+        self.assertLessEqual(xdata[0], 2)
+        self.assertGreaterEqual(xdata[-1], 3)
+
+        _, ax2 = plt.subplots()
+        ax2.plot(x, y)
+        ax2.set_xlim(2, 3)
+
+        self.assertFigEqual(ax1, ax2)
+
+    def test_axes_list_pass_through(self):
+        x, y = get_long_data(10_000)
+        axs = ap.axs(1, 2).plot(x, y, decimate="lttb", decimate_pixels=100)
+        for ax in axs:
+            self.assertLessEqual(len(ax.get_lines()[0].get_xdata()), 200)
+
+    def test_indices(self):
+        y = np.random.rand(1000)
+        indices = minmax_indices(np.arange(1000), y, np.linspace(0, 999, 11))
+        self.assertIn(np.argmax(y), indices)
+        self.assertIn(np.argmin(y), indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+        indices = lttb_indices(np.arange(1000), y, 50)
+        self.assertEqual(len(indices), 50)
+        self.assertEqual((indices[0], indices[-1]), (0, 999))
+        self.assertTrue(np.all(np.diff(indices) > 0))
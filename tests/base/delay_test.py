@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from aplot.analysis import correct_for_delay, estimate_delay
+
+
+def get_traces(noise: float = 0.0):
+    freqs = np.linspace(5e9, 5.1e9, 401)
+    delays = np.array([30e-9, -45e-9, 12e-9])
+    rng = np.random.default_rng(0)
+    z = np.exp(2j * np.pi * delays[:, None] * freqs + 0.3j)
+    z += noise * (rng.normal(size=z.shape) + 1j * rng.normal(size=z.shape))
+    return freqs, delays, z
+
+
+class DelayTest(unittest.TestCase):
+    def test_same_as_single_trace(self):
+        freqs, _, z = get_traces(noise=0.1)
+        _, corrected = correct_for_delay(freqs, z)
+        for trace, expected in zip(z, corrected):
+            # Previous single trace implementation.
+            delay = np.sum(np.angle(trace[1:] / trace[:-1]) / np.diff(freqs)) / len(trace) / 2 / np.pi
+            single = np.exp(-1j * 2 * np.pi * delay * freqs) * trace
+            single = single * np.exp(-1j * np.mean(np.unwrap(np.angle(single), axis=-1)))
+            np.testing.assert_allclose(correct_for_delay(freqs, trace)[1], single)
+            np.testing.assert_allclose(expected, single)
+
+    def test_fft_robust_to_noise(self):
+        freqs, delays, z = get_traces(noise=0.8)
+        np.testing.assert_allclose(estimate_delay(freqs, z, method="fft"), delays, rtol=0.02)
+        with self.assertRaises(ValueError):
+            estimate_delay(freqs**2, z, method="fft")
+
+    def test_out(self):
+        freqs, _, z = get_traces()
+        _, corrected = correct_for_delay(freqs, z, method="fft", out=z)
+        self.assertIs(corrected, z)
+        np.testing.assert_allclose(np.angle(corrected), 0, atol=1e-2)
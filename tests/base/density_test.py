@@ -0,0 +1,105 @@
+import io
+import unittest
+
+import numpy as np
+from matplotlib.colors import LogNorm
+
+import aplot as ap
+from aplot.core.density import DensityImage, EqHistNorm
+
+
+def draw(ax):
+    ax.figure.savefig(io.BytesIO(), format="png", cache=False)
+
+
+class DensityTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.normal(size=50000)
+        self.y = rng.normal(size=50000)
+
+    def tearDown(self):
+        ap.close()
+
+    def test_scatter_density_counts_visible_points(self):
+        ax = ap.axs().scatter(self.x, self.y, density=True)
+        im = ax.res
+        self.assertIsInstance(im, DensityImage)
+        self.assertIsInstance(im.norm, EqHistNorm)
+        self.assertEqual(len(ax.collections), 0)
+        draw(ax)
+        grid = im.get_array()
+        self.assertEqual(grid.shape, (int(np.ceil(ax.bbox.height)), int(np.ceil(ax.bbox.width))))
+        # The view includes the margins, so all the points are inside.
+        self.assertEqual(grid.sum(), len(self.x))
+
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        draw(ax)
+        inside = (self.x >= 0) & (self.x <= 1) & (self.y >= 0) & (self.y <= 1)
+        self.assertEqual(im.get_array().sum(), inside.sum())
+
+    def test_chunks_and_mean(self):
+        ax = ap.axs().scatter(self.x[:100], self.y[:100], density="count", pixel_size=4)
+        im = ax.res
+        im.add(self.x[100:], self.y[100:])
+        self.assertEqual(len(im), len(self.x))
+        draw(ax)
+        self.assertEqual(im.get_array().sum(), len(self.x))
+
+        c = np.ones_like(self.x) * 3
+        ax = ap.axs().scatter(self.x, self.y, c=c, density=True, density_norm="log")
+        im = ax.res
+        self.assertEqual(im.mode, "mean")
+        self.assertIsInstance(im.norm, LogNorm)
+        draw(ax)
+        np.testing.assert_allclose(im.get_array().compressed(), 3)
+
+    def test_color_c_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ap.axs().scatter(self.x, self.y, c="r", density=True)
+        with self.assertRaises(ValueError):
+            ap.axs().scatter(self.x, self.y, c=np.ones(10), density=True)
+
+    def test_eq_hist_limits(self):
+        ax = ap.axs().scatter(self.x, self.y, density=True, vmin=0, vmax=3)
+        im = ax.res
+        draw(ax)
+        self.assertEqual((im.norm.vmin, im.norm.vmax), (0, 3))
+        self.assertEqual(im.norm.levels[0], 0)
+        self.assertEqual(im.norm.levels[-1], 3)
+        self.assertEqual(im.norm(np.array([10.0]))[0], 1)
+
+    def test_colorbar(self):
+        ax = ap.axs().scatter(self.x, self.y, density=True)
+        im = ax.res
+        cbar = ax.figure.colorbar(im, ax=ax)
+        draw(ax)
+        ax.set_xlim(0, 1)
+        draw(ax)
+        self.assertIn(cbar.ax, ax.figure.axes)
+        self.assertEqual(cbar.vmax, im.norm.vmax)
+
+    def test_z_parametric_density(self):
+        z = self.x + 1j * self.y
+        ax = ap.axs().z_parametric(z, density=True, cmap="viridis")
+        self.assertIsInstance(ax.res, DensityImage)
+        self.assertEqual(len(ax.lines), 0)
+        xlim = ax.get_xlim()
+        self.assertLess(xlim[0], self.x.min())
+        self.assertGreater(xlim[1], self.x.max())
+
+    def test_eq_hist_norm(self):
+        data = np.ma.masked_equal(np.array([[0, 1, 1, 1], [2, 2, 10, 100]]), 0)
+        norm = EqHistNorm()
+        values = norm(data)
+        self.assertTrue(values.mask[0, 0])
+        self.assertEqual(values[0, 1], 0)
+        self.assertEqual(values[1, 3], 1)
+        # Equalized: 10 is at the 6/7 quantile even if it is close to 2 on a linear scale.
+        self.assertAlmostEqual(values[1, 2], (6 / 7 - 3 / 7) / (1 - 3 / 7))
+        np.testing.assert_allclose(norm.inverse(norm(np.array([1.0, 2.0, 10.0]))), [1, 2, 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+
+import numpy as np
+
+import aplot as ap
+from aplot.core.figure_pool import FigurePool
+from aplot.testing import compare_figures
+
+
+def draw_page(fig, axs, seed: int):
+    rng = np.random.default_rng(seed)
+    axs[0].plot(np.arange(40), rng.normal(size=40)).set(title=f"Page {seed}", xlabel="time")
+    axs[0].plot(np.arange(40), rng.normal(size=40) + 3 * seed, "--")
+    axs[1].imshow(rng.normal(size=(20, 30 + seed)) * (seed + 1))
+    fig.suptitle(f"Report {seed}")
+
+
+class FigurePoolTest(unittest.TestCase):
+    def tearDown(self):
+        ap.close()
+
+    def test_acquire_reuses_released_figure(self):
+        pool = FigurePool(1, 2, figsize=(6, 3))
+        fig = pool.acquire()
+        self.assertIsInstance(fig, ap.Figure)
+        pool.release(fig)
+        self.assertIs(pool.acquire(), fig)
+        self.assertIsNot(pool.acquire(), fig)
+        self.assertEqual((pool.created, pool.reused), (2, 1))
+
+    def test_pooled_pages_match_fresh_figures(self):
+        pool = FigurePool(1, 2, figsize=(6, 3))
+        for seed in range(3):
+            with pool.page() as (fig, axs):
+                draw_page(fig, axs, seed)
+                fresh, fresh_axs = ap.subplots(1, 2, figsize=(6, 3))
+                draw_page(fresh, fresh_axs, seed)
+                result = compare_figures(fig, fresh)
+                self.assertTrue(result, result.reason)
+        self.assertEqual(pool.created, 1)
+
+    def test_artists_are_reused(self):
+        pool = FigurePool(1, 2)
+        with pool.page() as (fig, axs):
+            draw_page(fig, axs, 0)
+            lines, image = list(axs[0].lines), axs[1].images[0]
+        with pool.page() as (fig, axs):
+            axs[0].plot(np.arange(40), np.zeros(40))
+            axs[0].plot(np.arange(10), np.ones(10), "o")
+            axs[1].imshow(np.ones((5, 5)))
+            self.assertIs(axs[0].lines[0], lines[0])
+            self.assertIsNot(axs[0].lines[1], lines[1])
+            np.testing.assert_array_equal(lines[0].get_ydata(), np.zeros(40))
+            self.assertIs(axs[1].images[0], image)
+            self.assertEqual(list(image.get_extent()), [-0.5, 4.5, -0.5, 4.5])
+            # The colorbar axes is added back, not created again.
+            self.assertEqual(len(fig.get_axes()), 3)
+
+    def test_reused_artists_restore_properties(self):
+        pool = FigurePool(1, 2)
+        with pool.page() as (fig, axs):
+            draw_page(fig, axs, 0)
+            axs[0].lines[0].set_alpha(0.1)
+            axs[0].lines[0].set_linestyle("--")
+            axs[1].images[0].set_cmap("gray")
+        with pool.page() as (fig, axs):
+            draw_page(fig, axs, 1)
+            self.assertIsNone(axs[0].lines[0].get_alpha())
+            self.assertEqual(axs[0].lines[0].get_linestyle(), "-")
+            self.assertEqual(axs[1].images[0].get_cmap().name, "viridis")
+            fresh, fresh_axs = ap.subplots(1, 2)
+            draw_page(fresh, fresh_axs, 1)
+            result = compare_figures(fig, fresh)
+            self.assertTrue(result, result.reason)
+
+    def test_reset_clears_page(self):
+        pool = FigurePool(1, 1)
+        with pool.page() as (fig, ax):
+            ax.plot([1, 2, 3], [1, 10, 100]).set(title="Title", ylabel="y", yscale="log", xlim=(0, 5))
+            ax.scatter([1, 2], [3, 4]).legend(["a"])
+            ax.text(0, 0, "note")
+        fig = pool.acquire()
+        ax = pool.axes(fig)
+        self.assertEqual((ax.get_title(), ax.get_ylabel(), ax.get_yscale()), ("", "", "linear"))
+        self.assertEqual(ax.get_xlim(), (0, 1))
+        self.assertTrue(ax.get_autoscalex_on())
+        self.assertEqual(len(ax.get_children()), len(ap.ax().get_children()))
+        ax.plot([5, 6], [7, 8])
+        ax.relim()
+        np.testing.assert_array_equal(ax.dataLim.get_points(), [[5, 7], [6, 8]])
+
+    def test_release_errors(self):
+        pool = FigurePool()
+        fig = pool.acquire()
+        pool.release(fig)
+        with self.assertRaises(ValueError):
+            pool.release(fig)
+        with self.assertRaises(ValueError):
+            pool.release(ap.figure())
+
+    def test_max_idle(self):
+        pool = FigurePool(max_idle=1)
+        figs = [pool.acquire() for _ in range(3)]
+        for fig in figs:
+            pool.release(fig)
+        self.assertEqual(pool.idle, 1)
+        pool.clear()
+        self.assertEqual(pool.idle, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aplot as ap
+from aplot.core.histogram import Histogram2D
+
+
+class Histogram2DTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.normal(size=20000)
+        self.y = rng.normal(size=20000)
+
+    def tearDown(self):
+        ap.close()
+
+    def test_same_as_numpy(self):
+        for bins, value_range in [
+            (50, None),
+            ((30, 40), [[-2, 2], [-1, 3]]),
+            ([np.linspace(-3, 3, 11) ** 3 / 9, np.linspace(-1, 1, 5)], None),
+        ]:
+            hist = Histogram2D(bins, value_range).add(self.x, self.y)
+            counts, xedges, yedges = np.histogram2d(self.x, self.y, bins=bins, range=value_range)
+            np.testing.assert_array_equal(hist.counts, counts)
+            np.testing.assert_allclose(hist.xedges, xedges)
+            np.testing.assert_allclose(hist.yedges, yedges)
+
+    def test_accumulation_in_chunks(self):
+        value_range = [[-3, 3], [-3, 3]]
+        hist = Histogram2D(40, value_range, block_size=1000)
+        for start in range(0, len(self.x), 7000):
+            hist.add_z(self.x[start : start + 7000] + 1j * self.y[start : start + 7000])
+        counts = np.histogram2d(self.x, self.y, bins=40, range=value_range)[0]
+        np.testing.assert_array_equal(hist.counts, counts)
+        self.assertEqual(hist.total, counts.sum())
+
+        weights = np.abs(self.x)
+        weighted = Histogram2D(40, value_range).add(self.x, self.y, weights=weights)
+        np.testing.assert_allclose(
+            weighted.counts, np.histogram2d(self.x, self.y, bins=40, range=value_range, weights=weights)[0]
+        )
+        np.testing.assert_allclose(
+            weighted.values(density=True),
+            np.histogram2d(self.x, self.y, bins=40, range=value_range, weights=weights, density=True)[0],
+        )
+
+    def test_cmin_cmax_same_as_matplotlib(self):
+        value_range = [[-3, 3], [-3, 3]]
+        hist = Histogram2D(40, value_range).add(self.x, self.y)
+        for density, cmin, cmax in [(False, 5, 60), (True, 0.01, 0.1)]:
+            expected = plt.figure().add_subplot().hist2d(
+                self.x, self.y, bins=40, range=value_range, density=density, cmin=cmin, cmax=cmax
+            )[0]
+            values = hist.values(density=density, cmin=cmin, cmax=cmax)
+            np.testing.assert_array_equal(np.isnan(values), np.isnan(expected))
+            np.testing.assert_allclose(values[~np.isnan(values)], expected[~np.isnan(expected)])
+
+    def test_hist2d_without_y(self):
+        ax = ap.ax().hist2d(np.c_[self.x, self.y], bins=20)
+        counts, _, _, mesh = ax.res
+        np.testing.assert_array_equal(counts, np.histogram2d(self.x, self.y, bins=20)[0])
+        self.assertIn(mesh, ax.collections)
+
+    def test_hist_z_updates_mesh(self):
+        z = self.x + 1j * self.y
+        hist = Histogram2D(30, [[-3, 3], [-3, 3]])
+        ax = ap.ax()
+        ax.hist_z(z[:10000], histogram=hist)
+        mesh = hist.mesh
+        ax.hist_z(z[10000:], histogram=hist)
+        self.assertIs(hist.mesh, mesh)
+        self.assertEqual(len(ax.collections), 1)
+        np.testing.assert_array_equal(mesh.get_array(), hist.counts.T)
+        self.assertEqual(mesh.norm.vmax, hist.counts.max())
+
+    def test_axes_list_hist_z(self):
+        z = self.x + 1j * self.y
+        axs = ap.axs(1, 2)
+        hists = [Histogram2D(10, [[-6, 6], [-6, 6]]) for _ in range(2)]
+        axs.hist_z([z[:100], z[100:300]], histogram=hists)
+        self.assertEqual([hist.total for hist in hists], [100, 200])
+        with self.assertRaises(ValueError):
+            axs.hist_z(z, histogram=hists[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
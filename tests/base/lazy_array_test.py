@@ -0,0 +1,106 @@
+import os
+import tempfile
+
+import numpy as np
+
+import aplot as ap
+from aplot.core.pyramid import PyramidImage
+
+from ..test_utils import ImageTest
+
+
+class CountingArray:
+    """Lazily sliced array that records the number of elements read."""
+
+    def __init__(self, data):
+        self.data = data
+        self.shape = data.shape
+        self.ndim = data.ndim
+        self.dtype = data.dtype
+        self.read = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        result = np.array(self.data[key])
+        self.read += result.size
+        return result
+
+
+def get_map(ny: int = 1500, nx: int = 2000):
+    x, y = np.linspace(0, 1, nx), np.linspace(0, 1, ny)
+    return np.sin(20 * x)[None] * np.cos(10 * y)[:, None]
+
+
+class LazyArrayTest(ImageTest):
+    def setUp(self):
+        super().setUp()
+        self.folder = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.folder.cleanup()
+        super().tearDown()
+
+    def test_open_array(self):
+        data = get_map(30, 20)
+        np.save(os.path.join(self.folder.name, "map.npy"), data)
+        np.savez(os.path.join(self.folder.name, "maps.npz"), a=data, b=data.T)
+        np.savez_compressed(os.path.join(self.folder.name, "compressed.npz"), a=data)
+
+        array = ap.open_array(os.path.join(self.folder.name, "map.npy"))
+        self.assertIsInstance(array, np.memmap)
+        np.testing.assert_array_equal(array, data)
+        array = ap.open_array(os.path.join(self.folder.name, "maps.npz"), "b")
+        self.assertIsInstance(array, np.memmap)
+        np.testing.assert_array_equal(array, data.T)
+        with self.assertRaises(ValueError):
+            ap.open_array(os.path.join(self.folder.name, "maps.npz"))
+        with self.assertRaises(ValueError):
+            ap.open_array(os.path.join(self.folder.name, "compressed.npz"))
+
+    def test_memmap_zoomed_same_as_full(self):
+        data = get_map()
+        path = os.path.join(self.folder.name, "map.npy")
+        np.save(path, data)
+        # The color scale of lazy data comes from a strided sample, so it is fixed here.
+        ax1 = ap.axs().imshow(ap.open_array(path), vmin=-1, vmax=1).set_xlim(100, 200).set_ylim(300, 380)
+        ax2 = ap.axs().imshow(data, vmin=-1, vmax=1).set_xlim(100, 200).set_ylim(300, 380)
+        self.assertIsInstance(ax1.get_images()[0], PyramidImage)
+        self.assertFigEqual(ax1, ax2)
+
+    def test_memmap_on_non_uniform_grid(self):
+        data = get_map(30, 40)
+        path = os.path.join(self.folder.name, "map.npy")
+        np.save(path, data)
+        x, y = np.logspace(0, 2, 40), np.linspace(0, 1, 30)
+
+        ax1 = ap.axs().imshow(np.load(path, mmap_mode="r"), x=x, y=y)
+        ax2 = ap.axs().imshow(data, x=x, y=y)
+        self.assertNotIsInstance(ax1.res, PyramidImage)
+        self.assertEqual(ax1.res.renderer_choice, ax2.res.renderer_choice)
+        self.assertFigEqual(ax1, ax2)
+
+        ax1 = ap.axs().pcolorfast(x, y, np.load(path, mmap_mode="r"))
+        ax2 = ap.axs().pcolorfast(x, y, data)
+        self.assertNotIsInstance(ax1.res, PyramidImage)
+        self.assertEqual(ax1.res.renderer_choice, ax2.res.renderer_choice)
+        self.assertFigEqual(ax1, ax2)
+
+    def test_reads_only_visible_window(self):
+        lazy = CountingArray(get_map())
+        ax = ap.axs().imshow(lazy, colorbar=False)
+        ax.figure.canvas.draw()
+        self.assertLess(lazy.read, lazy.data.size / 4)
+
+        lazy.read = 0
+        ax.set_xlim(100, 150).set_ylim(200, 240)
+        ax.figure.canvas.draw()
+        self.assertLess(lazy.read, 60 * 50)
+
+    def test_axes_list_stack(self):
+        lazy = CountingArray(np.stack([get_map()] * 2))
+        axs = ap.axs(1, 2).imshow(lazy, colorbar=False)
+        axs.figure.canvas.draw()
+        self.assertIsInstance(axs[1].get_images()[0], PyramidImage)
+        self.assertLess(lazy.read, lazy.data.size / 4)
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import aplot as ap
+from aplot.core import profiling
+
+
+class ProfilingTest(unittest.TestCase):
+    def tearDown(self):
+        ap.close()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(profiling.active_profiler)
+        with ap.profile() as prof:
+            self.assertIs(profiling.active_profiler, prof)
+        self.assertIsNone(profiling.active_profiler)
+        ap.ax().plot([1, 2, 3])
+        self.assertEqual(prof.stats, {})
+
+    def test_records_calls(self):
+        x = np.linspace(0, 1, 100)
+        with ap.profile() as prof:
+            axs = ap.axs(1, 2)
+            axs.plot(x, np.sin(x)).set(title="title")
+            axs.grid(True)
+            axs[0].imshow(np.arange(200.0).reshape(10, 20))
+            axs.fig.label_axes()
+
+        stats = prof.stats
+        self.assertEqual(stats["AAxes.plot"].count, 2)
+        self.assertEqual(stats["AAxes.plot"].array_elements, 400)
+        self.assertEqual(stats["AAxes.plot"].max_array_elements, 100)
+        self.assertEqual(stats["AxesList.set"].count, 1)
+        self.assertEqual(stats["AxesList.grid"].count, 1)
+        self.assertEqual(stats["AAxes.imshow"].max_array_elements, 200)
+        self.assertEqual(stats["AFigure.label_axes"].count, 1)
+        for call in stats.values():
+            self.assertGreaterEqual(call.total_time, call.self_time - 1e-9)
+        self.assertGreaterEqual(stats["AxesList.set"].total_time, stats["AAxes.set"].total_time)
+        self.assertGreater(prof.wall_time, 0)
+
+    def test_nested_profilers(self):
+        with ap.profile() as outer:
+            ap.ax().plot([1, 2])
+            with ap.profile() as inner:
+                ap.ax().plot([1, 2])
+            self.assertIs(profiling.active_profiler, outer)
+        self.assertEqual(outer.stats["AAxes.plot"].count, 1)
+        self.assertEqual(inner.stats["AAxes.plot"].count, 1)
+
+    def test_export(self):
+        with ap.profile() as prof:
+            ap.ax().plot([1, 2]).set_title("title")
+        table = prof.table(limit=1)
+        self.assertEqual(len(table.splitlines()), 3)
+        self.assertIn("method", table.splitlines()[0])
+        with self.assertRaises(ValueError):
+            prof.table(sort="unknown")
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "profile.json")
+            text = prof.to_json(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file), json.loads(text))
+        names = [call["name"] for call in json.loads(text)["calls"]]
+        self.assertIn("AAxes.plot", names)
+        self.assertIn("AAxes.set_title", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
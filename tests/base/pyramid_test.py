@@ -0,0 +1,53 @@
+import numpy as np
+
+import aplot as ap
+from aplot.core.pyramid import ImagePyramid, pool2
+
+from ..test_utils import ImageTest
+
+
+def get_map(nx: int = 2000, ny: int = 1000):
+    x = np.linspace(1, 2, nx)
+    y = np.linspace(3, 5, ny)
+    xx, yy = np.meshgrid(x, y)
+    return x, y, np.sin(20 * xx) * np.cos(10 * yy)
+
+
+class PyramidTest(ImageTest):
+    def test_zoomed_same_as_full(self):
+        x, y, data = get_map()
+        ax1 = ap.axs().imshow(data, x=x, y=y, pyramid=True).set_xlim(1.2, 1.3)
+        ax2 = ap.axs().imshow(data, x=x, y=y).set_xlim(1.2, 1.3)
+
+        self.assertFigEqual(ax1, ax2)
+        im1, im2 = ax1.get_images()[0], ax2.get_images()[0]
+        self.assertEqual(im1.get_clim(), im2.get_clim())
+        self.assertEqual(list(im1.get_extent()), list(im2.get_extent()))
+
+    def test_coarse_level_when_zoomed_out(self):
+        _, _, data = get_map()
+        ax = ap.axs().imshow(data, pyramid="max")
+        ax.figure.canvas.draw()
+        im = ax.get_images()[0]
+        self.assertGreater(im._window[0], 0)
+        self.assertLess(im.get_array().size, data.size)
+        self.assertEqual(im.get_clim(), (data.min(), data.max()))
+
+    def test_pcolorfast(self):
+        x, y, data = get_map()
+        ax = ap.axs().pcolorfast(x=x, y=y, data=data, pyramid=True)
+        self.assertEqual(list(ax.get_images()[0].get_extent()), [1, 2, 3, 5])
+        with self.assertRaises(ValueError):
+            ap.axs().pcolorfast(x=x**2, y=y, data=data, pyramid=True)
+
+    def test_pool2(self):
+        data = np.arange(15, dtype=float).reshape(3, 5)
+        np.testing.assert_allclose(
+            pool2(data, "mean"), [[3, 5, 6.5], [10.5, 12.5, 14]]
+        )
+        np.testing.assert_allclose(pool2(data, "max"), [[6, 8, 9], [11, 13, 14]])
+
+        pyramid = ImagePyramid(np.zeros((1024, 512)), min_size=64)
+        self.assertEqual(pyramid.max_level, 4)
+        self.assertEqual(pyramid.level(10).shape, (64, 32))
+        self.assertEqual(pyramid.level_for(5), 2)
@@ -0,0 +1,108 @@
+import io
+import os
+import tempfile
+import unittest
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.ticker import FuncFormatter
+
+import aplot as ap
+from aplot.core.render_cache import figure_key
+
+
+def make_figure(freq: float = 1, title: str = "trace"):
+    x = np.linspace(0, 1, 1000)
+    return ap.axs(1, 2).plot(x, np.sin(freq * x)).set(title=title).figure
+
+
+class RenderCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache = ap.RenderCache(os.path.join(self.folder.name, "cache"))
+
+    def tearDown(self):
+        ap.set_render_cache(None)
+        ap.close()
+        self.folder.cleanup()
+
+    def test_same_figures_have_same_key(self):
+        self.assertEqual(figure_key(make_figure()), figure_key(make_figure()))
+
+    def test_changes_modify_key(self):
+        key = figure_key(make_figure())
+        self.assertNotEqual(key, figure_key(make_figure(freq=2)))
+        self.assertNotEqual(key, figure_key(make_figure(title="other")))
+        fig = make_figure()
+        fig.axes[0].set_xlim(0, 0.5)
+        self.assertNotEqual(key, figure_key(fig))
+        self.assertNotEqual(figure_key(make_figure(), {"dpi": 50}), figure_key(make_figure(), {"dpi": 100}))
+
+    def test_ticks_modify_key(self):
+        figs = [make_figure() for _ in range(3)]
+        figs[0].axes[0].set_xticks([0, 0.5])
+        figs[1].axes[0].set_xticks([0, 1])
+        figs[2].axes[0].set_xticks([0, 1])
+        figs[2].axes[0].xaxis.set_major_formatter(FuncFormatter(lambda value, _: f"{value:.2f} s"))
+        keys = [figure_key(fig) for fig in figs]
+        self.assertEqual(len(set(keys)), 3)
+
+    def test_render_rcparams_modify_key(self):
+        key = figure_key(make_figure())
+        with mpl.rc_context({"savefig.facecolor": "red"}):
+            self.assertNotEqual(key, figure_key(make_figure()))
+
+    def test_color_mapping_modifies_key(self):
+        data = np.arange(12.0).reshape(3, 4)
+        figs = [ap.axs().imshow(data, colorbar=False).figure for _ in range(3)]
+        figs[1].axes[0].images[0].set_cmap("magma")
+        figs[2].axes[0].images[0].set_clim(0, 1)
+        keys = [figure_key(fig) for fig in figs]
+        self.assertEqual(len(set(keys)), 3)
+        buffers = [io.BytesIO() for _ in figs]
+        for fig, buffer in zip(figs, buffers):
+            fig.savefig(buffer, format="png", cache=self.cache)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(len({buffer.getvalue() for buffer in buffers}), 3)
+
+    def test_hit_copies_the_same_file(self):
+        first, second = (os.path.join(self.folder.name, f"{i}.png") for i in range(2))
+        make_figure().savefig(first, cache=self.cache)
+        make_figure().savefig(second, cache=self.cache)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        self.assertEqual(self.cache.stats()["files"], 1)
+        with open(first, "rb") as file1, open(second, "rb") as file2:
+            self.assertEqual(file1.read(), file2.read())
+
+    def test_global_cache_and_file_like(self):
+        ap.set_render_cache(self.cache)
+        buffers = [io.BytesIO(), io.BytesIO()]
+        make_figure().savefig(buffers[0], format="png")
+        make_figure().savefig(buffers[1], format="png")
+        make_figure().savefig(io.BytesIO(), format="png", cache=False)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(buffers[0].getvalue(), buffers[1].getvalue())
+        self.assertTrue(buffers[0].getvalue().startswith(b"\x89PNG"))
+
+    def test_cache_true_requires_cache(self):
+        with self.assertRaises(ValueError):
+            make_figure().savefig(io.BytesIO(), format="png", cache=True)
+
+    def test_eviction(self):
+        for i in range(3):
+            make_figure(freq=i).savefig(io.BytesIO(), format="png", cache=self.cache)
+        entries = self.cache.files()
+        for i, entry in enumerate(entries):
+            os.utime(entry.path, (i, i))
+        self.cache.max_bytes = self.cache.size() - 1
+        self.cache.evict()
+        self.assertEqual(sorted(e.name for e in self.cache.files()), sorted(e.name for e in entries[1:]))
+        self.assertLessEqual(self.cache.size(), self.cache.max_bytes)
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), {"hits": 0, "misses": 0, "files": 0, "bytes": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
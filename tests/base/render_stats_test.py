@@ -0,0 +1,58 @@
+import json
+import unittest
+
+import numpy as np
+
+import aplot as ap
+from aplot.core.render_stats import RenderStats
+
+
+class RenderStatsTest(unittest.TestCase):
+    def tearDown(self):
+        ap.close()
+
+    def test_render_stats(self):
+        x = np.linspace(0, 10, 20000)
+        axs = ap.axs(1, 2)
+        axs[0].plot(x, np.sin(x), "o", label="markers")
+        axs[1].imshow(np.arange(200.0).reshape(10, 20))
+        fig = axs.fig
+        stats = fig.render_stats(tight_layout=True)
+
+        self.assertIsInstance(stats, RenderStats)
+        self.assertEqual(stats.format, "png")
+        self.assertEqual(stats.dpi, fig.dpi)
+        self_times = [timing.self_time for timing in stats.artists]
+        self.assertEqual(self_times, sorted(self_times, reverse=True))
+
+        line = next(timing for timing in stats.artists if timing.name == "Line2D 'markers'")
+        self.assertEqual(line.axes, "axes 0")
+        self.assertEqual(line.size, 20000)
+        self.assertGreaterEqual(line.calls, 1)
+        image = next(timing for timing in stats.artists if timing.name == "AxesImage")
+        self.assertEqual(image.axes, "axes 1")
+        self.assertEqual(image.size, 200)
+        self.assertTrue(any("colorbar" in name for name in stats.by_axes()))
+        self.assertIn("Line2D", stats.by_type())
+
+        self.assertGreater(stats.layout_time, 0)
+        self.assertGreater(stats.draw_time, 0)
+        self.assertAlmostEqual(
+            stats.total_time, stats.layout_time + stats.draw_time + stats.encode_time, places=6
+        )
+        # The draw methods are restored.
+        self.assertFalse(any("draw" in vars(artist) for artist in fig.findobj(include_self=True)))
+
+    def test_export(self):
+        stats = ap.ax().plot([1, 2, 3]).fig.render_stats(fmt="svg")
+        self.assertEqual(stats.format, "svg")
+        table = stats.table(limit=3)
+        self.assertEqual(len(table.splitlines()), 5)
+        self.assertIn("svg", table.splitlines()[-1])
+        data = json.loads(json.dumps(stats.to_dict()))
+        self.assertEqual(len(data["artists"]), len(stats.artists))
+        self.assertNotIn("artist", data["artists"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
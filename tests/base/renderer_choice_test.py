@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+from matplotlib.collections import QuadMesh
+from matplotlib.image import AxesImage, NonUniformImage, PcolorImage
+
+import aplot as ap
+from aplot.core.utils import choose_renderer, classify_grid
+
+
+def get_data(x, y):
+    xx, yy = np.meshgrid(np.arange(len(x)), np.arange(len(y)))
+    return np.sin(xx / 3) * np.cos(yy / 5)
+
+
+class RendererChoiceTest(unittest.TestCase):
+    def test_classify_grid(self):
+        self.assertEqual(classify_grid(np.linspace(0, 1, 100))[0], "regular")
+        self.assertEqual(classify_grid(np.linspace(1, 0, 100))[0], "regular")
+        self.assertEqual(classify_grid(np.logspace(0, 3, 100))[0], "monotonic")
+        self.assertEqual(classify_grid([0, 2, 1, 3])[0], "irregular")
+        self.assertEqual(classify_grid([0, 1, np.nan])[0], "irregular")
+        self.assertEqual(classify_grid(np.zeros((2, 2)))[0], "irregular")
+
+    def test_classify_drifting_grid(self):
+        # Each step is within 0.5% of the mean step, but the positions drift by about one step.
+        x = np.cumsum(1 + 0.005 * np.linspace(-1, 1, 1000))
+        self.assertLess(np.max(np.abs(np.diff(x) - np.mean(np.diff(x)))) / np.mean(np.diff(x)), 0.01)
+        self.assertEqual(classify_grid(x)[0], "monotonic")
+        self.assertEqual(choose_renderer(x, np.linspace(0, 1, 10)).renderer, "NonUniformImage")
+
+    def test_choose_renderer(self):
+        lin, log = np.linspace(0, 1, 10), np.logspace(0, 1, 10)
+        self.assertEqual(choose_renderer(None, None).renderer, "AxesImage")
+        self.assertEqual(choose_renderer(lin, lin).renderer, "AxesImage")
+        self.assertEqual(choose_renderer(log, lin).renderer, "NonUniformImage")
+        self.assertEqual(choose_renderer(lin, [0, 2, 1]).renderer, "QuadMesh")
+
+    def test_imshow(self):
+        lin, log = np.linspace(0, 1, 30), np.logspace(1, 4, 40)
+        # Not strictly monotonic, since 0.5 is repeated, but non-decreasing as pcolormesh expects.
+        irregular = np.r_[np.linspace(0, 0.5, 20), np.linspace(0.5, 1, 20)]
+        for x, cls in [(lin, AxesImage), (log, NonUniformImage), (irregular, QuadMesh)]:
+            data = get_data(x, lin)
+            ax = ap.axs().imshow(data, x=x, y=lin)
+            self.assertIs(type(ax.res), cls)
+            self.assertTrue(ax.res.renderer_choice.reason)
+            self.assertEqual(ax.res.get_clim(), (data.min(), data.max()))
+
+    def test_imshow_nonuniform_limits(self):
+        x, y = np.logspace(1, 4, 40), np.linspace(5, 0, 30)
+        ax = ap.axs().imshow(get_data(x, y), x=x, y=y)
+        self.assertIsInstance(ax.res, NonUniformImage)
+        self.assertEqual(ax.get_xlim(), (x[0], x[-1]))
+        self.assertEqual(ax.get_ylim(), (0, 5))
+
+    def test_pcolorfast(self):
+        lin, log = np.linspace(0, 1, 31), np.logspace(1, 4, 41)
+        data = get_data(log[1:], lin[1:])
+        self.assertIsInstance(ap.axs().pcolorfast(lin, lin, get_data(lin[1:], lin[1:])).res, AxesImage)
+        ax = ap.axs().pcolorfast(log, lin, data)
+        self.assertIsInstance(ax.res, PcolorImage)
+        self.assertEqual(ax.res.renderer_choice.renderer, "PcolorImage")
+        # Centers of the cells instead of the edges.
+        ax = ap.axs().pcolorfast(log[1:], lin[1:], data)
+        self.assertIsInstance(ax.res, NonUniformImage)
+
+    def test_pyramid_requires_regular_grid(self):
+        x, y = np.logspace(1, 4, 40), np.linspace(0, 1, 30)
+        with self.assertRaises(ValueError):
+            ap.axs().imshow(get_data(x, y), x=x, y=y, pyramid=True)
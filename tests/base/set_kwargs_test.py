@@ -0,0 +1,51 @@
+import unittest
+
+from matplotlib.collections import QuadMesh
+from matplotlib.image import AxesImage
+
+import aplot as ap
+from aplot.core.axes_class import AAxes
+from aplot.core.utils import clear_setter_index, filter_set_kwargs, setter_names
+
+
+class SetKwargsTest(unittest.TestCase):
+    def test_filter(self):
+        kwargs = dict(title="t", xlim=(0, 1), unknown=1, x=None)
+        self.assertEqual(filter_set_kwargs(AAxes, **kwargs), dict(title="t", xlim=(0, 1)))
+        self.assertEqual(filter_set_kwargs(AAxes, ["x"], **kwargs), dict(title="t", xlim=(0, 1), x=None))
+        self.assertIn("interpolation", setter_names(AxesImage))
+        self.assertIn("array", setter_names(QuadMesh))
+        self.assertIs(setter_names(ap.axs()), setter_names(AAxes))
+
+    def test_invalidation(self):
+        class MyAxes(AAxes):
+            name = "MyAxesSetKwargsTest"
+
+            def set_foo(self, value):
+                self.foo = value
+
+        self.assertIn("foo", setter_names(MyAxes))
+        self.assertNotIn("foo", setter_names(AAxes))
+
+        MyAxes.set_bar = lambda self, value: None  # type: ignore
+        self.assertIn("bar", setter_names(MyAxes))
+
+        AAxes.set_baz = lambda self, value: None  # type: ignore
+        try:
+            self.assertIn("baz", setter_names(MyAxes))
+            self.assertIn("baz", setter_names(AAxes))
+        finally:
+            del AAxes.set_baz  # type: ignore
+        self.assertNotIn("baz", setter_names(MyAxes))
+        self.assertNotIn("baz", setter_names(AAxes))
+
+    def test_clear(self):
+        names = setter_names(AAxes)
+        clear_setter_index(AAxes)
+        self.assertIsNot(setter_names(AAxes), names)
+        self.assertEqual(setter_names(AAxes), names)
+
+    def test_axes_list_set(self):
+        axs = ap.axs(2, 2).set(title=[["a", "b"], ["c", "d"]], xlabel="x", unknown=1)
+        self.assertEqual([ax.get_title() for ax in axs.flat()], ["a", "b", "c", "d"])
+        self.assertEqual({ax.get_xlabel() for ax in axs.flat()}, {"x"})
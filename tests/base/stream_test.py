@@ -0,0 +1,53 @@
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aplot as ap
+from aplot.core.stream import RingBuffer
+
+
+class StreamTest(unittest.TestCase):
+    def tearDown(self):
+        plt.close("all")
+
+    def test_ring_buffer(self):
+        buffer = RingBuffer(5)
+        buffer.extend([0, 1, 2])
+        np.testing.assert_array_equal(buffer.view(), [0, 1, 2])
+        buffer.extend([3, 4, 5, 6])
+        np.testing.assert_array_equal(buffer.view(), [2, 3, 4, 5, 6])
+        buffer.extend(np.arange(7, 20))
+        np.testing.assert_array_equal(buffer.view(), [15, 16, 17, 18, 19])
+        self.assertTrue(buffer.full)
+
+    def test_stream_reuses_line(self):
+        ax = ap.axs()
+        stream = ax.stream(100)
+        for i in range(5):
+            stream.append(np.arange(40) + 40 * i, np.sin(np.arange(40)))
+        self.assertEqual(len(ax.get_lines()), 1)
+        xdata = stream.line.get_xdata()
+        self.assertEqual(len(xdata), 100)
+        self.assertEqual((xdata[0], xdata[-1]), (100, 199))
+        self.assertEqual(tuple(ax.dataLim.intervalx), (100, 199))
+
+    def test_clear_restarts_index(self):
+        stream = ap.axs().stream(100)
+        stream.append(np.ones(30))
+        stream.clear().append(np.ones(10))
+        np.testing.assert_array_equal(stream.line.get_xdata(), np.arange(10))
+
+    def test_stream_on_axes_list(self):
+        axs = ap.axs(1, 3)
+        streams = axs.stream(50)
+        streams.append(np.arange(3 * 10).reshape(3, 10))
+        streams.append(np.ones(10))
+        for i, ax in enumerate(axs):
+            ydata = ax.get_lines()[0].get_ydata()
+            np.testing.assert_array_equal(ydata[:10], np.arange(10) + 10 * i)
+            np.testing.assert_array_equal(ydata[10:], np.ones(10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+import scipy.signal
+
+from aplot.analysis import find_h_symmetry_axes, find_h_symmetry_axis
+
+
+def fftconvolve_symmetry_axis(data):
+    """Previous implementation with the full 2d correlation."""
+    data = (data - np.mean(data)) / np.std(data)
+    corr = scipy.signal.fftconvolve(data, data[::-1], mode="full")
+    return int((np.argmax(corr) % corr.shape[-1]) / 2)
+
+
+def get_maps(centers, ny: int = 60, nx: int = 90, noise: float = 0.3):
+    rng = np.random.default_rng(0)
+    x = np.arange(nx)
+    return np.array(
+        [
+            np.exp(-(((x - center) / 8) ** 2))[None] * rng.normal(1, 0.2, size=(ny, 1))
+            + noise * rng.normal(size=(ny, nx))
+            for center in centers
+        ]
+    )
+
+
+class SymmetryAxisTest(unittest.TestCase):
+    def test_same_as_fftconvolve(self):
+        maps = get_maps(np.linspace(20, 70, 15))
+        for data in maps:
+            self.assertEqual(find_h_symmetry_axis(data), fftconvolve_symmetry_axis(data))
+
+    def test_subpixel(self):
+        centers = np.array([30.25, 44.5, 51.8])
+        positions = find_h_symmetry_axes(get_maps(centers, noise=0))
+        self.assertEqual(positions.shape, (3,))
+        np.testing.assert_allclose(positions, centers, atol=0.1)
+        self.assertAlmostEqual(float(find_h_symmetry_axes(get_maps([40.4], noise=0)[0])), 40.4, delta=0.1)
+        with self.assertRaises(ValueError):
+            find_h_symmetry_axes(np.zeros(10))
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import aplot as ap
+from aplot.testing import (
+    assert_figures_equal,
+    assert_figures_not_equal,
+    compare_figures,
+    compare_images,
+    render_rgba,
+    structural_similarity,
+)
+
+
+class TestingTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.x = np.linspace(0, 10, 200)
+
+    def tearDown(self):
+        ap.close()
+        self.folder.cleanup()
+
+    def test_render_rgba(self):
+        fig = ap.axs(figsize=(4, 3), dpi=50).plot(self.x, np.sin(self.x)).figure
+        image = render_rgba(fig)
+        self.assertEqual(image.shape, (150, 200, 4))
+        self.assertEqual(image.dtype, np.uint8)
+        self.assertEqual(render_rgba(fig, dpi=100).shape, (300, 400, 4))
+        self.assertEqual(fig.dpi, 50)
+
+    def test_compare_images_metrics(self):
+        image = np.full((20, 30, 4), 200, dtype=np.uint8)
+        self.assertTrue(compare_images(image, image.copy()))
+        self.assertEqual(compare_images(image, image.copy()).ssim, 1)
+
+        other = image.copy()
+        other[:10, :, 0] = 0
+        result = compare_images(image, other)
+        self.assertFalse(result)
+        self.assertAlmostEqual(result.channel_diff[0], 50 / 255 * 200)
+        self.assertEqual(result.channel_diff[1:], (0, 0, 0))
+        self.assertAlmostEqual(result.mean_diff, 50 / 255 * 50)
+        self.assertEqual(result.max_diff, 200)
+        self.assertEqual(result.diff_fraction, 0.5)
+        self.assertIn("mean difference", result.reason)
+
+        self.assertTrue(compare_images(image, other, tolerance=100))
+        self.assertFalse(compare_images(image, other, tolerance=100, channel_tolerance=10))
+        self.assertFalse(compare_images(image, other, tolerance=100, max_diff=100))
+        self.assertFalse(compare_images(image, image[:10]))
+
+    def test_structural_similarity(self):
+        rng = np.random.default_rng(0)
+        image = rng.integers(0, 255, (50, 50), dtype=np.uint8)
+        self.assertAlmostEqual(structural_similarity(image, image), 1)
+        noise = rng.normal(0, 1, image.shape)
+        slightly_noisy = np.clip(image + 10 * noise, 0, 255).astype(np.uint8)
+        noisy = np.clip(image + 60 * noise, 0, 255).astype(np.uint8)
+        self.assertLess(structural_similarity(image, noisy), structural_similarity(image, slightly_noisy))
+        self.assertLess(structural_similarity(image, slightly_noisy), 1)
+        self.assertLess(structural_similarity(image, 255 - image), 0)
+
+    def test_compare_figures(self):
+        fig1 = ap.axs().plot(self.x, np.sin(self.x)).figure
+        fig2 = ap.axs().plot(self.x, np.sin(self.x)).figure
+        fig3 = ap.axs().plot(self.x, np.cos(self.x)).figure
+        assert_figures_equal(fig1, fig2, diff_dir=self.folder.name)
+        assert_figures_not_equal(fig1, fig3, diff_dir=self.folder.name)
+        self.assertEqual(os.listdir(self.folder.name), [])
+
+        with self.assertRaises(AssertionError):
+            assert_figures_equal(fig1, fig3, diff_dir=self.folder.name, name="sin_cos")
+        self.assertEqual(
+            sorted(os.listdir(self.folder.name)), ["sin_cos_diff.png", "sin_cos_fig1.png", "sin_cos_fig2.png"]
+        )
+        self.assertGreater(compare_figures(fig1, fig3).diff_fraction, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from aplot.analysis import TwoToneAssembler, get_formatted_data_from_two_tone
+
+
+def get_sweep():
+    rng = np.random.default_rng(0)
+    voltages = np.linspace(-1, 1, 7)
+    lo_freqs = np.array([5.0, 5.2, 5.1])
+    if_freqs = np.linspace(0, 0.15, 5)
+    z = rng.normal(size=(7, 15)) + 1j * rng.normal(size=(7, 15))
+    return voltages, (lo_freqs, if_freqs), z
+
+
+class TwoToneAssemblerTest(unittest.TestCase):
+    def test_same_as_full_data(self):
+        voltages, freqs, z = get_sweep()
+        _, expected_freqs, expected = get_formatted_data_from_two_tone(voltages, freqs, z.copy())
+
+        assembler = TwoToneAssembler(voltages, freqs)
+        assembler.append(z[:2]).append(z[2]).append(z[3:].ravel())
+        self.assertTrue(assembler.complete)
+        np.testing.assert_array_equal(assembler.freqs, expected_freqs)
+        np.testing.assert_array_equal(assembler.z, expected)
+
+        assembler = TwoToneAssembler(voltages, freqs, out=np.zeros((7, 15), dtype=complex))
+        for i in [3, 0, 6]:
+            assembler.add(i, z[i].astype(np.complex64))
+        partial_voltages, _, partial = assembler.get_data()
+        np.testing.assert_array_equal(partial_voltages, voltages[[0, 3, 6]])
+        np.testing.assert_allclose(partial, expected[[0, 3, 6]], rtol=1e-6)
+        with self.assertRaises(IndexError):
+            assembler.add(6, z[:2])
+
+    def test_memmap(self):
+        voltages, freqs, z = get_sweep()
+        _, _, expected = get_formatted_data_from_two_tone(voltages, freqs, z.copy())
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "two_tone.npy")
+            assembler = TwoToneAssembler(voltages, freqs, filename=filename)
+            for row in z:
+                assembler.append(row)
+            assembler.flush()
+            del assembler
+            np.testing.assert_array_equal(np.load(filename), expected)
+
+    def test_plot_partial(self):
+        voltages, freqs, z = get_sweep()
+        assembler = TwoToneAssembler(voltages, freqs).append(z[:4])
+        axs = assembler.plot()
+        self.assertEqual(axs[0].res.get_array().shape, (4, 15))
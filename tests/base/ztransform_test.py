@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+import aplot as ap
+from aplot.core.ztransform import z_transform
+
+
+def get_z(ny: int = 37, nx: int = 53):
+    rng = np.random.default_rng(0)
+    noise = rng.normal(size=(ny, nx)) + 1j * rng.normal(size=(ny, nx))
+    return (1 + 0.1 * noise) * np.exp(1j * np.linspace(0, 30, nx))
+
+
+class ZTransformTest(unittest.TestCase):
+    def test_same_as_numpy(self):
+        z = get_z()
+        amplitude, phase = z_transform(z, "bode_db", unwrap=True, block_size=100)
+        np.testing.assert_allclose(amplitude, 20 * np.log10(np.abs(z)))
+        np.testing.assert_allclose(phase, np.unwrap(np.angle(z) * 180 / np.pi, period=360))
+
+        amplitude, phase = z_transform(z[0], "bode")
+        np.testing.assert_allclose(amplitude, np.abs(z[0]))
+        np.testing.assert_allclose(phase, np.angle(z[0], deg=True))
+
+        real, imag = z_transform(z, "real_imag")
+        np.testing.assert_array_equal(real, z.real)
+        np.testing.assert_array_equal(imag, z.imag)
+
+        (phase,) = z_transform(z, "phase", unwrap=True)
+        np.testing.assert_allclose(phase, np.unwrap(np.angle(z, deg=True), period=360))
+
+    def test_dtype_and_out(self):
+        z = get_z()
+        amplitude, phase = z_transform(z, "bode", dtype=np.float32)
+        self.assertEqual(amplitude.dtype, np.float32)
+        np.testing.assert_allclose(phase, np.angle(z, deg=True), atol=1e-4)
+        self.assertEqual(z_transform(z.astype(np.complex64), "dB")[0].dtype, np.float32)
+
+        out = (np.empty(z.shape), np.empty(z.shape))
+        result = z_transform(z, "bode", out=out)
+        self.assertIs(result[0], out[0])
+        with self.assertRaises(ValueError):
+            z_transform(z, "bode", out=(np.empty(z.shape),))
+        with self.assertRaises(ValueError):
+            z_transform(z, "unknown")
+
+    def test_plot_z(self):
+        z = get_z()
+        axs = ap.axs(1, 2).plot_z_2d(np.arange(z.shape[1]), np.arange(z.shape[0]), z, dtype=np.float32)
+        self.assertEqual(axs[0].res.get_array().dtype, np.float32)
+        axs = ap.axs(1, 2).plot_z_1d(np.arange(z.shape[1]), z[0], unwrap=True)
+        np.testing.assert_allclose(
+            axs[1].get_lines()[0].get_ydata(), np.unwrap(np.angle(z[0], deg=True), period=360)
+        )
@@ -5,6 +5,8 @@ import unittest
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
+from aplot.testing import compare_figures
+
 from .compare_images import images_are_similar
 
 TEST_DIR = os.path.dirname(__file__)
@@ -42,12 +44,18 @@ class ImageTest(unittest.TestCase):
         fig2: "Figure",
         assert_to_equal: bool,
     ):
-        path1 = os.path.join(self.data_dir, f"{self.file_prefix}_{self._testMethodName}_fig1.png")
-        path2 = os.path.join(self.data_dir, f"{self.file_prefix}_{self._testMethodName}_fig2.png")
-        fig1.savefig(path1)
-        fig2.savefig(path2)
-
-        return self.assertImageEqual(path1, path2, assert_to_equal)
+        # Figures are compared in memory, the images are written only if the assertion fails.
+        result = compare_figures(
+            fig1,
+            fig2,
+            diff_dir=self.data_dir if assert_to_equal else None,
+            name=f"{self.file_prefix}_{self._testMethodName}",
+        )
+        if assert_to_equal:
+            self.assertTrue(result.equal, f"{result.reason}. Images saved in {self.data_dir}")
+        else:
+            self.assertFalse(result.equal)
+        return result
 
     def assertImageEqual(self, path1: str, path2: str, assert_to: bool):
         if assert_to:
@@ -70,12 +78,10 @@ class ImageTest(unittest.TestCase):
         self.tearDown()
 
     def tearDown(self):
-        path1 = os.path.join(self.data_dir, f"{self.file_prefix}_{self._testMethodName}_fig1.png")
-        path2 = os.path.join(self.data_dir, f"{self.file_prefix}_{self._testMethodName}_fig2.png")
-        if os.path.exists(path1):
-            os.remove(path1)
-        if os.path.exists(path2):
-            os.remove(path2)
+        for suffix in ("fig1", "fig2", "diff"):
+            path = os.path.join(self.data_dir, f"{self.file_prefix}_{self._testMethodName}_{suffix}.png")
+            if os.path.exists(path):
+                os.remove(path)
 
     @classmethod
     def tearDownClass(cls):